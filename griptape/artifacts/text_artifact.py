@@ -26,6 +26,17 @@ class TextArtifact(BaseArtifact):
 
         return self.embedding
 
+    @staticmethod
+    def generate_embeddings(artifacts: list[TextArtifact], driver: BaseEmbeddingDriver) -> list[list[float]]:
+        """Embed many artifacts with one embed_strings call and store every embedding on its artifact."""
+        embeddings = driver.embed_strings([str(artifact.value) for artifact in artifacts])
+
+        for artifact, embedding in zip(artifacts, embeddings):
+            artifact.__embedding.clear()
+            artifact.__embedding.extend(embedding)
+
+        return [artifact.embedding for artifact in artifacts]
+
     def token_count(self, tokenizer: BaseTokenizer) -> int:
         return tokenizer.token_count(str(self.value))
 
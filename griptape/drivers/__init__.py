@@ -20,12 +20,15 @@ from .memory.tool.blob.local_blob_tool_memory_driver import LocalBlobToolMemoryD
 from .embedding.base_embedding_driver import BaseEmbeddingDriver
 from .embedding.openai_embedding_driver import OpenAiEmbeddingDriver
 from .embedding.azure_openai_embedding_driver import AzureOpenAiEmbeddingDriver
+from .embedding.caching_embedding_driver import CachingEmbeddingDriver
 
 from .vector.base_vector_store_driver import BaseVectorStoreDriver
 from .vector.local_vector_store_driver import LocalVectorStoreDriver
 from .vector.pinecone_vector_store_driver import PineconeVectorStoreDriver
 from .vector.marqo_vector_store_driver import MarqoVectorStoreDriver
 from .vector.mongodb_vector_store_driver import MongoDbAtlasVectorStoreDriver
+from .vector.sharded_vector_store_driver import ShardedVectorStoreDriver
+from .vector.caching_vector_store_driver import CachingVectorStoreDriver
 
 from .sql.base_sql_driver import BaseSqlDriver
 from .sql.amazon_redshift_sql_driver import AmazonRedshiftSqlDriver
@@ -53,12 +56,15 @@ __all__ = [
     "BaseEmbeddingDriver",
     "OpenAiEmbeddingDriver",
     "AzureOpenAiEmbeddingDriver",
+    "CachingEmbeddingDriver",
 
     "BaseVectorStoreDriver",
     "LocalVectorStoreDriver",
     "PineconeVectorStoreDriver",
     "MarqoVectorStoreDriver",
     "MongoDbAtlasVectorStoreDriver",
+    "ShardedVectorStoreDriver",
+    "CachingVectorStoreDriver",
 
     "BaseSqlDriver",
     "AmazonRedshiftSqlDriver",
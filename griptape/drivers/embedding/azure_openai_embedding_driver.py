@@ -16,8 +16,16 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
         default=Factory(lambda self: TiktokenTokenizer(model=self.model), takes_self=True),
         kw_only=True
     )
+    # Azure deployments accept far fewer inputs per request than OpenAI (16 with the default api_version) and can
+    # reject requests whose inputs add up to more than the model's context, so batches stay within both. Raise these
+    # for deployments and api versions that allow more.
+    batch_max_items: int = field(default=16, kw_only=True)
+    batch_max_tokens: int = field(
+        default=Factory(lambda self: self.tokenizer.max_tokens, takes_self=True),
+        kw_only=True
+    )
 
-    def _params(self, chunk: Union[list[int], str]) -> dict:
+    def _params(self, chunk: Union[list[int], str, list[str]]) -> dict:
         return super()._params(chunk) | {
             "deployment_id": self.deployment_id
         }
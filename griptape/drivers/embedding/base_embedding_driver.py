@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from attr import define, field
+from concurrent import futures
+from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.core import ExponentialBackoffMixin
 
@@ -7,6 +8,10 @@ from griptape.core import ExponentialBackoffMixin
 @define
 class BaseEmbeddingDriver(ExponentialBackoffMixin, ABC):
     dimensions: int = field(kw_only=True)
+    futures_executor: futures.Executor = field(
+        default=Factory(lambda: futures.ThreadPoolExecutor()),
+        kw_only=True
+    )
 
     def embed_text_artifact(self, artifact: TextArtifact) -> list[float]:
         return self.embed_string(artifact.to_text())
@@ -16,7 +21,11 @@ class BaseEmbeddingDriver(ExponentialBackoffMixin, ABC):
             with attempt:
                 return self.try_embed_string(string)
 
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embed many strings, returning their embeddings in input order."""
+        # Drivers whose API accepts many inputs per request should override this to batch them.
+        return list(self.futures_executor.map(self.embed_string, strings))
+
     @abstractmethod
     def try_embed_string(self, string: str) -> list[float]:
         ...
-    
\ No newline at end of file
@@ -0,0 +1,208 @@
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from attr import define, field, Factory
+from griptape import utils
+from griptape.drivers import BaseEmbeddingDriver
+
+
+@define
+class CachingEmbeddingDriver(BaseEmbeddingDriver):
+    """Caches the embeddings of another embedding driver.
+
+    Embeddings are keyed by model and a hash of the normalized string (Unicode NFC, surrounding whitespace stripped),
+    so strings that only differ in that share an embedding. Recently used embeddings are kept in memory, least recently
+    used first out once they take up more than max_memory_bytes. With persist_path set, every embedding is also written
+    to a SQLite database there, which survives restarts and can be shared by several processes. Embeddings are stored
+    as float32.
+
+    model defaults to the wrapped driver's model and has to be set explicitly when two drivers without one share a
+    database.
+    """
+
+    @dataclass
+    class CacheStats:
+        memory_hits: int = 0
+        disk_hits: int = 0
+        misses: int = 0
+
+        @property
+        def hit_rate(self) -> float:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+
+            return (self.memory_hits + self.disk_hits) / lookups if lookups > 0 else 0.0
+
+    SQLITE_BATCH_SIZE = 500
+
+    driver: BaseEmbeddingDriver = field(kw_only=True)
+    dimensions: int = field(default=Factory(lambda self: self.driver.dimensions, takes_self=True), kw_only=True)
+    model: str = field(
+        default=Factory(lambda self: getattr(self.driver, "model", type(self.driver).__name__), takes_self=True),
+        kw_only=True
+    )
+    max_memory_bytes: int = field(default=64 * 1024 * 1024, kw_only=True)
+    persist_path: Optional[str] = field(default=None, kw_only=True)
+    stats: CacheStats = field(factory=lambda: CachingEmbeddingDriver.CacheStats(), init=False)
+
+    _memory: OrderedDict[str, np.ndarray] = field(factory=OrderedDict, init=False)
+    _memory_bytes: int = field(default=0, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _connection_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.max_memory_bytes < 0:
+            raise ValueError("max_memory_bytes can't be negative")
+
+        if self.persist_path:
+            self._connection = self._connect(self.persist_path)
+
+    def embed_string(self, string: str) -> list[float]:
+        return self.embed_strings([string])[0]
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        keys = [self.cache_key(string) for string in strings]
+        embeddings = self._load(keys)
+        # Strings missing from the cache are embedded once each, however often they repeat.
+        missing = {}
+
+        for key, string, embedding in zip(keys, strings, embeddings):
+            if embedding is None:
+                missing.setdefault(key, string)
+
+        if missing:
+            # Misses come back as float32 too, so a string gets the same embedding whether it was cached or not.
+            computed = {
+                key: np.asarray(embedding, dtype=np.float32)
+                for key, embedding in zip(missing, self.driver.embed_strings(list(missing.values())))
+            }
+
+            self._store(computed)
+
+            embeddings = [
+                computed[key].tolist() if embedding is None else embedding for key, embedding in zip(keys, embeddings)
+            ]
+
+        return embeddings
+
+    def try_embed_string(self, string: str) -> list[float]:
+        return self.driver.try_embed_string(string)
+
+    def cache_key(self, string: str) -> str:
+        normalized = unicodedata.normalize("NFC", string).strip()
+
+        return utils.bytes_to_hash(normalized.encode())
+
+    def clear(self) -> None:
+        """Drop every cached embedding of this model from memory and from disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+        if self._connection:
+            with self._connection_lock:
+                self._connection.execute("DELETE FROM embeddings WHERE model = ?", (self.model,))
+                self._connection.commit()
+
+    def close(self) -> None:
+        with self._connection_lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    def _load(self, keys: list[str]) -> list[Optional[list[float]]]:
+        embeddings = []
+        disk_keys = set()
+
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+
+                if vector is None:
+                    disk_keys.add(key)
+                else:
+                    self._memory.move_to_end(key)
+
+                embeddings.append(None if vector is None else vector.tolist())
+
+        disk_vectors = self._load_from_disk(list(disk_keys)) if disk_keys and self._connection else {}
+
+        with self._lock:
+            for key, vector in disk_vectors.items():
+                self._remember(key, vector)
+
+            for i, key in enumerate(keys):
+                if embeddings[i] is not None:
+                    self.stats.memory_hits += 1
+                elif key in disk_vectors:
+                    embeddings[i] = disk_vectors[key].tolist()
+                    self.stats.disk_hits += 1
+                else:
+                    self.stats.misses += 1
+
+        return embeddings
+
+    def _store(self, vectors: dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+
+        if self._connection:
+            with self._connection_lock:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                    [(self.model, key, vector.tobytes()) for key, vector in vectors.items()]
+                )
+                self._connection.commit()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        # Callers hold _lock.
+        if vector.nbytes > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def _load_from_disk(self, keys: list[str]) -> dict[str, np.ndarray]:
+        vectors = {}
+
+        with self._connection_lock:
+            for i in range(0, len(keys), self.SQLITE_BATCH_SIZE):
+                batch = keys[i:i + self.SQLITE_BATCH_SIZE]
+                rows = self._connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN "
+                    f"({', '.join('?' * len(batch))})",
+                    [self.model] + batch
+                )
+
+                for key, blob in rows:
+                    vectors[key] = np.frombuffer(blob, dtype=np.float32).copy()
+
+        return vectors
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, check_same_thread=False)
+
+        # WAL lets other processes read while one of them writes.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, PRIMARY KEY (model, text_hash))"
+        )
+        connection.commit()
+
+        return connection
@@ -14,6 +14,9 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
     dimensions: int = field(default=DEFAULT_DIMENSIONS, kw_only=True)
+    # Per-request limits of the embeddings endpoint that embed_strings packs batches into.
+    batch_max_items: int = field(default=2048, kw_only=True)
+    batch_max_tokens: int = field(default=300000, kw_only=True)
     api_type: str = field(default=openai.api_type, kw_only=True)
     api_version: Optional[str] = field(default=openai.api_version, kw_only=True)
     api_base: str = field(default=openai.api_base, kw_only=True)
@@ -32,16 +35,61 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         openai.organization = self.organization
 
     def try_embed_string(self, string: str) -> list[float]:
-        # Address a performance issue in older ada models
-        # https://github.com/openai/openai-python/issues/418#issuecomment-1525939500
-        if self.model.endswith("001"):
-            string = string.replace("\n", " ")
+        string = self._clean_string(string)
 
         if self.tokenizer.token_count(string) > self.tokenizer.max_tokens:
             return self.embed_long_string(string)
         else:
             return self.embed_chunk(string)
 
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embed many strings with as few requests as the endpoint's limits allow, returning embeddings in input order.
+
+        Strings are packed greedily, in order, into batches of at most batch_max_items inputs and batch_max_tokens
+        tokens, which are requested concurrently and retried independently. Strings longer than the model's context
+        are embedded on their own, like embed_string does.
+        """
+        embeddings = [None] * len(strings)
+        batches = []
+        long_positions = []
+        batch = []
+        batch_tokens = 0
+
+        for position, string in enumerate(strings):
+            string = self._clean_string(string)
+            tokens = self.tokenizer.token_count(string)
+
+            if tokens > self.tokenizer.max_tokens:
+                long_positions.append(position)
+
+                continue
+
+            if batch and (len(batch) == self.batch_max_items or batch_tokens + tokens > self.batch_max_tokens):
+                batches.append(batch)
+
+                batch = []
+                batch_tokens = 0
+
+            batch.append((position, string))
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        batch_futures = [
+            self.futures_executor.submit(self._embed_batch, [string for _, string in batch]) for batch in batches
+        ]
+        long_futures = [self.futures_executor.submit(self.embed_string, strings[p]) for p in long_positions]
+
+        for batch, future in zip(batches, batch_futures):
+            for (position, _), embedding in zip(batch, future.result()):
+                embeddings[position] = embedding
+
+        for position, future in zip(long_positions, long_futures):
+            embeddings[position] = future.result()
+
+        return embeddings
+
     def embed_chunk(self, chunk: Union[list[int], str]) -> list[float]:
         return openai.Embedding.create(**self._params(chunk))["data"][0]["embedding"]
 
@@ -63,7 +111,25 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
 
         return embedding_chunks.tolist()
 
-    def _params(self, chunk: Union[list[int], str]) -> dict:
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        data = openai.Embedding.create(**self._params(chunks))["data"]
+
+        return [item["embedding"] for item in sorted(data, key=lambda item: item["index"])]
+
+    def _embed_batch(self, chunks: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                return self.try_embed_chunks(chunks)
+
+    def _clean_string(self, string: str) -> str:
+        # Address a performance issue in older ada models
+        # https://github.com/openai/openai-python/issues/418#issuecomment-1525939500
+        if self.model.endswith("001"):
+            return string.replace("\n", " ")
+        else:
+            return string
+
+    def _params(self, chunk: Union[list[int], str, list[str]]) -> dict:
         return {
             "input": chunk,
             "model": self.model,
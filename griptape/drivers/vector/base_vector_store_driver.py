@@ -1,16 +1,32 @@
+import asyncio
+import functools
+import itertools
+import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from concurrent import futures
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union, Callable, Iterable, Iterator
+import numpy as np
 from attr import define, field, Factory
 from griptape import utils
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import TextArtifact, BaseArtifact
 from griptape.drivers import BaseEmbeddingDriver, OpenAiEmbeddingDriver
+from griptape.reducers import BaseVectorReducer
 
 
 @define
 class BaseVectorStoreDriver(ABC):
     DEFAULT_QUERY_COUNT = 5
+    # Entries scored together by exact queries.
+    EXACT_QUERY_BLOCK_SIZE = 1024
+    # Entries per vector file and JSONL file written by export_entries.
+    EXPORT_CHUNK_SIZE = 10000
+    EXPORT_FORMAT = "griptape-vector-entries"
+    EXPORT_VERSION = 1
 
     @dataclass
     class QueryResult:
@@ -18,6 +34,7 @@ class BaseVectorStoreDriver(ABC):
         score: float
         meta: Optional[dict] = None
         namespace: Optional[str] = None
+        artifact: Optional[BaseArtifact] = None
 
     @dataclass
     class Entry:
@@ -25,6 +42,25 @@ class BaseVectorStoreDriver(ABC):
         vector: list[float]
         meta: Optional[dict] = None
         namespace: Optional[str] = None
+        artifact: Optional[BaseArtifact] = None
+
+    @dataclass
+    class UpsertResult:
+        id: Optional[str]
+        error: Optional[Exception] = None
+
+    @dataclass
+    class IngestProgress:
+        succeeded: int = 0
+        failed: int = 0
+        # Artifacts that were already stored, counted in succeeded too.
+        skipped: int = 0
+        elapsed: float = 0.0
+
+        @property
+        def throughput(self) -> float:
+            """Artifacts processed per second."""
+            return (self.succeeded + self.failed) / self.elapsed if self.elapsed > 0 else 0.0
 
     embedding_driver: BaseEmbeddingDriver = field(
         default=Factory(lambda: OpenAiEmbeddingDriver()),
@@ -34,43 +70,198 @@ class BaseVectorStoreDriver(ABC):
         default=Factory(lambda: futures.ThreadPoolExecutor()),
         kw_only=True
     )
+    upsert_batch_size: int = field(default=100, kw_only=True)
+    max_in_flight_batches: int = field(default=4, kw_only=True)
+    # Store text artifacts under a hash of their text instead of their own IDs, so identical content maps to one
+    # entry per namespace and upserts with skip_existing don't embed it again.
+    content_addressed_ids: bool = field(default=False, kw_only=True)
+    # Optional projection applied to every vector written and every query, so the store only holds reduced vectors.
+    # Vectors that already have the reduced dimensions, such as ones loaded from the store, are passed through. Drivers
+    # that embed server-side ignore it.
+    reducer: Optional[BaseVectorReducer] = field(default=None, kw_only=True)
+    # Where the trained reducer is saved and loaded from.
+    reducer_path: Optional[str] = field(default=None, kw_only=True)
+
+    _reducer_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @property
+    def embeds_server_side(self) -> bool:
+        """Whether query strings are embedded by the store itself instead of with embedding_driver."""
+        return False
 
     def upsert_text_artifacts(
             self,
             artifacts: dict[str, list[TextArtifact]],
             meta: Optional[dict] = None,
+            batch_size: Optional[int] = None,
+            skip_existing: bool = False,
+            raise_on_error: bool = True,
+            **kwargs
+    ) -> list[UpsertResult]:
+        """Upsert the artifacts of every namespace, returning one result per artifact.
+
+        Every artifact is attempted; afterwards the first error is raised unless raise_on_error is False, in which case
+        failures are only reported in the results.
+        """
+        results = []
+
+        for namespace, artifact_list in artifacts.items():
+            results.extend(self.ingest_text_artifacts(
+                artifact_list,
+                namespace=namespace,
+                meta=meta,
+                batch_size=batch_size,
+                skip_existing=skip_existing,
+                **kwargs
+            ))
+
+        if raise_on_error:
+            for result in results:
+                if result.error:
+                    raise result.error
+
+        return results
+
+    def ingest_text_artifacts(
+            self,
+            artifacts: Iterable[TextArtifact],
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            batch_size: Optional[int] = None,
+            max_in_flight_batches: Optional[int] = None,
+            on_progress: Optional[Callable[[IngestProgress], None]] = None,
+            skip_existing: bool = False,
             **kwargs
-    ) -> None:
-        utils.execute_futures_dict({
-            namespace:
-                self.futures_executor.submit(self.upsert_text_artifact, a, namespace, meta, **kwargs)
-            for namespace, artifact_list in artifacts.items() for a in artifact_list
-        })
+    ) -> Iterator[UpsertResult]:
+        """Embed and upsert a stream of artifacts, yielding one result per artifact in input order.
+
+        At most max_in_flight_batches batches are being embedded or upserted at any time, and the input is only read
+        as earlier batches complete, so arbitrarily long iterators are ingested in bounded memory. on_progress is
+        called after every batch. Closing the generator cancels the work that hasn't started yet.
+
+        With skip_existing, every batch is first checked with has_ids and artifacts whose IDs are already stored in
+        the namespace are neither embedded nor written. Together with content_addressed_ids this skips unchanged text.
+        """
+        batch_size = batch_size if batch_size else self.upsert_batch_size
+        max_in_flight_batches = max(1, max_in_flight_batches if max_in_flight_batches else self.max_in_flight_batches)
+        artifacts = iter(artifacts)
+        progress = BaseVectorStoreDriver.IngestProgress()
+        started_at = time.perf_counter()
+        # Every in-flight batch is [artifacts, whether each is already stored, the embedding future of the rest (if
+        # any), upsert future or None until embeddings are done]. Each batch is embedded with one embed_strings call.
+        in_flight = deque()
+
+        try:
+            while True:
+                while len(in_flight) < max_in_flight_batches:
+                    batch = list(itertools.islice(artifacts, batch_size))
+
+                    if len(batch) == 0:
+                        break
+
+                    try:
+                        if skip_existing:
+                            existing = self.has_ids([self._artifact_id(artifact) for artifact in batch], namespace)
+                        else:
+                            existing = [False] * len(batch)
+                    except Exception as e:
+                        # The whole batch fails with the lookup error, the same way a failed upsert request does.
+                        failed_lookup = futures.Future()
+                        failed_lookup.set_exception(e)
+                        in_flight.append([batch, [False] * len(batch), [], failed_lookup])
+
+                        continue
+
+                    pending = [artifact for artifact, exists in zip(batch, existing) if not exists]
+
+                    in_flight.append([
+                        batch,
+                        existing,
+                        [self.futures_executor.submit(self._embed_text_artifacts, pending)] if pending else [],
+                        None
+                    ])
+
+                if len(in_flight) == 0:
+                    break
+
+                futures.wait(in_flight[0][2])
+
+                # Upserts are submitted from this thread, never from a worker, so a busy executor can't deadlock.
+                for stage in in_flight:
+                    if stage[3] is None and all(future.done() for future in stage[2]):
+                        if len(stage[2]) == 0:
+                            stage[3] = futures.Future()
+                            stage[3].set_result([])
+                        else:
+                            stage[3] = self.futures_executor.submit(
+                                self._upsert_text_artifact_batch,
+                                [artifact for artifact, exists in zip(stage[0], stage[1]) if not exists],
+                                stage[2][0].result(),
+                                namespace,
+                                meta,
+                                **kwargs
+                            )
+
+                batch, existing, _, upsert_future = in_flight.popleft()
+
+                try:
+                    upserted = iter(upsert_future.result())
+                except Exception as e:
+                    upserted = iter([
+                        BaseVectorStoreDriver.UpsertResult(id=self._artifact_id(artifact), error=e)
+                        for artifact, exists in zip(batch, existing) if not exists
+                    ])
+
+                results = [
+                    BaseVectorStoreDriver.UpsertResult(id=self._artifact_id(artifact)) if exists else next(upserted)
+                    for artifact, exists in zip(batch, existing)
+                ]
+
+                failed = sum(1 for result in results if result.error)
+                progress.succeeded += len(results) - failed
+                progress.failed += failed
+                progress.skipped += sum(existing)
+                progress.elapsed = time.perf_counter() - started_at
+
+                if on_progress:
+                    on_progress(progress)
+
+                yield from results
+        finally:
+            for _, _, embedding_futures, upsert_future in in_flight:
+                for future in embedding_futures + ([upsert_future] if upsert_future else []):
+                    future.cancel()
 
     def upsert_text_artifact(
             self,
             artifact: TextArtifact,
             namespace: Optional[str] = None,
             meta: Optional[dict] = None,
+            skip_existing: bool = False,
             **kwargs
     ) -> str:
-        if not meta:
-            meta = {}
-
-        meta["artifact"] = artifact.to_json()
+        if skip_existing and self.has_id(self._artifact_id(artifact), namespace):
+            return self._artifact_id(artifact)
 
         if artifact.embedding:
             vector = artifact.embedding
         else:
             vector = artifact.generate_embedding(self.embedding_driver)
 
-        return self.upsert_vector(
-            vector,
-            vector_id=artifact.id,
-            namespace=namespace,
-            meta=meta,
-            **kwargs
-        )
+        result = self._upsert_vector_batch([
+            BaseVectorStoreDriver.Entry(
+                id=self._artifact_id(artifact),
+                vector=self._reduce_vectors([vector], train=True)[0],
+                meta=self._text_artifact_meta(artifact, meta),
+                namespace=namespace,
+                artifact=artifact
+            )
+        ], **kwargs)[0]
+
+        if result.error:
+            raise result.error
+
+        return result.id
 
     def upsert_text(
             self,
@@ -88,6 +279,25 @@ class BaseVectorStoreDriver(ABC):
             **kwargs
         )
 
+    def upsert_vectors(
+            self,
+            entries: list[Entry],
+            batch_size: Optional[int] = None,
+            **kwargs
+    ) -> list[UpsertResult]:
+        batch_size = batch_size if batch_size else self.upsert_batch_size
+        results = []
+
+        for i in range(0, len(entries), batch_size):
+            batch = entries[i:i + batch_size]
+
+            try:
+                results.extend(self._upsert_vector_batch(self._reduce_entries(batch), **kwargs))
+            except Exception as e:
+                results.extend([BaseVectorStoreDriver.UpsertResult(id=entry.id, error=e) for entry in batch])
+
+        return results
+
     @abstractmethod
     def upsert_vector(
             self,
@@ -99,12 +309,173 @@ class BaseVectorStoreDriver(ABC):
     ) -> str:
         ...
 
+    def _upsert_vector_batch(self, entries: list[Entry], **kwargs) -> list[UpsertResult]:
+        # Drivers with a native batch write should override this and raise if the whole batch fails.
+        results = []
+
+        for entry in entries:
+            try:
+                vector_id = self.upsert_vector(
+                    entry.vector,
+                    vector_id=entry.id,
+                    namespace=entry.namespace,
+                    meta=entry.meta,
+                    **kwargs
+                )
+
+                results.append(BaseVectorStoreDriver.UpsertResult(id=vector_id))
+            except Exception as e:
+                results.append(BaseVectorStoreDriver.UpsertResult(id=entry.id, error=e))
+
+        return results
+
+    def _upsert_text_artifact_batch(
+            self,
+            artifacts: list[TextArtifact],
+            embeddings: list[Union[list[float], Exception]],
+            namespace: Optional[str],
+            meta: Optional[dict],
+            **kwargs
+    ) -> list[UpsertResult]:
+        results = [
+            BaseVectorStoreDriver.UpsertResult(id=self._artifact_id(artifact), error=embedding)
+            if isinstance(embedding, Exception) else None
+            for artifact, embedding in zip(artifacts, embeddings)
+        ]
+        positions = [i for i, result in enumerate(results) if result is None]
+        entries = [
+            BaseVectorStoreDriver.Entry(
+                id=self._artifact_id(artifacts[i]),
+                vector=embeddings[i],
+                meta=self._text_artifact_meta(artifacts[i], meta),
+                namespace=namespace,
+                artifact=artifacts[i]
+            ) for i in positions
+        ]
+
+        for i, result in zip(positions, self.upsert_vectors(entries, batch_size=len(entries), **kwargs)):
+            results[i] = result
+
+        return results
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[Union[list[float], Exception]]:
+        try:
+            TextArtifact.generate_embeddings(
+                [artifact for artifact in artifacts if not artifact.embedding], self.embedding_driver
+            )
+        except Exception:
+            # Retry one artifact at a time so an input the API rejects only fails its own upsert.
+            return [self._embed_text_artifact(artifact) for artifact in artifacts]
+
+        return [artifact.embedding for artifact in artifacts]
+
+    def _embed_text_artifact(self, artifact: TextArtifact) -> Union[list[float], Exception]:
+        try:
+            return artifact.embedding if artifact.embedding else artifact.generate_embedding(self.embedding_driver)
+        except Exception as e:
+            return e
+
+    def content_id(self, artifact: TextArtifact) -> str:
+        """Return the content-addressed ID of an artifact, a fast hash of its text."""
+        return utils.bytes_to_hash(artifact.to_text().encode())
+
+    def _artifact_id(self, artifact: TextArtifact) -> str:
+        return self.content_id(artifact) if self.content_addressed_ids else artifact.id
+
+    def _vector_id(self, vector: list[float]) -> str:
+        # IDs of vectors upserted without one hash their float32 bytes rather than their text representation.
+        return utils.bytes_to_hash(np.asarray(vector, dtype=np.float32).tobytes())
+
+    def _text_artifact_meta(self, artifact: TextArtifact, meta: Optional[dict]) -> dict:
+        # Copy so artifacts upserted with the same meta don't share (and overwrite) one dict. Drivers that keep
+        # artifact objects themselves can override this to skip serialization.
+        return (dict(meta) if meta else {}) | {"artifact": artifact.to_json()}
+
+    def _embed_string(self, string: str) -> list[float]:
+        return self._reduce_vectors([self.embedding_driver.embed_string(string)])[0]
+
+    def _embed_strings(self, strings: list[str]) -> list[list[float]]:
+        return self._reduce_vectors(self.embedding_driver.embed_strings(strings))
+
+    def train_reducer(self, vectors: list[list[float]]) -> None:
+        """Train the reducer on a sample of full-size vectors and save it to reducer_path."""
+        self.reducer.train(np.asarray(vectors, dtype=np.float32))
+
+        if self.reducer_path:
+            self.reducer.save(self.reducer_path)
+
+    def _reduce_vectors(self, vectors: list[list[float]], train: bool = False) -> list[list[float]]:
+        # Only writes may train the reducer: queries against an untrained one would be searching the wrong space.
+        if self.reducer is None or len(vectors) == 0:
+            return vectors
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+
+        if matrix.ndim != 2:
+            raise ValueError("vectors must all have the same number of dimensions")
+        elif matrix.shape[1] == self.reducer.target_dimensions:
+            return vectors
+
+        if not self.reducer.is_trained:
+            with self._reducer_lock:
+                if not self.reducer.is_trained and self.reducer_path and os.path.exists(self.reducer_path):
+                    self.reducer.load(self.reducer_path)
+
+                if not self.reducer.is_trained:
+                    if train and self.reducer.can_train(len(matrix)):
+                        self.train_reducer(matrix)
+                    else:
+                        raise ValueError(
+                            f"{self.reducer.__class__.__name__} isn't trained, call train_reducer() with a sample of "
+                            f"vectors first"
+                        )
+
+        return self.reducer.reduce(matrix).tolist()
+
+    def _reduce_entries(self, entries: list[Entry]) -> list[Entry]:
+        if self.reducer is None:
+            return entries
+
+        vectors = self._reduce_vectors([entry.vector for entry in entries], train=True)
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=entry.id, vector=vector, meta=entry.meta, namespace=entry.namespace, artifact=entry.artifact
+            ) for entry, vector in zip(entries, vectors)
+        ]
+
+    def load_artifact(self, result: Union[QueryResult, Entry]) -> Optional[BaseArtifact]:
+        """Return the artifact stored with a query result or entry, deserializing it on first access."""
+        if result.artifact is None and result.meta and "artifact" in result.meta:
+            result.artifact = BaseArtifact.from_json(result.meta["artifact"])
+
+        return result.artifact
+
+    @abstractmethod
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete_namespace(self, namespace: str) -> None:
+        ...
+
     @abstractmethod
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Entry:
         ...
 
+    def has_id(self, vector_id: str, namespace: Optional[str] = None) -> bool:
+        return self.has_ids([vector_id], namespace)[0]
+
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        """Return whether each ID is stored in the namespace."""
+        # Drivers that can look up many IDs in one request should override this.
+        return list(self.futures_executor.map(
+            lambda vector_id: self.load_entry(vector_id, namespace=namespace) is not None,
+            vector_ids
+        ))
+
     @abstractmethod
-    def load_entries(self, namespace: Optional[str] = None) -> list[Entry]:
+    def load_entries(self, namespace: Optional[str] = None) -> Iterable[Entry]:
         ...
 
     @abstractmethod
@@ -117,3 +488,276 @@ class BaseVectorStoreDriver(ABC):
             **kwargs
     ) -> list[QueryResult]:
         ...
+
+    def query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[QueryResult]:
+        # Drivers that embed queries server-side can't search by vector.
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support querying by vector")
+
+    def query_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[list[QueryResult]]:
+        # Drivers that can embed and search many queries at once should override this.
+        return list(self.futures_executor.map(
+            lambda query: self.query(
+                query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            ),
+            queries
+        ))
+
+    def export_entries(
+            self,
+            path: str,
+            namespace: Optional[str] = None,
+            chunk_size: Optional[int] = None,
+            **kwargs
+    ) -> int:
+        """Stream every entry in a namespace, or the whole store, to a directory and return the number exported.
+
+        Every chunk of entries is written as a float32 NumPy matrix of vectors next to a JSONL file with the ids,
+        namespaces and meta of its rows. Live artifacts are serialized into meta["artifact"] so any driver can load
+        them back. A manifest listing the chunks is written last, so an interrupted export can't be imported. kwargs
+        are passed to load_entries.
+        """
+        chunk_size = chunk_size if chunk_size else self.EXPORT_CHUNK_SIZE
+        entries = iter(self.load_entries(namespace, **kwargs))
+        chunks = []
+        dimensions = None
+
+        os.makedirs(path, exist_ok=True)
+
+        # A previous export's manifest would otherwise point at chunks this one is about to overwrite.
+        if os.path.exists(os.path.join(path, "manifest.json")):
+            os.remove(os.path.join(path, "manifest.json"))
+
+        while True:
+            chunk = list(itertools.islice(entries, chunk_size))
+
+            if len(chunk) == 0:
+                break
+
+            vectors = np.asarray([entry.vector for entry in chunk], dtype=np.float32)
+
+            if vectors.ndim != 2 or vectors.shape[1] == 0:
+                raise ValueError("entries must all have vectors with the same number of dimensions")
+            elif dimensions is not None and vectors.shape[1] != dimensions:
+                raise ValueError(f"expected vectors with {dimensions} dimensions, got {vectors.shape[1]}")
+
+            dimensions = vectors.shape[1]
+            vectors_file = f"vectors-{len(chunks):05}.npy"
+            entries_file = f"entries-{len(chunks):05}.jsonl"
+
+            np.save(os.path.join(path, vectors_file), vectors)
+
+            with open(os.path.join(path, entries_file), "w") as file:
+                for entry in chunk:
+                    file.write(json.dumps(self._export_record(entry), default=str) + "\n")
+
+            chunks.append({"vectors": vectors_file, "entries": entries_file, "count": len(chunk)})
+
+        with open(os.path.join(path, "manifest.json"), "w") as file:
+            json.dump({
+                "format": self.EXPORT_FORMAT,
+                "version": self.EXPORT_VERSION,
+                "dimensions": dimensions,
+                "count": sum(chunk["count"] for chunk in chunks),
+                "chunks": chunks
+            }, file)
+
+        return sum(chunk["count"] for chunk in chunks)
+
+    def import_entries(
+            self,
+            path: str,
+            batch_size: Optional[int] = None,
+            on_progress: Optional[Callable[[IngestProgress], None]] = None,
+            **kwargs
+    ) -> Iterator[UpsertResult]:
+        """Upsert entries written by export_entries, yielding one result per entry in export order.
+
+        Vectors are memory-mapped and read a batch at a time, and every batch is written with one bulk upsert, so
+        exports of any size import in bounded memory without re-embedding. on_progress is called after every batch.
+        """
+        batch_size = batch_size if batch_size else self.upsert_batch_size
+        progress = BaseVectorStoreDriver.IngestProgress()
+        started_at = time.perf_counter()
+
+        with open(os.path.join(path, "manifest.json")) as file:
+            manifest = json.load(file)
+
+        if manifest.get("format") != self.EXPORT_FORMAT or manifest.get("version") != self.EXPORT_VERSION:
+            raise ValueError(f"unsupported export format in {path}")
+
+        for chunk in manifest["chunks"]:
+            vectors = np.load(os.path.join(path, chunk["vectors"]), mmap_mode="r")
+
+            with open(os.path.join(path, chunk["entries"])) as file:
+                records = (json.loads(line) for line in file)
+
+                for i in range(0, chunk["count"], batch_size):
+                    batch = [
+                        BaseVectorStoreDriver.Entry(
+                            id=record["id"],
+                            vector=vector.tolist(),
+                            meta=record["meta"],
+                            namespace=record["namespace"]
+                        ) for record, vector in zip(itertools.islice(records, batch_size), vectors[i:i + batch_size])
+                    ]
+                    results = self.upsert_vectors(batch, batch_size=len(batch), **kwargs)
+
+                    failed = sum(1 for result in results if result.error)
+                    progress.succeeded += len(results) - failed
+                    progress.failed += failed
+                    progress.elapsed = time.perf_counter() - started_at
+
+                    if on_progress:
+                        on_progress(progress)
+
+                    yield from results
+
+    def _export_record(self, entry: Entry) -> dict:
+        meta = entry.meta
+
+        if entry.artifact is not None and not (meta and "artifact" in meta):
+            meta = (dict(meta) if meta else {}) | {"artifact": entry.artifact.to_json()}
+
+        return {"id": entry.id, "namespace": entry.namespace, "meta": meta}
+
+    def exact_query(
+            self,
+            query: str,
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[QueryResult]:
+        vector = self._embed_string(query)
+
+        return self.exact_query_vectors([vector], count, namespace, include_vectors, **kwargs)[0]
+
+    def exact_query_vectors(
+            self,
+            vectors: list[list[float]],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            block_size: Optional[int] = None,
+            **kwargs
+    ) -> list[list[QueryResult]]:
+        """Exact cosine search of every entry in a namespace, streamed from load_entries in constant memory.
+
+        Entries are scored a block at a time and all vectors are searched in a single pass over the namespace, so this
+        works on namespaces larger than memory as long as the driver's load_entries yields lazily. kwargs are passed
+        to load_entries.
+        """
+        if len(vectors) == 0:
+            return []
+
+        scanner = utils.StreamingTopK(
+            count=count if count else self.DEFAULT_QUERY_COUNT,
+            block_size=block_size if block_size else self.EXACT_QUERY_BLOCK_SIZE
+        )
+
+        return [
+            [
+                BaseVectorStoreDriver.QueryResult(
+                    vector=entry.vector if include_vectors else [],
+                    score=score,
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                    artifact=entry.artifact
+                ) for score, entry in results
+            ]
+            for results in scanner.scan(
+                self._reduce_vectors(vectors), self.load_entries(namespace, **kwargs), lambda entry: entry.vector
+            )
+        ]
+
+    async def aupsert_vector(
+            self,
+            vector: list[float],
+            vector_id: Optional[str] = None,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> str:
+        return await self._run_async(
+            self.upsert_vector, vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
+        )
+
+    async def aupsert_vectors(
+            self,
+            entries: list[Entry],
+            batch_size: Optional[int] = None,
+            **kwargs
+    ) -> list[UpsertResult]:
+        return await self._run_async(self.upsert_vectors, entries, batch_size=batch_size, **kwargs)
+
+    async def aupsert_text_artifacts(
+            self,
+            artifacts: dict[str, list[TextArtifact]],
+            meta: Optional[dict] = None,
+            batch_size: Optional[int] = None,
+            raise_on_error: bool = True,
+            **kwargs
+    ) -> list[UpsertResult]:
+        return await self._run_async(
+            self.upsert_text_artifacts,
+            artifacts,
+            meta=meta,
+            batch_size=batch_size,
+            raise_on_error=raise_on_error,
+            **kwargs
+        )
+
+    async def adelete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        await self._run_async(self.delete_vector, vector_id, namespace=namespace)
+
+    async def adelete_namespace(self, namespace: str) -> None:
+        await self._run_async(self.delete_namespace, namespace)
+
+    async def aload_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[Entry]:
+        return await self._run_async(self.load_entry, vector_id, namespace=namespace)
+
+    async def aload_entries(self, namespace: Optional[str] = None, **kwargs) -> list[Entry]:
+        return await self._run_async(lambda: list(self.load_entries(namespace, **kwargs)))
+
+    async def aquery(
+            self,
+            query: str,
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[QueryResult]:
+        return await self._run_async(
+            self.query, query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+        )
+
+    async def aquery_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[list[QueryResult]]:
+        return await self._run_async(
+            self.query_many, queries, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+        )
+
+    async def _run_async(self, func: Callable, *args, **kwargs):
+        # Blocking calls run on the event loop's default executor rather than futures_executor: the sync methods
+        # fan out over futures_executor themselves and must not wait on it from one of its own workers.
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
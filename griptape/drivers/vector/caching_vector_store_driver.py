@@ -0,0 +1,325 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Union, Iterable
+from attr import define, field, Factory
+from griptape.artifacts import TextArtifact
+from griptape.drivers import BaseVectorStoreDriver, BaseEmbeddingDriver, LocalVectorStoreDriver
+
+
+@define
+class CachingVectorStoreDriver(BaseVectorStoreDriver):
+    """Read-through cache of whole namespaces in front of a (usually remote) vector store driver.
+
+    The first namespaced query or load copies the namespace's entries into cache_driver; later ones are answered
+    locally as long as the namespace stays cached. Namespaces are evicted least recently used first once the cache
+    holds more than max_cached_entries entries, and namespaces larger than that are never cached. Writes and deletes
+    made through this driver go to driver and invalidate the namespaces they touch; call invalidate() after writing
+    to driver directly. Queries with driver-specific kwargs other than meta_filter, or without a namespace, always go
+    to driver. Concurrent lookups of an uncached namespace share a single load, and cached namespaces keep being
+    answered while others load.
+
+    embedding_driver and the cache's reducer default to the wrapped driver's, so local queries search the same vector
+    space. This only holds for drivers that embed queries with their embedding_driver and return stored vectors from
+    load_entries: drivers that embed server-side, such as MarqoVectorStoreDriver, are rejected, and namespaces whose
+    entries are loaded without vectors are always queried on driver.
+    """
+
+    driver: BaseVectorStoreDriver = field(kw_only=True)
+    embedding_driver: BaseEmbeddingDriver = field(
+        default=Factory(lambda self: self.driver.embedding_driver, takes_self=True),
+        kw_only=True
+    )
+    cache_driver: BaseVectorStoreDriver = field(
+        default=Factory(
+            lambda self: LocalVectorStoreDriver(
+                embedding_driver=self.embedding_driver,
+                reducer=self.driver.reducer,
+                reducer_path=self.driver.reducer_path
+            ),
+            takes_self=True
+        ),
+        kw_only=True
+    )
+    max_cached_entries: int = field(default=100000, kw_only=True)
+
+    # Entry count of every cached namespace, least recently used first.
+    _cached_namespaces: OrderedDict[str, int] = field(factory=OrderedDict, init=False)
+    # Namespaces found to be too large to cache, or loaded without vectors, so queries don't reload them every time.
+    _uncacheable_namespaces: set[str] = field(factory=set, init=False)
+    # Namespaces being copied into the cache, with their entry counts once fetched. Concurrent lookups of a namespace
+    # wait for its single load instead of starting another.
+    _loads: dict[str, Future] = field(factory=dict, init=False)
+    _load_sizes: dict[str, int] = field(factory=dict, init=False)
+    # Loads invalidated by a write while in flight, whose entries are dropped instead of cached.
+    _stale_loads: set[str] = field(factory=set, init=False)
+    # Only guards the bookkeeping above and evictions; loads run outside of it.
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.driver.embeds_server_side:
+            raise ValueError(
+                f"{self.driver.__class__.__name__} embeds queries server-side, so they can't be answered from the cache"
+            )
+
+    @property
+    def embeds_server_side(self) -> bool:
+        return self.driver.embeds_server_side
+
+    def is_cached(self, namespace: str) -> bool:
+        return namespace in self._cached_namespaces
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop a namespace, or every namespace when none is given, from the cache."""
+        with self._lock:
+            if namespace is None:
+                self._uncacheable_namespaces.clear()
+
+            for cached_namespace in list(self._cached_namespaces) if namespace is None else [namespace]:
+                self._uncache(cached_namespace)
+
+    def upsert_vector(
+            self,
+            vector: list[float],
+            vector_id: Optional[str] = None,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> str:
+        try:
+            return self.driver.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+        finally:
+            self._uncache(namespace)
+
+    def upsert_text_artifact(
+            self,
+            artifact: TextArtifact,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> str:
+        try:
+            return self.driver.upsert_text_artifact(artifact, namespace=namespace, meta=meta, **kwargs)
+        finally:
+            self._uncache(namespace)
+
+    def _upsert_vector_batch(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        try:
+            return self.driver.upsert_vectors(entries, batch_size=len(entries), **kwargs)
+        finally:
+            for namespace in {entry.namespace for entry in entries}:
+                self._uncache(namespace)
+
+    def _upsert_text_artifact_batch(
+            self,
+            artifacts: list[TextArtifact],
+            embeddings: list[Union[list[float], Exception]],
+            namespace: Optional[str],
+            meta: Optional[dict],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        try:
+            return self.driver._upsert_text_artifact_batch(artifacts, embeddings, namespace, meta, **kwargs)
+        finally:
+            self._uncache(namespace)
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[Union[list[float], Exception]]:
+        return self.driver._embed_text_artifacts(artifacts)
+
+    def _embed_text_artifact(self, artifact: TextArtifact) -> Union[list[float], Exception]:
+        return self.driver._embed_text_artifact(artifact)
+
+    def _artifact_id(self, artifact: TextArtifact) -> str:
+        return self.driver._artifact_id(artifact)
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        try:
+            self.driver.delete_vector(vector_id, namespace=namespace)
+        finally:
+            self._uncache(namespace)
+
+    def delete_namespace(self, namespace: str) -> None:
+        try:
+            self.driver.delete_namespace(namespace)
+        finally:
+            self._uncache(namespace)
+
+    def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
+        if self._cache(namespace):
+            return self.cache_driver.load_entry(vector_id, namespace=namespace)
+        else:
+            return self.driver.load_entry(vector_id, namespace=namespace)
+
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        if self._cache(namespace):
+            return self.cache_driver.has_ids(vector_ids, namespace=namespace)
+        else:
+            return self.driver.has_ids(vector_ids, namespace=namespace)
+
+    def load_entries(self, namespace: Optional[str] = None, **kwargs) -> Iterable[BaseVectorStoreDriver.Entry]:
+        if self._cacheable(kwargs) and self._cache(namespace):
+            return self.cache_driver.load_entries(namespace, **kwargs)
+        else:
+            return self.driver.load_entries(namespace, **kwargs)
+
+    def query(
+            self,
+            query: str,
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        if self._cacheable(kwargs) and self._cache(namespace):
+            return self.cache_driver.query(
+                query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+        else:
+            return self.driver.query(query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+
+    def query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        if self._cacheable(kwargs) and self._cache(namespace):
+            return self.cache_driver.query_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+        else:
+            return self.driver.query_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+    def query_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        if self._cacheable(kwargs) and self._cache(namespace):
+            return self.cache_driver.query_many(
+                queries, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+        else:
+            return self.driver.query_many(
+                queries, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+    def _cacheable(self, kwargs: dict) -> bool:
+        # Meta filters are driver-agnostic, so the cache driver can evaluate them itself.
+        return set(kwargs) <= {"meta_filter"}
+
+    def _cache(self, namespace: Optional[str]) -> bool:
+        # Returns whether the namespace is fully cached, loading it first if it isn't.
+        if namespace is None:
+            return False
+
+        with self._lock:
+            if namespace in self._cached_namespaces:
+                self._cached_namespaces.move_to_end(namespace)
+
+                return True
+            elif namespace in self._uncacheable_namespaces:
+                return False
+            elif namespace in self._loads:
+                future = self._loads[namespace]
+                loading = False
+            else:
+                future = Future()
+                self._loads[namespace] = future
+                loading = True
+
+        if loading:
+            # The first lookup loads the namespace; anything it raises reaches the waiting lookups through the future.
+            try:
+                future.set_result(self._load_namespace(namespace))
+            except Exception as e:
+                with self._lock:
+                    self._finish_load(namespace)
+                    self._stale_loads.discard(namespace)
+
+                future.set_exception(e)
+
+        return future.result()
+
+    def _load_namespace(self, namespace: str) -> bool:
+        entries = []
+
+        for entry in self.driver.load_entries(namespace):
+            # Entries without vectors can't be scored locally.
+            if len(entries) == self.max_cached_entries or not entry.vector:
+                with self._lock:
+                    self._finish_load(namespace)
+
+                    # A write since the load started may have changed the namespace, so it's only marked as uncacheable
+                    # if it wasn't invalidated.
+                    if namespace not in self._stale_loads:
+                        self._uncacheable_namespaces.add(namespace)
+
+                    self._stale_loads.discard(namespace)
+
+                return False
+
+            # Stores report namespaces differently, so entries are filed under the requested one.
+            entries.append(BaseVectorStoreDriver.Entry(
+                id=entry.id,
+                vector=entry.vector,
+                meta=entry.meta,
+                namespace=namespace,
+                artifact=entry.artifact
+            ))
+
+        with self._lock:
+            # Room for the namespace is made up front, counting other loads in flight, so the cache never overflows.
+            self._evict(self.max_cached_entries - len(entries) - sum(self._load_sizes.values()))
+            self._load_sizes[namespace] = len(entries)
+
+        results = self.cache_driver.upsert_vectors(entries)
+
+        with self._lock:
+            if namespace not in self._stale_loads and not any(result.error for result in results):
+                self._finish_load(namespace)
+                self._cached_namespaces[namespace] = len(entries)
+
+                return True
+
+        # The namespace is still marked as loading, so no other load can write to it while it's cleaned up.
+        try:
+            self.cache_driver.delete_namespace(namespace)
+        finally:
+            with self._lock:
+                self._finish_load(namespace)
+                self._stale_loads.discard(namespace)
+
+        return False
+
+    def _finish_load(self, namespace: str) -> None:
+        # Callers hold _lock.
+        self._loads.pop(namespace, None)
+        self._load_sizes.pop(namespace, None)
+
+    def _uncache(self, namespace: Optional[str]) -> None:
+        with self._lock:
+            self._uncacheable_namespaces.discard(namespace)
+
+            if namespace in self._loads:
+                self._stale_loads.add(namespace)
+
+            if namespace in self._cached_namespaces:
+                self._cached_namespaces.pop(namespace)
+                self.cache_driver.delete_namespace(namespace)
+
+    def _evict(self, budget: int) -> None:
+        # Callers hold _lock.
+        while self._cached_namespaces and sum(self._cached_namespaces.values()) > budget:
+            self._uncache(next(iter(self._cached_namespaces)))
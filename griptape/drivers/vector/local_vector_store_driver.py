@@ -1,18 +1,123 @@
-from typing import Optional, Callable
-from numpy import dot
-from numpy.linalg import norm
+import json
+import os
+from contextlib import contextmanager
+from typing import Optional, Callable, Iterator
+import numpy as np
 from griptape import utils
+from griptape.artifacts import BaseArtifact, TextArtifact
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.filters import BaseMetaFilter
+from griptape.indexes import BaseVectorIndex, Bm25TextIndex, MetaFieldIndex
+from griptape.quantizers import BaseVectorQuantizer
 from attr import define, field
 
 
+def cosine_relatedness(x, y) -> float:
+    return np.dot(x, y) / (np.linalg.norm(x) * np.linalg.norm(y))
+
+
 @define
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
-    entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, kw_only=True)
-    relatedness_fn: Callable = field(
-        default=lambda x, y: dot(x, y) / (norm(x) * norm(y)),
-        kw_only=True
-    )
+    INITIAL_CAPACITY = 1024
+    INDEX_BATCH_SIZE = 4096
+    # Upper bound on the number of scores held in memory at once when scoring many queries together.
+    SCORE_BLOCK_SIZE = 2 ** 24
+
+    # Scoring function. With the default cosine_relatedness, scores are computed with a single matrix-vector product
+    # over pre-normalized rows; any other function is called on each query vector and stored vector pair.
+    relatedness_fn: Callable = field(default=cosine_relatedness, kw_only=True)
+    # When set, vectors live in a memory-mapped float32 file and ids/metadata in a SQLite sidecar inside this
+    # directory, so the store survives restarts and can be shared by other processes opening it with read_only.
+    # Replicas map the same file, so the OS page cache holds one copy of the vectors for all processes (a tmpfs such
+    # as /dev/shm keeps it purely in shared memory). refresh() applies rows written by the owning process since, and
+    # with auto_refresh every read checks for them first. The files are managed by utils.LocalVectorStorage.
+    persist_dir: Optional[str] = field(default=None, kw_only=True)
+    read_only: bool = field(default=False, kw_only=True)
+    auto_refresh: bool = field(default=False, kw_only=True)
+    # Optional approximate nearest-neighbour index used to narrow down the rows scored by queries. With persist_dir its
+    # trained state is saved with the store, so it isn't retrained or rebuilt when the store is opened.
+    index: Optional[BaseVectorIndex] = field(default=None, kw_only=True)
+    # Optional compact encoding for stored vectors. Once the quantizer is trained, queries score the codes instead of
+    # float32 vectors. In memory the codes replace the float32 vectors, so scores and returned vectors are approximate;
+    # with persist_dir the exact vectors stay on disk and the top count * rescore_factor candidates are re-scored
+    # against them.
+    quantizer: Optional[BaseVectorQuantizer] = field(default=None, kw_only=True)
+    rescore_factor: int = field(default=4, kw_only=True)
+    # Optional keyword index over the text of stored artifacts. When set, queries fuse BM25 and vector rankings, either
+    # with weighted reciprocal rank fusion ("rrf") or a weighted sum of min-max normalized scores ("weighted"). Pass
+    # hybrid=False, fusion or keyword_weight to query to override these per query.
+    text_index: Optional[Bm25TextIndex] = field(default=None, kw_only=True)
+    fusion: str = field(default="rrf", kw_only=True)
+    keyword_weight: float = field(default=0.5, kw_only=True)
+    rrf_k: int = field(default=60, kw_only=True)
+    # Optional inverted and sorted indexes over selected meta keys. Queries and load_entries take a meta_filter; with
+    # meta_index set, only rows matching the indexed parts of the filter are loaded or scored, and the rows are checked
+    # against their stored meta only for filters on keys the index doesn't cover.
+    meta_index: Optional[MetaFieldIndex] = field(default=None, kw_only=True)
+    # Deletes compact the store once tombstoned rows outnumber live rows by this ratio (and at least INITIAL_CAPACITY
+    # rows are tombstoned), so long-running stores with steady churn stay bounded in memory and on disk.
+    auto_compact_ratio: Optional[float] = field(default=1.0, kw_only=True)
+
+    # Passed as entries=, keyed by namespaced vector id, and loaded into the store when it's created. The entries
+    # property reads the current entries back.
+    _entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, kw_only=True, repr=False)
+
+    _vectors: np.ndarray = field(factory=lambda: np.empty((0, 0), dtype=np.float32), init=False)
+    _norms: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.float32), init=False)
+    _codes: Optional[np.ndarray] = field(default=None, init=False)
+    _live: np.ndarray = field(factory=lambda: np.empty(0, dtype=bool), init=False)
+    _tombstones: int = field(default=0, init=False)
+    _keys: list[tuple[Optional[str], str]] = field(factory=list, init=False)
+    _ids: list[str] = field(factory=list, init=False)
+    _metas: list[Optional[dict]] = field(factory=list, init=False)
+    # Live artifact objects for rows upserted from artifacts in memory mode, so they never go through JSON.
+    _artifacts: list[Optional[BaseArtifact]] = field(factory=list, init=False)
+    _namespaces: list[Optional[str]] = field(factory=list, init=False)
+    _rows: dict[tuple[Optional[str], str], int] = field(factory=dict, init=False)
+    _namespace_index: dict[Optional[str], dict[int, None]] = field(factory=dict, init=False)
+    # Queries and loads share the lock; writes hold it exclusively.
+    _lock: utils.ReadWriteLock = field(factory=utils.ReadWriteLock, init=False)
+    # The files of a store with persist_dir.
+    _storage: Optional[utils.LocalVectorStorage] = field(default=None, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.persist_dir:
+            if self.reducer_path is None:
+                self.reducer_path = os.path.join(self.persist_dir, "reducer.npz")
+
+            self._storage = utils.LocalVectorStorage(self.persist_dir, read_only=self.read_only)
+
+            self._open()
+        elif self.read_only:
+            raise ValueError("read_only requires persist_dir")
+
+        if self._entries:
+            entries, self._entries = self._entries, {}
+
+            self._upsert_entries(self._reduce_entries([
+                BaseVectorStoreDriver.Entry(
+                    id=entry.id if entry.id else key,
+                    vector=entry.vector,
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                    artifact=entry.artifact
+                ) for key, entry in entries.items()
+            ]))
+
+    @property
+    def entries(self) -> dict[str, BaseVectorStoreDriver.Entry]:
+        with self._reading():
+            rows = list(self._rows.items())
+            entries = self._load_rows([row for _, row in rows])
+
+        return {
+            self._namespaced_vector_id(vector_id, namespace): entry
+            for ((namespace, vector_id), _), entry in zip(rows, entries)
+        }
+
+    @property
+    def dimensions(self) -> Optional[int]:
+        return self._vectors.shape[1] if len(self._keys) > 0 else None
 
     def upsert_vector(
             self,
@@ -22,22 +127,66 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
             meta: Optional[dict] = None,
             **kwargs
     ) -> str:
-        vector_id = vector_id if vector_id else utils.str_to_hash(str(vector))
+        return self._upsert_entries([
+            BaseVectorStoreDriver.Entry(
+                id=vector_id, vector=self._reduce_vectors([vector], train=True)[0], meta=meta, namespace=namespace
+            )
+        ])[0]
 
-        self.entries[self._namespaced_vector_id(vector_id, namespace)] = self.Entry(
-            id=vector_id,
-            vector=vector,
-            meta=meta,
-            namespace=namespace
-        )
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        with self._lock.write():
+            self._check_writable()
+
+            row = self._rows.pop((namespace, vector_id), None)
+
+            if row is not None:
+                self._tombstone_rows([row])
 
-        return vector_id
+                if self._persisting():
+                    self._storage.write_rows(self._vectors.shape[1], [], [row])
+
+            self._auto_compact()
+
+    def delete_namespace(self, namespace: str) -> None:
+        with self._lock.write():
+            self._check_writable()
+
+            rows = list(self._namespace_index.get(namespace, {}))
+
+            for row in rows:
+                self._rows.pop(self._keys[row], None)
+
+            self._tombstone_rows(rows)
+
+            if self._persisting() and rows:
+                self._storage.write_rows(self._vectors.shape[1], [], rows)
+
+            self._auto_compact()
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self._namespaced_vector_id(vector_id, namespace), None)
+        with self._reading():
+            row = self._rows.get((namespace, vector_id))
+
+            return None if row is None else self._load_rows([row])[0]
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+    def load_entries(
+            self,
+            namespace: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        with self._reading():
+            return self._load_rows(self._filter_rows(self._namespace_rows(namespace), meta_filter).tolist())
+
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        with self._reading():
+            return [(namespace, vector_id) in self._rows for vector_id in vector_ids]
+
+    def count_entries(self, namespace: Optional[str] = None) -> int:
+        with self._reading():
+            if namespace is None:
+                return len(self._rows)
+            else:
+                return len(self._namespace_index.get(namespace, {}))
 
     def query(
             self,
@@ -47,32 +196,843 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
             include_vectors: bool = False,
             **kwargs
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        query_embedding = self.embedding_driver.embed_string(query)
+        query_vectors = np.asarray([self._embed_string(query)], dtype=np.float32)
+
+        with self._reading():
+            return self._query_vectors(query_vectors, [query], count, namespace, include_vectors, **kwargs)[0]
+
+    def query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        query_vectors = np.asarray(self._reduce_vectors([vector]), dtype=np.float32)
+
+        with self._reading():
+            return self._query_vectors(query_vectors, [None], count, namespace, include_vectors, **kwargs)[0]
+
+    def query_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        if len(queries) == 0:
+            return []
+
+        query_vectors = np.asarray(self._embed_strings(queries), dtype=np.float32)
+
+        with self._reading():
+            return self._query_vectors(query_vectors, queries, count, namespace, include_vectors, **kwargs)
+
+    def compact(self) -> None:
+        with self._lock.write():
+            self._check_writable()
+            self._compact()
+
+    def refresh(self) -> None:
+        """Pick up rows written to a persistent store by another process since it was opened or last refreshed.
 
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
+        New and deleted rows are applied incrementally. Once the owning process has compacted the store, it's reopened.
+        """
+        if not self.persist_dir:
+            return
+
+        with self._lock.write():
+            if self._storage.generation_changed():
+                self._close()
+                self._reset()
+                self._open()
+            else:
+                self._apply_changes()
+
+    def close(self) -> None:
+        with self._lock.write():
+            if self._persisting() and not self.read_only:
+                self._save_state()
+
+            self._close()
+
+    @contextmanager
+    def _reading(self) -> Iterator[None]:
+        if self.auto_refresh and self.read_only and self._changed():
+            self.refresh()
+
+        with self._lock.read():
+            yield
+
+    def _changed(self) -> bool:
+        with self._lock.read():
+            return self._storage.changed()
+
+    def _persisting(self) -> bool:
+        # Closed persistent stores stop recording writes.
+        return self._storage is not None and self._storage.is_open
+
+    def _close(self) -> None:
+        if self._storage:
+            self._storage.close()
+
+    def _auto_compact(self) -> None:
+        if (
+            self.auto_compact_ratio is not None
+            and self._tombstones >= self.INITIAL_CAPACITY
+            and self._tombstones > len(self._rows) * self.auto_compact_ratio
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        if self._tombstones == 0:
+            return
+
+        live_rows = np.flatnonzero(self._live[:len(self._keys)])
+
+        if self.persist_dir:
+            self._compact_files(live_rows)
         else:
-            entries = self.entries
+            dimensions = self._vectors.shape[1]
+            vectors = self._vectors[live_rows] if self._codes is None else None
+            codes = self._codes[live_rows] if self._codes is not None else None
+            norms = self._norms[live_rows]
+            keys = [self._keys[row] for row in live_rows]
+            metas = [self._metas[row] for row in live_rows]
+            artifacts = [self._artifacts[row] for row in live_rows]
 
-        entries_and_relatednesses = [
-            (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in entries.values()
-        ]
-        entries_and_relatednesses.sort(key=lambda x: x[1], reverse=True)
+            self._reset()
+
+            if codes is not None:
+                self._vectors = np.empty((0, dimensions), dtype=np.float32)
+                self._codes = np.empty((0, codes.shape[1]), dtype=np.uint8)
+
+            self._allocate(max(self.INITIAL_CAPACITY, len(live_rows)), dimensions)
+
+            if codes is None:
+                self._vectors[:len(live_rows)] = vectors
+            else:
+                self._codes[:len(live_rows)] = codes
 
-        result = [
+            self._norms[:len(live_rows)] = norms
+
+            for row, (key, meta, artifact) in enumerate(zip(keys, metas, artifacts)):
+                self._register_row(row, key, meta, artifact)
+
+            self._index_rows(np.arange(len(live_rows)))
+            self._index_metas(list(range(len(live_rows))), metas)
+            self._index_texts(
+                list(range(len(live_rows))),
+                [self._entry_text(artifact, meta) for artifact, meta in zip(artifacts, metas)]
+            )
+
+    def _upsert_vector_batch(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        return [BaseVectorStoreDriver.UpsertResult(id=vector_id) for vector_id in self._upsert_entries(entries)]
+
+    def _upsert_entries(self, entries: list[BaseVectorStoreDriver.Entry]) -> list[str]:
+        vector_ids = [entry.id if entry.id else self._vector_id(entry.vector) for entry in entries]
+        arrays = [np.asarray(entry.vector, dtype=np.float32) for entry in entries]
+
+        if any(array.ndim != 1 for array in arrays):
+            raise ValueError("vectors must be one-dimensional")
+
+        # Validate the whole batch up front so a bad vector doesn't leave the batch partially applied.
+        dimensions = {len(array) for array in arrays} | ({self.dimensions} if self.dimensions else set())
+
+        if len(dimensions) > 1:
+            raise ValueError(f"vectors must all have the same number of dimensions, got {sorted(dimensions)}")
+        elif self.quantizer and dimensions:
+            self.quantizer.check_dimensions(dimensions.pop())
+
+        with self._lock.write():
+            self._check_writable()
+
+            touched_rows = []
+            texts = []
+            metas = []
+            records = []
+            tombstoned_rows = []
+
+            for vector_id, array, entry in zip(vector_ids, arrays, entries):
+                key = (entry.namespace, vector_id)
+                old_row = self._rows.get(key)
+
+                if old_row is not None and not self.persist_dir:
+                    self._write_row(old_row, array)
+                    self._metas[old_row] = entry.meta
+                    self._artifacts[old_row] = entry.artifact
+                    touched_rows.append(old_row)
+                    texts.append(self._entry_text(entry.artifact, entry.meta))
+                    metas.append(entry.meta)
+                else:
+                    # The persistent vector file is append-only: overwrites add a new row and tombstone the old one.
+                    row = self._append_row(array)
+
+                    if old_row is not None:
+                        self._tombstone_rows([old_row])
+                        tombstoned_rows.append(old_row)
+
+                    self._register_row(row, key, entry.meta, entry.artifact)
+                    touched_rows.append(row)
+                    texts.append(self._entry_text(entry.artifact, entry.meta))
+                    metas.append(entry.meta)
+
+                    if self._persisting():
+                        records.append((row, entry.namespace, vector_id, entry.meta, float(self._norms[row])))
+
+            trained = self._trained()
+
+            self._index_rows(np.asarray(touched_rows, dtype=np.int64))
+            self._index_texts(touched_rows, texts)
+            self._index_metas(touched_rows, metas)
+            self._quantize()
+
+            if self._persisting():
+                self._storage.write_rows(self._vectors.shape[1], records, tombstoned_rows)
+
+                if self._trained() != trained:
+                    self._save_state()
+
+        return vector_ids
+
+    def _text_artifact_meta(self, artifact: TextArtifact, meta: Optional[dict]) -> dict:
+        # Persistent stores need the serialized artifact in SQLite. In memory the artifact object is kept instead and
+        # only serialized into meta when the row is read.
+        if self.persist_dir:
+            return super()._text_artifact_meta(artifact, meta)
+        else:
+            return dict(meta) if meta else {}
+
+    def _query_vectors(
+            self,
+            query_vectors: np.ndarray,
+            query_texts: list[Optional[str]],
+            count: Optional[int],
+            namespace: Optional[str],
+            include_vectors: bool,
+            hybrid: Optional[bool] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        rows = self._filter_rows(self._namespace_rows(namespace), meta_filter)
+        hybrid = self.text_index is not None and hybrid is not False
+
+        if len(rows) == 0:
+            return [[] for _ in query_vectors]
+
+        if self.index:
+            # Every query probes different index lists, so candidates are scored one query at a time.
+            results = []
+
+            for query_vector, query_text in zip(query_vectors, query_texts):
+                candidate_rows = self._candidate_rows(query_vector, rows, count, **kwargs)
+
+                if hybrid and query_text is not None and candidate_rows is not rows:
+                    # Keyword matches compete even when the vector index didn't propose them.
+                    matches = self.text_index.matches(query_text)
+                    candidate_rows = np.union1d(candidate_rows, matches[np.isin(matches, rows)])
+
+                scores = self._score_rows(query_vector[None, :], candidate_rows)[0]
+                candidate_rows, scores = self._rank(
+                    query_vector, query_text, candidate_rows, scores, count, hybrid, **kwargs
+                )
+
+                results.append(self._query_results(candidate_rows, scores, count, include_vectors))
+
+            return results
+
+        results = []
+        block_size = max(1, self.SCORE_BLOCK_SIZE // len(rows))
+
+        for i in range(0, len(query_vectors), block_size):
+            scores = self._score_rows(query_vectors[i:i + block_size], rows)
+
+            for query_vector, query_text, query_scores in zip(
+                    query_vectors[i:i + block_size], query_texts[i:i + block_size], scores
+            ):
+                ranked_rows, ranked_scores = self._rank(
+                    query_vector, query_text, rows, query_scores, count, hybrid, **kwargs
+                )
+
+                results.append(self._query_results(ranked_rows, ranked_scores, count, include_vectors))
+
+        return results
+
+    def _rank(
+            self,
+            query_vector: np.ndarray,
+            query_text: Optional[str],
+            rows: np.ndarray,
+            scores: np.ndarray,
+            count: Optional[int],
+            hybrid: bool,
+            **kwargs
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Queries by vector have no text to match keywords against.
+        if hybrid and query_text is not None:
+            return rows, self._fuse(scores, self.text_index.scores(query_text, rows), **kwargs)
+        else:
+            return self._rescore(query_vector, rows, scores, count)
+
+    def _fuse(
+            self,
+            vector_scores: np.ndarray,
+            keyword_scores: np.ndarray,
+            fusion: Optional[str] = None,
+            keyword_weight: Optional[float] = None,
+            **kwargs
+    ) -> np.ndarray:
+        fusion = fusion if fusion else self.fusion
+        keyword_weight = self.keyword_weight if keyword_weight is None else keyword_weight
+        matched = keyword_scores > 0
+
+        if fusion == "rrf":
+            # Rows without any query term have no keyword rank and only get the vector contribution.
+            return (1 - keyword_weight) / (self.rrf_k + self._ranks(vector_scores)) + np.where(
+                matched, keyword_weight / (self.rrf_k + self._ranks(keyword_scores)), 0
+            )
+        elif fusion == "weighted":
+            return (1 - keyword_weight) * self._min_max(vector_scores) + keyword_weight * self._min_max(keyword_scores)
+        else:
+            raise ValueError(f"unsupported fusion: {fusion}")
+
+    def _ranks(self, scores: np.ndarray) -> np.ndarray:
+        order = np.argsort(-scores, kind="stable")
+        ranks = np.empty(len(scores), dtype=np.float32)
+        ranks[order] = np.arange(1, len(scores) + 1)
+
+        return ranks
+
+    def _min_max(self, scores: np.ndarray) -> np.ndarray:
+        low = scores.min()
+        spread = scores.max() - low
+
+        return (scores - low) / spread if spread > 0 else np.zeros_like(scores)
+
+    def _query_results(
+            self,
+            rows: np.ndarray,
+            scores: np.ndarray,
+            count: Optional[int],
+            include_vectors: bool
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        top = self._top_k(scores, count)
+        top_rows = rows[top].tolist()
+        metas = self._result_metas(top_rows)
+
+        return [
             BaseVectorStoreDriver.QueryResult(
-                vector=er[0].vector,
-                score=er[1],
-                meta=er[0].meta
-            ) for er in entries_and_relatednesses
-        ][:count]
-
-        if include_vectors:
-            return result
+                vector=self._row_vector(row) if include_vectors else [],
+                score=float(scores[i]),
+                meta=meta,
+                namespace=self._namespaces[row],
+                artifact=self._artifacts[row]
+            ) for i, row, meta in zip(top, top_rows, metas)
+        ]
+
+    def _rescore(
+            self,
+            query_vector: np.ndarray,
+            rows: np.ndarray,
+            scores: np.ndarray,
+            count: Optional[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Only quantized persistent stores have exact vectors to re-score against.
+        if self._codes is None or not self.persist_dir or count is None:
+            return rows, scores
+        elif self.relatedness_fn is not cosine_relatedness:
+            return rows, scores
+
+        top = self._top_k(scores, count * max(1, self.rescore_factor))
+
+        return rows[top], self._score_vectors(query_vector[None, :], self._vectors[rows[top]])[0]
+
+    def _candidate_rows(
+            self,
+            query_vector: np.ndarray,
+            rows: np.ndarray,
+            count: Optional[int],
+            **kwargs
+    ) -> np.ndarray:
+        # Small namespaces and unbounded queries are cheaper and exact to scan directly.
+        if self.index is None or count is None or len(rows) <= self.index.candidate_count(len(self._rows), **kwargs):
+            return rows
+
+        query_norm = np.linalg.norm(query_vector)
+        candidates = self.index.candidates(query_vector / query_norm, **kwargs) if query_norm > 0 else None
+
+        if candidates is None:
+            return rows
+
+        # Indexes may return duplicates and stale rows; the store's own bookkeeping is authoritative.
+        candidates = np.unique(candidates)
+
+        if len(rows) == len(self._rows):
+            candidates = candidates[self._live[candidates]]
+        else:
+            candidates = candidates[np.isin(candidates, rows, assume_unique=True)]
+
+        return candidates if len(candidates) >= count else rows
+
+    def _score_rows(self, query_vectors: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        if self.relatedness_fn is not cosine_relatedness:
+            return np.asarray([
+                [self.relatedness_fn(query_vector, self._row_vector(row)) for row in rows]
+                for query_vector in query_vectors
+            ], dtype=np.float32)
+
+        matrix = self._codes if self._codes is not None else self._vectors
+
+        if rows[-1] == len(rows) - 1:
+            # Rows are ascending, so this is the whole store; avoid a gather copy.
+            matrix = matrix[:len(rows)]
+        else:
+            matrix = matrix[rows]
+
+        return self._score_vectors(query_vectors, matrix)
+
+    def _score_vectors(self, query_vectors: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        query_norms = np.linalg.norm(query_vectors, axis=1, keepdims=True)
+        # Zero query vectors score zero against everything.
+        query_vectors = query_vectors / np.where(query_norms > 0, query_norms, 1)
+
+        if matrix.dtype == np.uint8:
+            return self.quantizer.score(query_vectors, matrix)
+        else:
+            return query_vectors @ matrix.T
+
+    def _top_k(self, scores: np.ndarray, count: Optional[int]) -> np.ndarray:
+        if count is None or count >= len(scores):
+            return np.argsort(-scores, kind="stable")
+        elif count <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        candidates = np.argpartition(-scores, count - 1)[:count]
+
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def _namespace_rows(self, namespace: Optional[str]) -> np.ndarray:
+        if namespace is None:
+            if self._tombstones == 0:
+                return np.arange(len(self._keys), dtype=np.int64)
+            else:
+                return np.flatnonzero(self._live[:len(self._keys)])
+        else:
+            rows = self._namespace_index.get(namespace, {})
+
+            return np.fromiter(rows.keys(), dtype=np.int64, count=len(rows))
+
+    def _filter_rows(self, rows: np.ndarray, meta_filter: Optional[BaseMetaFilter]) -> np.ndarray:
+        if meta_filter is None or len(rows) == 0:
+            return rows
+
+        if self.meta_index:
+            candidates = self.meta_index.candidate_rows(meta_filter)
+
+            if candidates is not None:
+                rows = rows[np.isin(rows, candidates, assume_unique=True)]
+
+                if self.meta_index.covers(meta_filter):
+                    return rows
+
+        metas = self._load_metas(rows.tolist())
+
+        return rows[np.fromiter((meta_filter.matches(meta) for meta in metas), dtype=bool, count=len(rows))]
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise ValueError("vector store is opened read-only")
+
+    def _append_row(self, vector: np.ndarray) -> int:
+        row = len(self._keys)
+
+        if row == 0 and self._vectors.shape[1] != len(vector):
+            self._allocate(self.INITIAL_CAPACITY, len(vector))
+        elif row >= len(self._live):
+            # Grow geometrically so appends stay amortized O(1).
+            self._allocate(max(self.INITIAL_CAPACITY, len(self._live) * 2), self._vectors.shape[1])
+
+        self._write_row(row, vector)
+
+        return row
+
+    def _allocate(self, capacity: int, dimensions: int) -> None:
+        row_count = len(self._keys)
+
+        if self.persist_dir:
+            vectors = self._storage.map_vectors(capacity, dimensions)
+        elif self._codes is not None:
+            vectors = np.empty((0, dimensions), dtype=np.float32)
         else:
-            return [
-                BaseVectorStoreDriver.QueryResult([], r.score, r.meta, r.namespace) for r in result
-            ]
+            vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+
+            if row_count > 0:
+                vectors[:row_count] = self._vectors[:row_count]
+
+        if self._codes is not None:
+            codes = np.zeros((capacity, self._codes.shape[1]), dtype=np.uint8)
+            codes[:row_count] = self._codes[:row_count]
+
+            self._codes = codes
+
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[:row_count] = self._norms[:row_count]
+        live = np.zeros(capacity, dtype=bool)
+        live[:row_count] = self._live[:row_count]
+
+        self._vectors = vectors
+        self._norms = norms
+        self._live = live
+
+    def _write_row(self, row: int, vector: np.ndarray) -> None:
+        if len(vector) != self._vectors.shape[1]:
+            raise ValueError(
+                f"vector has {len(vector)} dimensions but the store holds {self._vectors.shape[1]}-dimensional vectors"
+            )
+
+        norm = np.linalg.norm(vector)
+        normalized = vector / norm if norm > 0 else vector
+
+        if len(self._vectors) > 0:
+            self._vectors[row] = normalized
+
+        if self._codes is not None:
+            self._codes[row] = self.quantizer.encode(normalized[None, :])[0]
+
+        self._norms[row] = norm
+
+    def _register_row(
+            self,
+            row: int,
+            key: tuple[Optional[str], str],
+            meta: Optional[dict],
+            artifact: Optional[BaseArtifact] = None
+    ) -> None:
+        namespace, vector_id = key
+
+        # Side arrays are appended after the vector is written so concurrent queries never see an empty row.
+        self._keys.append(key)
+        self._ids.append(vector_id)
+        self._metas.append(None if self.persist_dir else meta)
+        self._artifacts.append(None if self.persist_dir else artifact)
+        self._namespaces.append(namespace)
+        self._live[row] = True
+        self._rows[key] = row
+        self._namespace_index.setdefault(namespace, {})[row] = None
+
+    def _register_tombstone(self, key: tuple[Optional[str], str]) -> None:
+        # Keeps row numbers aligned for rows deleted before the store was opened.
+        self._keys.append(key)
+        self._ids.append(key[1])
+        self._metas.append(None)
+        self._artifacts.append(None)
+        self._namespaces.append(key[0])
+        self._tombstones += 1
+
+    def _tombstone_rows(self, rows: list[int]) -> None:
+        for row in rows:
+            namespace_rows = self._namespace_index.get(self._namespaces[row])
+
+            if namespace_rows is not None:
+                namespace_rows.pop(row, None)
+
+                if len(namespace_rows) == 0:
+                    self._namespace_index.pop(self._namespaces[row])
+
+            self._live[row] = False
+            self._metas[row] = None
+            self._artifacts[row] = None
+            self._tombstones += 1
+
+        if self.index:
+            self.index.remove(np.asarray(rows, dtype=np.int64))
+
+        if self.text_index:
+            self.text_index.remove(rows)
+
+        if self.meta_index:
+            self.meta_index.remove(rows)
+
+    def _index_texts(self, rows: list[int], texts: list[Optional[str]]) -> None:
+        if self.text_index is None:
+            return
+
+        indexed = [(row, text) for row, text in zip(rows, texts) if text is not None]
+
+        self.text_index.remove([row for row, text in zip(rows, texts) if text is None])
+        self.text_index.add([row for row, _ in indexed], [text for _, text in indexed])
+
+    def _index_metas(self, rows: list[int], metas: list[Optional[dict]]) -> None:
+        if self.meta_index:
+            self.meta_index.add(rows, metas)
+
+    def _entry_text(self, artifact: Optional[BaseArtifact], meta: Optional[dict]) -> Optional[str]:
+        if artifact is not None:
+            return artifact.to_text()
+        elif meta and "artifact" in meta:
+            return str(json.loads(meta["artifact"]).get("value", ""))
+        else:
+            return None
+
+    def _index_rows(self, rows: np.ndarray) -> None:
+        if self.index is None:
+            return
+
+        for i in range(0, len(rows), self.INDEX_BATCH_SIZE):
+            batch = rows[i:i + self.INDEX_BATCH_SIZE]
+
+            self.index.add(batch, self._normalized_rows(batch))
+
+    def _quantize(self) -> None:
+        """Switch to quantized storage once the quantizer is (or can be) trained on the rows stored so far."""
+        if self.quantizer is None or self._codes is not None or len(self._rows) == 0:
+            return
+
+        live_rows = self._namespace_rows(None)
+
+        if not self.quantizer.is_trained:
+            if not self.quantizer.can_train(len(live_rows)):
+                return
+
+            self.quantizer.train(np.asarray(self._vectors[live_rows]))
+
+        row_count = len(self._keys)
+        codes = np.zeros((len(self._live), self.quantizer.code_size(self._vectors.shape[1])), dtype=np.uint8)
+
+        for i in range(0, row_count, self.INDEX_BATCH_SIZE):
+            codes[i:min(i + self.INDEX_BATCH_SIZE, row_count)] = self.quantizer.encode(
+                self._vectors[i:min(i + self.INDEX_BATCH_SIZE, row_count)]
+            )
+
+        self._codes = codes
+
+        if not self.persist_dir:
+            self._vectors = np.empty((0, self._vectors.shape[1]), dtype=np.float32)
+
+    def _normalized_rows(self, rows: np.ndarray) -> np.ndarray:
+        if self._codes is None or self.persist_dir:
+            return self._vectors[rows]
+        else:
+            return self.quantizer.decode(self._codes[rows])
+
+    def _row_vector(self, row: int) -> list[float]:
+        return (self._normalized_rows(np.asarray([row]))[0] * self._norms[row]).tolist()
+
+    def _load_rows(self, rows: list[int]) -> list[BaseVectorStoreDriver.Entry]:
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=self._ids[row],
+                vector=self._row_vector(row),
+                meta=meta,
+                namespace=self._namespaces[row],
+                artifact=self._artifacts[row]
+            ) for row, meta in zip(rows, self._result_metas(rows))
+        ]
+
+    def _result_metas(self, rows: list[int]) -> list[Optional[dict]]:
+        metas = self._load_metas(rows)
+
+        for i, row in enumerate(rows):
+            artifact = self._artifacts[row]
+
+            if isinstance(artifact, TextArtifact) and (metas[i] is None or "artifact" not in metas[i]):
+                # Serialized once per row, so meta["artifact"] reads the same as it does with persist_dir.
+                metas[i] = self._metas[row] = (metas[i] or {}) | {"artifact": artifact.to_json()}
+
+        return metas
+
+    def _load_metas(self, rows: list[int]) -> list[Optional[dict]]:
+        if self._persisting():
+            return self._storage.load_metas(rows)
+        else:
+            return [self._metas[row] for row in rows]
+
+    def _reset(self) -> None:
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._codes = None
+        self._norms = np.empty(0, dtype=np.float32)
+        self._live = np.empty(0, dtype=bool)
+        self._tombstones = 0
+        self._keys = []
+        self._ids = []
+        self._metas = []
+        self._artifacts = []
+        self._namespaces = []
+        self._rows = {}
+        self._namespace_index = {}
+
+        if self.index:
+            self.index.clear()
+
+        if self.text_index:
+            self.text_index.clear()
+
+        if self.meta_index:
+            self.meta_index.clear()
+
+    def _open(self, generation: Optional[int] = None) -> None:
+        dimensions, records = self._storage.open(generation)
+
+        if dimensions is None:
+            return
+
+        # Rows are only recorded in SQLite after their vector is written, so the vector file may hold more rows than
+        # there are records, but never fewer.
+        self._allocate(max(self.INITIAL_CAPACITY, len(records)), dimensions)
+
+        for row, namespace, vector_id, norm, deleted in records:
+            self._norms[row] = norm
+
+            if deleted:
+                self._register_tombstone((namespace, vector_id))
+            else:
+                self._register_row(row, (namespace, vector_id), None)
+
+        indexed_row_count, coded_row_count = self._load_state()
+        live_rows = self._namespace_rows(None)
+
+        # The saved index already holds the rows that existed when it was saved, minus those deleted since.
+        if self.index and indexed_row_count > 0:
+            self.index.remove(np.flatnonzero(~self._live[:indexed_row_count]))
+
+        self._index_rows(live_rows[live_rows >= indexed_row_count])
+
+        for i in range(coded_row_count, len(self._keys) if self._codes is not None else 0, self.INDEX_BATCH_SIZE):
+            rows = slice(i, min(i + self.INDEX_BATCH_SIZE, len(self._keys)))
+            self._codes[rows] = self.quantizer.encode(self._vectors[rows])
+
+        self._quantize()
+
+        if not self.read_only:
+            self._save_state()
+
+        if self.text_index or self.meta_index:
+            rows = []
+            metas = []
+
+            for row, meta in self._storage.live_metas():
+                rows.append(row)
+                metas.append(meta)
+
+            self._index_texts(rows, [self._entry_text(None, meta) for meta in metas])
+            self._index_metas(rows, metas)
+
+    def _apply_changes(self) -> None:
+        dimensions, records, deletions = self._storage.fetch_changes(len(self._keys))
+        deleted_rows = [row for row, _ in deletions if self._live[row]]
+
+        for row in deleted_rows:
+            self._rows.pop(self._keys[row], None)
+
+        self._tombstone_rows(deleted_rows)
+
+        if records:
+            last_row = records[-1][0]
+
+            if last_row >= len(self._live) or last_row >= len(self._vectors):
+                self._allocate(max(self.INITIAL_CAPACITY, len(self._live) * 2, last_row + 1), dimensions)
+
+            rows = []
+            metas = []
+
+            for row, namespace, vector_id, meta, norm, deleted in records:
+                self._norms[row] = norm
+
+                if deleted:
+                    self._register_tombstone((namespace, vector_id))
+                else:
+                    self._register_row(row, (namespace, vector_id), None)
+                    rows.append(row)
+                    metas.append(meta)
+
+            if self._codes is not None and rows:
+                self._codes[rows] = self.quantizer.encode(np.asarray(self._vectors[rows]))
+
+            self._index_rows(np.asarray(rows, dtype=np.int64))
+            self._index_texts(rows, [self._entry_text(None, meta) for meta in metas])
+            self._index_metas(rows, metas)
+            self._quantize()
+
+    def _compact_files(self, live_rows: np.ndarray) -> None:
+        previous_generation = self._storage.generation
+        generation = self._storage.write_generation(
+            self._vectors, live_rows, max(self.INITIAL_CAPACITY, len(live_rows))
+        )
+
+        # The new generation is opened, which saves its index state, before other processes are pointed at it.
+        self._close()
+        self._reset()
+        self._open(generation)
+        self._storage.publish_generation(previous_generation)
+
+    def _trained(self) -> tuple[bool, bool]:
+        return (
+            self.index is not None and self.index.is_trained,
+            self.quantizer is not None and self.quantizer.is_trained
+        )
+
+    def _save_state(self) -> None:
+        # Saved state covers the first row_count rows; rows appended later are indexed and encoded when the store is
+        # opened.
+        state = {"row_count": np.asarray(len(self._keys))}
+
+        if self.index:
+            state |= {f"index_{key}": value for key, value in self.index.state().items()}
+
+        if self.quantizer:
+            state |= {f"quantizer_{key}": value for key, value in self.quantizer.state().items()}
+
+        if self._codes is not None:
+            state["codes"] = self._codes[:len(self._keys)]
+
+        self._storage.save_state(state)
+
+    def _load_state(self) -> tuple[int, int]:
+        # Returns how many rows the loaded index state and the loaded codes cover.
+        state = self._storage.load_state()
+
+        if state is None:
+            return 0, 0
+
+        row_count = min(int(state["row_count"]), len(self._keys))
+        index_state = {key[len("index_"):]: value for key, value in state.items() if key.startswith("index_")}
+        quantizer_state = {
+            key[len("quantizer_"):]: value for key, value in state.items() if key.startswith("quantizer_")
+        }
+        indexed_row_count = 0
+        coded_row_count = 0
+
+        # State saved by an index or quantizer configured differently is rejected, and it's rebuilt instead.
+        if self.index and index_state:
+            try:
+                self.index.load_state(index_state)
+                indexed_row_count = row_count
+            except ValueError:
+                pass
+
+        # A quantizer that was passed in trained keeps its own state, and all rows are encoded with it.
+        if self.quantizer and quantizer_state and not self.quantizer.is_trained:
+            try:
+                self.quantizer.load_state(quantizer_state)
+            except ValueError:
+                pass
+            else:
+                code_size = self.quantizer.code_size(self._vectors.shape[1])
+                codes = state.get("codes")
+
+                self._codes = np.zeros((len(self._live), code_size), dtype=np.uint8)
+
+                if codes is not None and codes.shape[1] == code_size:
+                    coded_row_count = min(row_count, len(codes))
+                    self._codes[:coded_row_count] = codes[:coded_row_count]
+
+        return indexed_row_count, coded_row_count
 
     def _namespaced_vector_id(self, vector_id: str, namespace: Optional[str]):
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
@@ -1,6 +1,11 @@
-from typing import Optional, List, Dict, Any
+import re
+from http import HTTPStatus
+from typing import Optional, List, Dict, Any, Union
 from griptape.drivers import BaseVectorStoreDriver
 from griptape.artifacts import TextArtifact
+from griptape.filters import (
+    BaseMetaFilter, EqualsMetaFilter, InMetaFilter, RangeMetaFilter, AndMetaFilter, OrMetaFilter
+)
 import marqo
 from attr import define, field, Factory
 import logging
@@ -8,6 +13,9 @@ import logging
 
 @define
 class MarqoVectorStoreDriver(BaseVectorStoreDriver):
+    # Marqo caps search results at 1000 documents by default.
+    DELETE_BATCH_SIZE = 1000
+
     api_key: str = field(kw_only=True)
     url: str = field(kw_only=True)
     mq: marqo.Client = field(
@@ -17,11 +25,19 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         kw_only=True,
     )
     index: str = field(kw_only=True)
+    # Documents per add_documents HTTP request made by the Marqo client. When None, every call is one request.
+    client_batch_size: Optional[int] = field(default=None, kw_only=True)
+    _index_handle: Optional[marqo.index.Index] = field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         """Initialize the Marqo client with the given API key and URL."""
         self.set_index(self.index)
 
+    @property
+    def embeds_server_side(self) -> bool:
+        """Marqo embeds documents and queries with the index's own model."""
+        return True
+
     def set_index(self, index):
         """Set the index for the Marqo client.
 
@@ -35,6 +51,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             logging.info(f"Created index '{index}'")
 
         self.index = index
+        self._index_handle = self.mq.index(index)
 
     def upsert_text(
             self,
@@ -67,14 +84,14 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         if namespace:
             doc['namespace'] = namespace
 
-        response = self.mq.index(self.index).add_documents([doc], tensor_fields=["Description"])
-        return response["items"][0]["_id"]
+        return self._add_documents([doc], tensor_fields=["Description"])[0]["_id"]
 
     def upsert_text_artifact(
             self,
             artifact: TextArtifact,
             namespace: Optional[str] = None,
             meta: Optional[dict] = None,
+            skip_existing: bool = False,
             **kwargs
     ) -> str:
         """Upsert a text artifact into the Marqo index.
@@ -82,23 +99,116 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         Args:
             artifact (TextArtifact): The text artifact to be indexed.
             namespace (Optional[str], optional): An optional namespace for the artifact.
-            meta (Optional[dict], optional): An optional dictionary of metadata for the artifact.
+            meta (Optional[dict], optional): An optional dictionary of metadata for the artifact, stored as top-level
+                document fields so queries can filter on them.
+            skip_existing (bool, optional): Whether to leave the document alone if its ID is already stored in the
+                namespace.
 
         Returns:
             str: The ID of the artifact that was added.
         """
 
-        artifact_json = artifact.to_json()
+        if skip_existing and self.has_id(self._artifact_id(artifact), namespace):
+            return self._artifact_id(artifact)
 
-        doc = {
-            "_id": artifact.id,
-            "Description": artifact.value,  # Description will be treated as tensor field
-            "artifact": str(artifact_json),
-            "namespace": namespace
-        }
+        doc = self._text_artifact_document(artifact, namespace, meta)
+
+        return self._add_documents([doc], tensor_fields=["Description", "artifact"])[0]["_id"]
 
-        response = self.mq.index(self.index).add_documents([doc], tensor_fields=["Description", "artifact"])
-        return response["items"][0]["_id"]
+    def _embed_text_artifact(self, artifact: TextArtifact) -> Union[list[float], Exception]:
+        """Skip local embedding, Marqo embeds documents itself when they are indexed.
+
+        Args:
+            artifact (TextArtifact): The text artifact to be indexed.
+
+        Returns:
+            Union[list[float], Exception]: An empty list, the embedding is never used.
+        """
+
+        return []
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[Union[list[float], Exception]]:
+        """Skip local embedding of a batch, Marqo embeds documents itself when they are indexed.
+
+        Args:
+            artifacts (list[TextArtifact]): The text artifacts to be indexed.
+
+        Returns:
+            list[Union[list[float], Exception]]: An empty list per artifact, the embeddings are never used.
+        """
+
+        return [[] for _ in artifacts]
+
+    def _upsert_text_artifact_batch(
+            self,
+            artifacts: list[TextArtifact],
+            embeddings: list[Union[list[float], Exception]],
+            namespace: Optional[str],
+            meta: Optional[dict],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        """Upsert a batch of text artifacts into the Marqo index with one multi-document request.
+
+        Args:
+            artifacts (list[TextArtifact]): The text artifacts to be indexed.
+            embeddings (list[Union[list[float], Exception]]): Unused, Marqo embeds the documents itself.
+            namespace (Optional[str]): The namespace of the artifacts.
+            meta (Optional[dict]): Metadata stored as top-level fields of every document.
+
+        Returns:
+            list[BaseVectorStoreDriver.UpsertResult]: The ID and error, if any, of every artifact.
+        """
+
+        docs = [self._text_artifact_document(artifact, namespace, meta) for artifact in artifacts]
+
+        try:
+            return [
+                BaseVectorStoreDriver.UpsertResult(
+                    id=item["_id"],
+                    error=Exception(item.get("error")) if item.get("status", 200) >= 400 else None
+                )
+                for item in self._add_documents(docs, tensor_fields=["Description", "artifact"])
+            ]
+        except Exception as e:
+            return [BaseVectorStoreDriver.UpsertResult(id=doc["_id"], error=e) for doc in docs]
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        """Delete a document from the Marqo index.
+
+        Args:
+            vector_id (str): The ID of the document to delete.
+            namespace (Optional[str], optional): The namespace of the document. Marqo document IDs are unique across
+                namespaces, so it isn't needed to locate the document.
+        """
+
+        self._index_handle.delete_documents(ids=[vector_id])
+
+    def delete_namespace(self, namespace: str) -> None:
+        """Delete every document in a namespace from the Marqo index.
+
+        Marqo can't delete by filter, so matching IDs are searched for a page at a time and deleted until none are
+        left.
+
+        Args:
+            namespace (str): The namespace to delete.
+        """
+
+        while True:
+            results = self._index_handle.search(
+                "",
+                limit=self.DELETE_BATCH_SIZE,
+                filter_string=f"namespace:({self._filter_value(namespace)})",
+                attributes_to_retrieve=["_id"]
+            )
+            ids = [r["_id"] for r in results["hits"]]
+
+            if len(ids) == 0:
+                break
+
+            self._index_handle.delete_documents(ids=ids)
+
+            if len(ids) < self.DELETE_BATCH_SIZE:
+                break
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a document entry from the Marqo index.
@@ -110,7 +220,13 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             Optional[BaseVectorStoreDriver.Entry]: The loaded Entry if found, otherwise None.
         """
-        result = self.mq.index(self.index).get_document(document_id=vector_id, expose_facets=True)
+        try:
+            result = self._index_handle.get_document(document_id=vector_id, expose_facets=True)
+        except marqo.errors.MarqoWebError as e:
+            if e.status_code == HTTPStatus.NOT_FOUND:
+                return None
+
+            raise
 
         if result and "_tensor_facets" in result and len(result["_tensor_facets"]) > 0:
             return BaseVectorStoreDriver.Entry(
@@ -121,24 +237,48 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             return None
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        """Check which IDs are stored in a namespace with a single get_documents request.
+
+        Args:
+            vector_ids (list[str]): The IDs to look up.
+            namespace (Optional[str], optional): The namespace the documents have to be in.
+
+        Returns:
+            list[bool]: Whether each ID is stored in the namespace.
+        """
+
+        if len(vector_ids) == 0:
+            return []
+
+        documents = self._index_handle.get_documents(document_ids=vector_ids)
+        found = {doc["_id"] for doc in documents["results"] if doc["_found"] and doc.get("namespace") == namespace}
+
+        return [vector_id in found for vector_id in vector_ids]
+
+    def load_entries(
+            self,
+            namespace: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None
+    ) -> list[BaseVectorStoreDriver.Entry]:
         """Load all document entries from the Marqo index.
 
         Args:
             namespace (Optional[str], optional): The namespace to filter entries by.
+            meta_filter (Optional[BaseMetaFilter], optional): A filter on document fields to filter entries by.
 
         Returns:
             list[BaseVectorStoreDriver.Entry]: The list of loaded Entries.
         """
 
-        filter_string = f"namespace:{namespace}" if namespace else None
-        results = self.mq.index(self.index).search("", limit=10000, filter_string=filter_string)
+        filter_string = self._filter_string(namespace, meta_filter)
+        results = self._index_handle.search("", limit=10000, filter_string=filter_string)
 
         # get all _id's from search results
         ids = [r["_id"] for r in results["hits"]]
 
         # get documents corresponding to the ids
-        documents = self.mq.index(self.index).get_documents(document_ids=ids, expose_facets=True)
+        documents = self._index_handle.get_documents(document_ids=ids, expose_facets=True)
 
         # for each document, if it's found, create an Entry object
         entries = []
@@ -162,6 +302,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             namespace: Optional[str] = None,
             include_vectors: bool = False,
             include_metadata=True,
+            meta_filter: Optional[BaseMetaFilter] = None,
             **kwargs
     ) -> list[BaseVectorStoreDriver.QueryResult]:
         """Query the Marqo index for documents.
@@ -172,6 +313,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             namespace (Optional[str], optional): The namespace to filter results by.
             include_vectors (bool, optional): Whether to include vector data in the results.
             include_metadata (bool, optional): Whether to include metadata in the results.
+            meta_filter (Optional[BaseMetaFilter], optional): A filter on document fields to filter results by.
 
         Returns:
             list[BaseVectorStoreDriver.QueryResult]: The list of query results.
@@ -180,23 +322,146 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         params = {
                      "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
                      "attributes_to_retrieve": ["*"] if include_metadata else ["_id"],
-                     "filter_string": f"namespace:{namespace}" if namespace else None
+                     "filter_string": self._filter_string(namespace, meta_filter)
                  } | kwargs
 
-        results = self.mq.index(self.index).search(query, **params)
+        results = self._index_handle.search(query, **params)
+
+        return self._query_results(results["hits"], include_vectors)
+
+    def query_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            include_metadata=True,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        """Query the Marqo index for many query strings with a single bulk search request.
+
+        Args:
+            queries (list[str]): The query strings.
+            count (Optional[int], optional): The maximum number of results to return per query.
+            namespace (Optional[str], optional): The namespace to filter results by.
+            include_vectors (bool, optional): Whether to include vector data in the results.
+            include_metadata (bool, optional): Whether to include metadata in the results.
+            meta_filter (Optional[BaseMetaFilter], optional): A filter on document fields to filter results by.
+
+        Returns:
+            list[list[BaseVectorStoreDriver.QueryResult]]: The list of query results for each query.
+        """
+
+        if len(queries) == 0:
+            return []
+
+        params = {
+            "index": self.index,
+            "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+            "attributesToRetrieve": ["*"] if include_metadata else ["_id"],
+            "filter": self._filter_string(namespace, meta_filter)
+        } | kwargs
+
+        results = self.mq.bulk_search([{"q": query} | params for query in queries])
+
+        return [self._query_results(result["hits"], include_vectors) for result in results["result"]]
+
+    def _query_results(self, hits: list[dict], include_vectors: bool) -> list[BaseVectorStoreDriver.QueryResult]:
+        if include_vectors and len(hits) > 0:
+            # Hydrate every hit's vector with a single get_documents request.
+            documents = self._index_handle.get_documents(document_ids=[r["_id"] for r in hits], expose_facets=True)
+            documents = {doc["_id"]: doc for doc in documents["results"] if doc.get("_found", True)}
+            hits = [
+                {**r, **{k: v for k, v in documents[r["_id"]].items() if k != "_found"}}
+                for r in hits if r["_id"] in documents
+            ]
 
-        if include_vectors:
-            results["hits"] = [ {**r, **self.mq.index(self.index).get_document(r["_id"], expose_facets=True)} for r in results["hits"] ]
-            
         return [
             BaseVectorStoreDriver.QueryResult(
                 vector=r["_tensor_facets"][0]["_embedding"] if include_vectors else [],
                 score=r["_score"],
                 meta={k: v for k, v in r.items() if k not in ["_score", "_tensor_facets"]},
             )
-            for r in results["hits"]
+            for r in hits
         ]
 
+    def _add_documents(self, docs: list[dict], tensor_fields: list[str]) -> list[dict]:
+        response = self._index_handle.add_documents(
+            docs, tensor_fields=tensor_fields, client_batch_size=self.client_batch_size
+        )
+
+        # With a client batch size the client returns one response per request it made.
+        responses = response if isinstance(response, list) else [response]
+
+        return [item for response in responses for item in response["items"]]
+
+    def _text_artifact_document(
+            self,
+            artifact: TextArtifact,
+            namespace: Optional[str],
+            meta: Optional[dict] = None
+    ) -> dict:
+        # Meta fields are stored alongside the reserved fields, which take precedence, so filters can reach them.
+        return (meta or {}) | {
+            "_id": self._artifact_id(artifact),
+            "Description": artifact.value,  # Description will be treated as tensor field
+            "artifact": str(artifact.to_json()),
+            "namespace": namespace
+        }
+
+    def _filter_string(self, namespace: Optional[str], meta_filter: Optional[BaseMetaFilter]) -> Optional[str]:
+        """Build a Marqo filter string from a namespace and a meta filter.
+
+        Args:
+            namespace (Optional[str]): The namespace to filter by.
+            meta_filter (Optional[BaseMetaFilter]): The meta filter to translate.
+
+        Returns:
+            Optional[str]: The filter string, or None when there is nothing to filter by.
+        """
+
+        clauses = [f"namespace:({self._filter_value(namespace)})"] if namespace else []
+
+        if meta_filter is not None:
+            clauses.append(f"({self._filter_clause(meta_filter)})")
+
+        return " AND ".join(clauses) if clauses else None
+
+    def _filter_clause(self, meta_filter: BaseMetaFilter) -> str:
+        if isinstance(meta_filter, EqualsMetaFilter):
+            return f"{meta_filter.key}:({self._filter_value(meta_filter.value)})"
+        elif isinstance(meta_filter, InMetaFilter):
+            # Marqo has no IN operator, and an empty filter string can't express matching nothing.
+            if len(meta_filter.values) == 0:
+                raise ValueError("in filters need at least one value")
+
+            return " OR ".join(f"{meta_filter.key}:({self._filter_value(value)})" for value in meta_filter.values)
+        elif isinstance(meta_filter, RangeMetaFilter):
+            # Marqo ranges are inclusive, so exclusive bounds are excluded explicitly.
+            lower = "*" if meta_filter.lower is None else self._filter_value(meta_filter.lower)
+            upper = "*" if meta_filter.upper is None else self._filter_value(meta_filter.upper)
+            clauses = [f"{meta_filter.key}:[{lower} TO {upper}]"] + [
+                f"NOT {meta_filter.key}:({self._filter_value(bound)})"
+                for bound in [meta_filter.gt, meta_filter.lt] if bound is not None
+            ]
+
+            return " AND ".join(clauses)
+        elif isinstance(meta_filter, AndMetaFilter):
+            return " AND ".join(f"({self._filter_clause(f)})" for f in meta_filter.filters)
+        elif isinstance(meta_filter, OrMetaFilter):
+            return " OR ".join(f"({self._filter_clause(f)})" for f in meta_filter.filters)
+        else:
+            raise ValueError(f"unsupported meta filter: {type(meta_filter).__name__}")
+
+    def _filter_value(self, value: Any) -> str:
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        else:
+            return re.sub(r'([\\\s():\[\]{}"+\-!^~*?&|/])', r"\\\1", str(value))
+
     def create_index(self, name: str, **kwargs) -> Dict[str, Any]:
         """Create a new index in the Marqo client.
 
@@ -1,22 +1,37 @@
-from typing import Optional
-from pymongo import MongoClient
+import asyncio
+import inspect
+from typing import Optional, Iterator, Any
+from bson import ObjectId
+from pymongo import MongoClient, InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError, WriteError
 from attr import define, field, Factory
 from pymongo.collection import Collection
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.filters import (
+    BaseMetaFilter, EqualsMetaFilter, InMetaFilter, RangeMetaFilter, AndMetaFilter, OrMetaFilter
+)
 
 
 @define
 class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
+    LOAD_BATCH_SIZE = 1000
+
     connection_string: str = field(kw_only=True)
     database_name: str = field(kw_only=True)
     collection_name: str = field(kw_only=True)
     client: MongoClient = field(
         default=Factory(lambda self: MongoClient(self.connection_string), takes_self=True)
     )
+    # Optional asyncio client for the same cluster, such as motor's AsyncIOMotorClient or pymongo's AsyncMongoClient.
+    # When set, the async methods talk to MongoDB natively instead of running the blocking client on threads.
+    async_client: Optional[Any] = field(default=None, kw_only=True)
 
     def get_collection(self) -> Collection:
         return self.client[self.database_name][self.collection_name]
 
+    def get_async_collection(self) -> Any:
+        return self.async_client[self.database_name][self.collection_name]
+
     def upsert_vector(
             self,
             vector: list[float],
@@ -26,6 +41,7 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             **kwargs
     ) -> str:
         collection = self.get_collection()
+        vector = self._reduce_vectors([vector], train=True)[0]
 
         if vector_id is None:
             result = collection.insert_one(
@@ -48,36 +64,100 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             )
         return vector_id
 
+    def _upsert_vector_batch(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        results, requests = self._bulk_write_requests(entries)
+
+        try:
+            # Unordered writes keep going past failed documents so errors can be reported per entry.
+            self.get_collection().bulk_write(requests, ordered=False)
+        except BulkWriteError as e:
+            self._apply_write_errors(results, e)
+
+        return results
+
+    def _bulk_write_requests(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry]
+    ) -> tuple[list[BaseVectorStoreDriver.UpsertResult], list]:
+        results = []
+        requests = []
+
+        for entry in entries:
+            document = {
+                "vector": entry.vector,
+                "namespace": entry.namespace,
+                "meta": entry.meta,
+            }
+
+            if entry.id is None:
+                vector_id = ObjectId()
+
+                requests.append(InsertOne({"_id": vector_id} | document))
+            else:
+                vector_id = entry.id
+
+                requests.append(ReplaceOne({"_id": vector_id}, document, upsert=True))
+
+            results.append(BaseVectorStoreDriver.UpsertResult(id=str(vector_id)))
+
+        return results, requests
+
+    def _apply_write_errors(self, results: list[BaseVectorStoreDriver.UpsertResult], error: BulkWriteError) -> None:
+        for write_error in error.details.get("writeErrors", []):
+            results[write_error["index"]].error = WriteError(
+                write_error.get("errmsg"), write_error.get("code"), write_error
+            )
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        self.get_collection().delete_one(
+            {"_id": vector_id} | ({} if namespace is None else {"namespace": namespace})
+        )
+
+    def delete_namespace(self, namespace: str) -> None:
+        self.get_collection().delete_many({"namespace": namespace})
+
     def load_entry(
             self, vector_id: str, namespace: Optional[str] = None
     ) -> Optional[BaseVectorStoreDriver.Entry]:
         collection = self.get_collection()
-        doc = collection.find_one({"_id": vector_id})
+        doc = collection.find_one(
+            {"_id": vector_id} | ({} if namespace is None else {"namespace": namespace}),
+            self._projection(include_vectors=True)
+        )
         if doc is None:
             return None
-        return BaseVectorStoreDriver.Entry(
-            id=str(doc["_id"]),
-            vector=doc["vector"],
-            namespace=doc["namespace"],
-            meta=doc["meta"],
-        )
+        return self._entry(doc)
+
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        collection = self.get_collection()
+        found = {
+            doc["_id"] for doc in collection.find(
+                {"_id": {"$in": vector_ids}} | ({} if namespace is None else {"namespace": namespace}),
+                {"_id": 1}
+            )
+        }
+
+        return [vector_id in found for vector_id in vector_ids]
 
     def load_entries(
-            self, namespace: Optional[str] = None
-    ) -> list[BaseVectorStoreDriver.Entry]:
+            self,
+            namespace: Optional[str] = None,
+            include_vectors: bool = True,
+            batch_size: Optional[int] = None,
+            meta_filter: Optional[BaseMetaFilter] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
         collection = self.get_collection()
-        if namespace is None:
-            cursor = collection.find()
-        else:
-            cursor = collection.find({"namespace": namespace})
+        cursor = collection.find(
+            self._find_filter(namespace, meta_filter),
+            self._projection(include_vectors)
+        ).batch_size(batch_size if batch_size else self.LOAD_BATCH_SIZE)
 
         for doc in cursor:
-            yield BaseVectorStoreDriver.Entry(
-                id=str(doc["_id"]),
-                vector=doc["vector"],
-                namespace=doc["namespace"],
-                meta=doc["meta"],
-            )
+            yield self._entry(doc)
 
     def query(
             self,
@@ -87,13 +167,70 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             include_vectors: bool = False,
             offset: Optional[int] = 0,
             index: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
             **kwargs
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        collection = self.get_collection()
-
         # Using the embedding driver to convert the query string into a vector
         vector = self.embedding_driver.embed_string(query)
 
+        return self._query_vector(vector, count, namespace, include_vectors, offset, index, meta_filter)
+
+    def query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            offset: Optional[int] = 0,
+            index: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        return self._query_vector(vector, count, namespace, include_vectors, offset, index, meta_filter)
+
+    def query_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            offset: Optional[int] = 0,
+            index: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        # Atlas has no multi-query search stage, so queries are embedded together and searched concurrently.
+        return list(self.futures_executor.map(
+            lambda vector: self._query_vector(vector, count, namespace, include_vectors, offset, index, meta_filter),
+            self._embed_strings(queries)
+        ))
+
+    def _query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int],
+            namespace: Optional[str],
+            include_vectors: bool,
+            offset: Optional[int],
+            index: Optional[str],
+            meta_filter: Optional[BaseMetaFilter] = None
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        collection = self.get_collection()
+        vector = self._reduce_vectors([vector])[0]
+        pipeline = self._query_pipeline(vector, count, namespace, include_vectors, offset, index, meta_filter)
+
+        return [self._query_result(doc, include_vectors) for doc in collection.aggregate(pipeline)]
+
+    def _query_pipeline(
+            self,
+            vector: list[float],
+            count: Optional[int],
+            namespace: Optional[str],
+            include_vectors: bool,
+            offset: Optional[int],
+            index: Optional[str],
+            meta_filter: Optional[BaseMetaFilter]
+    ) -> list[dict]:
         knn_k = count if count else 10
         pipeline = [
             {
@@ -106,11 +243,7 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
                 }
             },
             {
-                "$project": {
-                    "_id": 1,
-                    "vector": 1,
-                    "namespace": 1,
-                    "meta": 1,
+                "$project": self._projection(include_vectors) | {
                     "score": {"$meta": "searchScore"}  # Include the score in the projection
                 }
             },
@@ -121,14 +254,261 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
         if index:
             pipeline[0]["$search"]["index"] = index
 
-        results = [
-            BaseVectorStoreDriver.QueryResult(
-                vector=doc["vector"] if include_vectors else None,
-                score=doc["score"],  # Include the score in the result
-                meta=doc["meta"],
-                namespace=namespace,
-            )
-            for doc in list(collection.aggregate(pipeline))
-        ]
+        search_filter = self._search_filter(namespace, meta_filter)
+
+        if search_filter:
+            pipeline[0]["$search"]["knnBeta"]["filter"] = search_filter
+
+        return pipeline
+
+    def _query_result(self, doc: dict, include_vectors: bool) -> BaseVectorStoreDriver.QueryResult:
+        return BaseVectorStoreDriver.QueryResult(
+            vector=doc["vector"] if include_vectors else None,
+            score=doc["score"],  # Include the score in the result
+            meta=doc["meta"],
+            namespace=doc["namespace"],
+        )
+
+    def _search_filter(self, namespace: Optional[str], meta_filter: Optional[BaseMetaFilter]) -> Optional[dict]:
+        # Filters are applied by the search stage itself, before the k nearest neighbours are picked. Atlas only
+        # supports equals and in on string fields indexed with the token type, so namespace and filtered string meta
+        # fields need token mappings in the search index.
+        clauses = [{"equals": {"path": "namespace", "value": namespace}}] if namespace is not None else []
+
+        if meta_filter is not None:
+            clauses.append(self._search_operator(meta_filter))
+
+        if len(clauses) == 0:
+            return None
+        elif len(clauses) == 1:
+            return clauses[0]
+        else:
+            return {"compound": {"filter": clauses}}
+
+    def _search_operator(self, meta_filter: BaseMetaFilter) -> dict:
+        if isinstance(meta_filter, EqualsMetaFilter):
+            return {"equals": {"path": f"meta.{meta_filter.key}", "value": meta_filter.value}}
+        elif isinstance(meta_filter, InMetaFilter):
+            return {"in": {"path": f"meta.{meta_filter.key}", "value": list(meta_filter.values)}}
+        elif isinstance(meta_filter, RangeMetaFilter):
+            return {"range": {"path": f"meta.{meta_filter.key}"} | self._bounds(meta_filter, "")}
+        elif isinstance(meta_filter, AndMetaFilter):
+            return {"compound": {"filter": [self._search_operator(f) for f in meta_filter.filters]}}
+        elif isinstance(meta_filter, OrMetaFilter):
+            return {
+                "compound": {
+                    "should": [self._search_operator(f) for f in meta_filter.filters],
+                    "minimumShouldMatch": 1
+                }
+            }
+        else:
+            raise ValueError(f"unsupported meta filter: {type(meta_filter).__name__}")
+
+    def _find_filter(self, namespace: Optional[str], meta_filter: Optional[BaseMetaFilter]) -> dict:
+        return (
+            ({} if namespace is None else {"namespace": namespace})
+            | ({} if meta_filter is None else self._query_operator(meta_filter))
+        )
+
+    def _query_operator(self, meta_filter: BaseMetaFilter) -> dict:
+        if isinstance(meta_filter, EqualsMetaFilter):
+            return {f"meta.{meta_filter.key}": {"$eq": meta_filter.value}}
+        elif isinstance(meta_filter, InMetaFilter):
+            return {f"meta.{meta_filter.key}": {"$in": list(meta_filter.values)}}
+        elif isinstance(meta_filter, RangeMetaFilter):
+            return {f"meta.{meta_filter.key}": self._bounds(meta_filter, "$")}
+        elif isinstance(meta_filter, AndMetaFilter):
+            return {"$and": [self._query_operator(f) for f in meta_filter.filters]}
+        elif isinstance(meta_filter, OrMetaFilter):
+            return {"$or": [self._query_operator(f) for f in meta_filter.filters]}
+        else:
+            raise ValueError(f"unsupported meta filter: {type(meta_filter).__name__}")
+
+    def _bounds(self, meta_filter: RangeMetaFilter, prefix: str) -> dict:
+        bounds = {"gt": meta_filter.gt, "gte": meta_filter.gte, "lt": meta_filter.lt, "lte": meta_filter.lte}
+
+        return {f"{prefix}{op}": bound for op, bound in bounds.items() if bound is not None}
+
+    def _projection(self, include_vectors: bool) -> dict:
+        return {"_id": 1, "namespace": 1, "meta": 1} | ({"vector": 1} if include_vectors else {})
+
+    def _entry(self, doc: dict) -> BaseVectorStoreDriver.Entry:
+        return BaseVectorStoreDriver.Entry(
+            id=str(doc["_id"]),
+            vector=doc.get("vector", []),
+            namespace=doc.get("namespace"),
+            meta=doc.get("meta"),
+        )
+
+    async def aupsert_vector(
+            self,
+            vector: list[float],
+            vector_id: Optional[str] = None,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> str:
+        if self.async_client is None:
+            return await super().aupsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+
+        collection = self.get_async_collection()
+        document = {
+            "vector": self._reduce_vectors([vector], train=True)[0],
+            "namespace": namespace,
+            "meta": meta,
+        }
+
+        if vector_id is None:
+            result = await collection.insert_one(document)
+            vector_id = str(result.inserted_id)
+        else:
+            await collection.replace_one({"_id": vector_id}, document, upsert=True)
+
+        return vector_id
+
+    async def aupsert_vectors(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry],
+            batch_size: Optional[int] = None,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        if self.async_client is None:
+            return await super().aupsert_vectors(entries, batch_size=batch_size, **kwargs)
+
+        collection = self.get_async_collection()
+        batch_size = batch_size if batch_size else self.upsert_batch_size
+        results = []
+
+        for i in range(0, len(entries), batch_size):
+            batch = entries[i:i + batch_size]
+
+            try:
+                batch_results, requests = self._bulk_write_requests(self._reduce_entries(batch))
+
+                await collection.bulk_write(requests, ordered=False)
+            except BulkWriteError as e:
+                self._apply_write_errors(batch_results, e)
+            except Exception as e:
+                batch_results = [BaseVectorStoreDriver.UpsertResult(id=entry.id, error=e) for entry in batch]
+
+            results.extend(batch_results)
 
         return results
+
+    async def adelete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        if self.async_client is None:
+            return await super().adelete_vector(vector_id, namespace=namespace)
+
+        await self.get_async_collection().delete_one(
+            {"_id": vector_id} | ({} if namespace is None else {"namespace": namespace})
+        )
+
+    async def adelete_namespace(self, namespace: str) -> None:
+        if self.async_client is None:
+            return await super().adelete_namespace(namespace)
+
+        await self.get_async_collection().delete_many({"namespace": namespace})
+
+    async def aload_entry(
+            self, vector_id: str, namespace: Optional[str] = None
+    ) -> Optional[BaseVectorStoreDriver.Entry]:
+        if self.async_client is None:
+            return await super().aload_entry(vector_id, namespace=namespace)
+
+        doc = await self.get_async_collection().find_one(
+            {"_id": vector_id} | ({} if namespace is None else {"namespace": namespace}),
+            self._projection(include_vectors=True)
+        )
+
+        return None if doc is None else self._entry(doc)
+
+    async def aload_entries(
+            self,
+            namespace: Optional[str] = None,
+            include_vectors: bool = True,
+            batch_size: Optional[int] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        if self.async_client is None:
+            return await super().aload_entries(
+                namespace, include_vectors=include_vectors, batch_size=batch_size, meta_filter=meta_filter, **kwargs
+            )
+
+        cursor = self.get_async_collection().find(
+            self._find_filter(namespace, meta_filter),
+            self._projection(include_vectors)
+        ).batch_size(batch_size if batch_size else self.LOAD_BATCH_SIZE)
+
+        return [self._entry(doc) async for doc in cursor]
+
+    async def aquery(
+            self,
+            query: str,
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            offset: Optional[int] = 0,
+            index: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        if self.async_client is None:
+            return await super().aquery(
+                query, count, namespace, include_vectors, offset=offset, index=index, meta_filter=meta_filter, **kwargs
+            )
+
+        # Embedding drivers are blocking, so only the embedding runs on a thread.
+        vector = await self._run_async(self.embedding_driver.embed_string, query)
+
+        return await self._aquery_vector(vector, count, namespace, include_vectors, offset, index, meta_filter)
+
+    async def aquery_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            offset: Optional[int] = 0,
+            index: Optional[str] = None,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        if self.async_client is None:
+            return await super().aquery_many(
+                queries,
+                count,
+                namespace,
+                include_vectors,
+                offset=offset,
+                index=index,
+                meta_filter=meta_filter,
+                **kwargs
+            )
+
+        vectors = await self._run_async(self._embed_strings, queries)
+
+        return list(await asyncio.gather(*[
+            self._aquery_vector(vector, count, namespace, include_vectors, offset, index, meta_filter)
+            for vector in vectors
+        ]))
+
+    async def _aquery_vector(
+            self,
+            vector: list[float],
+            count: Optional[int],
+            namespace: Optional[str],
+            include_vectors: bool,
+            offset: Optional[int],
+            index: Optional[str],
+            meta_filter: Optional[BaseMetaFilter]
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        vector = self._reduce_vectors([vector])[0]
+        pipeline = self._query_pipeline(vector, count, namespace, include_vectors, offset, index, meta_filter)
+        cursor = self.get_async_collection().aggregate(pipeline)
+
+        # motor returns the cursor directly, pymongo's async client returns a coroutine that resolves to it.
+        if inspect.isawaitable(cursor):
+            cursor = await cursor
+
+        return [self._query_result(doc, include_vectors) async for doc in cursor]
@@ -1,26 +1,39 @@
-from typing import Optional
-from griptape import utils
+import itertools
+import logging
+import warnings
+from typing import Optional, Iterator
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.filters import (
+    BaseMetaFilter, EqualsMetaFilter, InMetaFilter, RangeMetaFilter, AndMetaFilter, OrMetaFilter
+)
 import pinecone
 from attr import define, field
 
 
 @define
 class PineconeVectorStoreDriver(BaseVectorStoreDriver):
+    LOAD_BATCH_SIZE = 100
+    QUERY_ENTRIES_LIMIT = 10000
+
     api_key: str = field(kw_only=True)
     index_name: str = field(kw_only=True)
-    environment: str = field(kw_only=True)
+    # Only used to create pod-based indexes; the client finds existing indexes by name.
+    environment: Optional[str] = field(default=None, kw_only=True)
+    # Deprecated and ignored: pinecone-client 3 resolves the project from the API key.
     project_name: Optional[str] = field(default=None, kw_only=True)
+    client: pinecone.Pinecone = field(init=False)
     index: pinecone.Index = field(init=False)
 
     def __attrs_post_init__(self) -> None:
-        pinecone.init(
-            api_key=self.api_key,
-            environment=self.environment,
-            project_name=self.project_name
-        )
+        if self.project_name is not None:
+            warnings.warn(
+                "project_name is deprecated and ignored: the project is resolved from the API key",
+                DeprecationWarning,
+                stacklevel=3
+            )
 
-        self.index = pinecone.Index(self.index_name)
+        self.client = pinecone.Pinecone(api_key=self.api_key)
+        self.index = self.client.Index(self.index_name)
 
     def upsert_vector(
             self,
@@ -30,7 +43,8 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             meta: Optional[dict] = None,
             **kwargs
     ) -> str:
-        vector_id = vector_id if vector_id else utils.str_to_hash(str(vector))
+        vector = self._reduce_vectors([vector], train=True)[0]
+        vector_id = vector_id if vector_id else self._vector_id(vector)
 
         params = {
             "namespace": namespace
@@ -40,79 +54,247 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
 
         return vector_id
 
+    def _upsert_vector_batch(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        vector_ids = [entry.id if entry.id else self._vector_id(entry.vector) for entry in entries]
+        namespaces = {}
+
+        # Pinecone upserts target a single namespace, so send one request per namespace in the batch.
+        for vector_id, entry in zip(vector_ids, entries):
+            namespaces.setdefault(entry.namespace, []).append((vector_id, entry.vector, entry.meta))
+
+        for namespace, vectors in namespaces.items():
+            params = {
+                "namespace": namespace
+            } | kwargs
+
+            self.index.upsert(vectors, **params)
+
+        return [BaseVectorStoreDriver.UpsertResult(id=vector_id) for vector_id in vector_ids]
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        self.index.delete(ids=[vector_id], namespace=namespace)
+
+    def delete_namespace(self, namespace: str) -> None:
+        self.index.delete(delete_all=True, namespace=namespace)
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
-        vectors = list(result["vectors"].values())
+        return next(self._fetch_entries([vector_id], namespace), None)
 
-        if len(vectors) > 0:
-            vector = vectors[0]
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        found = set()
 
-            return BaseVectorStoreDriver.Entry(
-                id=vector["id"],
-                meta=vector["metadata"],
-                vector=vector["values"],
-                namespace=result["namespace"]
-            )
-        else:
-            return None
+        for i in range(0, len(vector_ids), self.LOAD_BATCH_SIZE):
+            response = self.index.fetch(ids=vector_ids[i:i + self.LOAD_BATCH_SIZE], namespace=namespace)
 
-    def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        # This is a hacky way to query up to 10,000 values from Pinecone. Waiting on an official API for fetching
-        # all values from a namespace:
-        # https://community.pinecone.io/t/is-there-a-way-to-query-all-the-vectors-and-or-metadata-from-a-namespace/797/5
+            found.update(response.to_dict()["vectors"])
 
-        results = self.index.query(
-            self.embedding_driver.embed_string(""),
-            top_k=10000,
+        return [vector_id in found for vector_id in vector_ids]
+
+    def load_entries(
+            self,
+            namespace: Optional[str] = None,
+            batch_size: Optional[int] = None,
+            meta_filter: Optional[BaseMetaFilter] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Stream every entry in a namespace: ids are listed a page at a time and each page is fetched in one request.
+
+        Pod-based indexes can't list ids, in which case entries come from a single query capped at QUERY_ENTRIES_LIMIT
+        matches. Listing can't filter by metadata, so meta_filter is applied to fetched pages; queries filter natively.
+        """
+        batch_size = batch_size if batch_size else self.LOAD_BATCH_SIZE
+        pages = self._list_vector_ids(namespace, batch_size)
+
+        try:
+            first_page = next(pages, None)
+        except pinecone.PineconeApiException:
+            yield from self._query_entries(namespace, meta_filter)
+
+            return
+
+        for vector_ids in itertools.chain([first_page] if first_page else [], pages):
+            for entry in self._fetch_entries(vector_ids, namespace):
+                if meta_filter is None or meta_filter.matches(entry.meta):
+                    yield entry
+
+    def query(
+            self,
+            query: str,
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            # PineconeVectorStorageDriver-specific params:
             include_metadata=True,
-            namespace=namespace
-        )
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        vector = self._embed_string(query)
+
+        return self.query_vector(vector, count, namespace, include_vectors, include_metadata=include_metadata, **kwargs)
+
+    def query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            meta_filter: Optional[BaseMetaFilter] = None,
+            # PineconeVectorStorageDriver-specific params:
+            include_metadata=True,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        params = {
+            "top_k": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+            "namespace": namespace,
+            "include_values": include_vectors,
+            "include_metadata": include_metadata
+        } | self._filter_params(meta_filter) | kwargs
+
+        results = self.index.query(vector=self._reduce_vectors([vector])[0], **params)
 
         return [
-            BaseVectorStoreDriver.Entry(
-                id=r["id"],
+            BaseVectorStoreDriver.QueryResult(
                 vector=r["values"],
+                score=r["score"],
                 meta=r["metadata"],
                 namespace=results["namespace"]
             )
             for r in results["matches"]
         ]
 
-    def query(
+    def query_many(
             self,
-            query: str,
+            queries: list[str],
             count: Optional[int] = None,
             namespace: Optional[str] = None,
             include_vectors: bool = False,
+            meta_filter: Optional[BaseMetaFilter] = None,
             # PineconeVectorStorageDriver-specific params:
             include_metadata=True,
             **kwargs
-    ) -> list[BaseVectorStoreDriver.QueryResult]:
-        vector = self.embedding_driver.embed_string(query)
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        if len(queries) == 0:
+            return []
 
         params = {
             "top_k": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
             "namespace": namespace,
             "include_values": include_vectors,
             "include_metadata": include_metadata
-        } | kwargs
+        } | self._filter_params(meta_filter) | kwargs
 
-        results = self.index.query(vector, **params)
+        # The API takes one query vector per request, so the queries are sent concurrently.
+        results = self.futures_executor.map(
+            lambda vector: self.index.query(vector=vector, **params), self._embed_strings(queries)
+        )
 
         return [
-            BaseVectorStoreDriver.QueryResult(
+            [
+                BaseVectorStoreDriver.QueryResult(
+                    vector=r["values"],
+                    score=r["score"],
+                    meta=r["metadata"],
+                    namespace=result["namespace"]
+                )
+                for r in result["matches"]
+            ]
+            for result in results
+        ]
+
+    def _list_vector_ids(self, namespace: Optional[str], batch_size: int) -> Iterator[list[str]]:
+        pagination_token = None
+
+        while True:
+            params = {
+                "namespace": namespace,
+                "limit": batch_size
+            } | ({"pagination_token": pagination_token} if pagination_token else {})
+
+            response = self.index.list_paginated(**params)
+            vector_ids = [vector.id for vector in response.vectors]
+
+            if len(vector_ids) > 0:
+                yield vector_ids
+
+            pagination_token = response.pagination.next if response.pagination else None
+
+            if not pagination_token:
+                break
+
+    def _fetch_entries(self, vector_ids: list[str], namespace: Optional[str]) -> Iterator[BaseVectorStoreDriver.Entry]:
+        result = self.index.fetch(ids=vector_ids, namespace=namespace).to_dict()
+        vectors = result["vectors"]
+
+        # Vectors deleted since their ids were listed are missing from the response.
+        for vector_id in vector_ids:
+            if vector_id in vectors:
+                vector = vectors[vector_id]
+
+                yield BaseVectorStoreDriver.Entry(
+                    id=vector["id"],
+                    meta=vector.get("metadata"),
+                    vector=vector["values"],
+                    namespace=result["namespace"]
+                )
+
+    def _query_entries(
+            self,
+            namespace: Optional[str],
+            meta_filter: Optional[BaseMetaFilter] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        stats = self.index.describe_index_stats()
+        vector_count = stats["namespaces"].get(namespace if namespace else "", {}).get("vector_count", 0)
+
+        if vector_count > self.QUERY_ENTRIES_LIMIT:
+            logging.warning(
+                f"Pinecone can't list ids for this index; loading {self.QUERY_ENTRIES_LIMIT} of {vector_count} entries"
+            )
+
+        # Every vector matches a query when top_k covers the namespace, so any non-zero vector works and no embedding
+        # is needed.
+        vector = [1.0] + [0.0] * (stats["dimension"] - 1)
+        results = self.index.query(
+            vector=vector,
+            top_k=self.QUERY_ENTRIES_LIMIT,
+            include_values=True,
+            include_metadata=True,
+            namespace=namespace,
+            **self._filter_params(meta_filter)
+        )
+
+        for r in results["matches"]:
+            yield BaseVectorStoreDriver.Entry(
+                id=r["id"],
                 vector=r["values"],
-                score=r["score"],
                 meta=r["metadata"],
                 namespace=results["namespace"]
             )
-            for r in results["matches"]
-        ]
+
+    def _filter_params(self, meta_filter: Optional[BaseMetaFilter]) -> dict:
+        return {} if meta_filter is None else {"filter": self._translate_filter(meta_filter)}
+
+    def _translate_filter(self, meta_filter: BaseMetaFilter) -> dict:
+        if isinstance(meta_filter, EqualsMetaFilter):
+            return {meta_filter.key: {"$eq": meta_filter.value}}
+        elif isinstance(meta_filter, InMetaFilter):
+            return {meta_filter.key: {"$in": list(meta_filter.values)}}
+        elif isinstance(meta_filter, RangeMetaFilter):
+            bounds = {"$gt": meta_filter.gt, "$gte": meta_filter.gte, "$lt": meta_filter.lt, "$lte": meta_filter.lte}
+
+            return {meta_filter.key: {op: bound for op, bound in bounds.items() if bound is not None}}
+        elif isinstance(meta_filter, AndMetaFilter):
+            return {"$and": [self._translate_filter(f) for f in meta_filter.filters]}
+        elif isinstance(meta_filter, OrMetaFilter):
+            return {"$or": [self._translate_filter(f) for f in meta_filter.filters]}
+        else:
+            raise ValueError(f"unsupported meta filter: {type(meta_filter).__name__}")
 
     def create_index(self, name: str, **kwargs) -> None:
         params = {
             "name": name,
             "dimension": self.embedding_driver.dimensions
-        } | kwargs
+        } | ({"spec": pinecone.PodSpec(environment=self.environment)} if self.environment else {}) | kwargs
 
-        pinecone.create_index(**params)
+        self.client.create_index(**params)
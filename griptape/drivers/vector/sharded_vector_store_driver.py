@@ -0,0 +1,337 @@
+import heapq
+import itertools
+import threading
+import time
+import zlib
+from concurrent import futures
+from dataclasses import dataclass
+from typing import Optional, Union, Callable, Iterator
+from attr import define, field, Factory
+from griptape.artifacts import TextArtifact
+from griptape.drivers import BaseVectorStoreDriver, BaseEmbeddingDriver
+
+
+@define
+class ShardedVectorStoreDriver(BaseVectorStoreDriver):
+    """Splits one logical vector store across several shard drivers.
+
+    With "hash" routing every namespace is spread over all shards by vector ID, so queries fan out to every shard; with
+    "namespace" routing each namespace lives on a single shard, so namespaced reads and queries touch only that shard.
+    Queries are embedded once, searched on the shards concurrently and the per-shard top-k lists are merged with a heap.
+    Shards that can't search by vector are sent the query text instead.
+
+    embedding_driver defaults to the first shard's. Query text is only embedded once when every shard embeds with the
+    same class and model as embedding_driver; otherwise, or when a shard embeds server-side, every shard is sent the
+    query text and embeds text artifacts itself, so each searches its own vector space.
+
+    Text artifacts are routed by their ID but stored by their shard, so content_addressed_ids has to be set the same on
+    this driver and on every shard.
+    """
+
+    @dataclass
+    class ShardStats:
+        query_count: int = 0
+        total_latency: float = 0.0
+        last_latency: float = 0.0
+
+        @property
+        def mean_latency(self) -> float:
+            return self.total_latency / self.query_count if self.query_count > 0 else 0.0
+
+    shards: list[BaseVectorStoreDriver] = field(kw_only=True)
+    embedding_driver: Optional[BaseEmbeddingDriver] = field(
+        default=Factory(lambda self: self.shards[0].embedding_driver if self.shards else None, takes_self=True),
+        kw_only=True
+    )
+    routing: str = field(default="hash", kw_only=True)
+    # Shard calls run on their own executor: the shards fan out over their futures_executor themselves and must not
+    # wait on it from one of its own workers.
+    shard_executor: futures.Executor = field(
+        default=Factory(lambda self: futures.ThreadPoolExecutor(max_workers=max(1, len(self.shards))), takes_self=True),
+        kw_only=True
+    )
+    shard_stats: list[ShardStats] = field(init=False)
+    # Whether every shard searches the vector space of embedding_driver, so queries can be embedded once for all.
+    _shared_embeddings: bool = field(default=True, init=False)
+    _stats_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if len(self.shards) == 0:
+            raise ValueError("at least one shard is required")
+
+        if self.routing not in ["hash", "namespace"]:
+            raise ValueError(f"unsupported routing: {self.routing}")
+
+        self.shard_stats = [ShardedVectorStoreDriver.ShardStats() for _ in self.shards]
+        self._shared_embeddings = all(
+            not shard.embeds_server_side
+            and self._embedding_model(shard.embedding_driver) == self._embedding_model(self.embedding_driver)
+            for shard in self.shards
+        )
+
+    @property
+    def embeds_server_side(self) -> bool:
+        return any(shard.embeds_server_side for shard in self.shards)
+
+    def shard_for(self, vector_id: str, namespace: Optional[str] = None) -> int:
+        key = (namespace if namespace else "") if self.routing == "namespace" else vector_id
+
+        return zlib.crc32(key.encode()) % len(self.shards)
+
+    def upsert_vector(
+            self,
+            vector: list[float],
+            vector_id: Optional[str] = None,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> str:
+        vector_id = vector_id if vector_id else self._vector_id(vector)
+
+        return self.shards[self.shard_for(vector_id, namespace)].upsert_vector(
+            vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
+        )
+
+    def upsert_text_artifact(
+            self,
+            artifact: TextArtifact,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> str:
+        return self.shards[self.shard_for(self._artifact_id(artifact), namespace)].upsert_text_artifact(
+            artifact, namespace=namespace, meta=meta, **kwargs
+        )
+
+    def _upsert_vector_batch(
+            self,
+            entries: list[BaseVectorStoreDriver.Entry],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        entries = [
+            entry if entry.id else BaseVectorStoreDriver.Entry(
+                id=self._vector_id(entry.vector),
+                vector=entry.vector,
+                meta=entry.meta,
+                namespace=entry.namespace,
+                artifact=entry.artifact
+            ) for entry in entries
+        ]
+
+        return self._scatter(
+            [(self.shard_for(entry.id, entry.namespace), entry.id, entry) for entry in entries],
+            lambda shard, shard_entries: shard.upsert_vectors(shard_entries, batch_size=len(shard_entries), **kwargs)
+        )
+
+    def _upsert_text_artifact_batch(
+            self,
+            artifacts: list[TextArtifact],
+            embeddings: list[Union[list[float], Exception]],
+            namespace: Optional[str],
+            meta: Optional[dict],
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        # Shards build their own entries so they can keep artifacts the way they normally do.
+        vector_ids = [self._artifact_id(artifact) for artifact in artifacts]
+
+        return self._scatter(
+            [
+                (self.shard_for(vector_id, namespace), vector_id, (artifact, embedding))
+                for vector_id, artifact, embedding in zip(vector_ids, artifacts, embeddings)
+            ],
+            lambda shard, items: shard._upsert_text_artifact_batch(
+                [artifact for artifact, _ in items],
+                [embedding for _, embedding in items]
+                if self._shared_embeddings else shard._embed_text_artifacts([artifact for artifact, _ in items]),
+                namespace,
+                meta,
+                **kwargs
+            )
+        )
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[Union[list[float], Exception]]:
+        if self._shared_embeddings:
+            return super()._embed_text_artifacts(artifacts)
+        else:
+            # Every shard embeds its own artifacts in _upsert_text_artifact_batch.
+            return [[] for _ in artifacts]
+
+    def delete_vector(self, vector_id: str, namespace: Optional[str] = None) -> None:
+        self.shards[self.shard_for(vector_id, namespace)].delete_vector(vector_id, namespace=namespace)
+
+    def delete_namespace(self, namespace: str) -> None:
+        for future in [
+            self.shard_executor.submit(self.shards[i].delete_namespace, namespace)
+            for i in self._namespace_shards(namespace)
+        ]:
+            future.result()
+
+    def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
+        return self.shards[self.shard_for(vector_id, namespace)].load_entry(vector_id, namespace=namespace)
+
+    def has_ids(self, vector_ids: list[str], namespace: Optional[str] = None) -> list[bool]:
+        groups = {}
+
+        for position, vector_id in enumerate(vector_ids):
+            groups.setdefault(self.shard_for(vector_id, namespace), []).append(position)
+
+        shard_futures = {
+            shard_index: self.shard_executor.submit(
+                self.shards[shard_index].has_ids, [vector_ids[position] for position in positions], namespace
+            )
+            for shard_index, positions in groups.items()
+        }
+        found = [False] * len(vector_ids)
+
+        for shard_index, future in shard_futures.items():
+            for position, exists in zip(groups[shard_index], future.result()):
+                found[position] = exists
+
+        return found
+
+    def load_entries(self, namespace: Optional[str] = None, **kwargs) -> Iterator[BaseVectorStoreDriver.Entry]:
+        return itertools.chain.from_iterable(
+            self.shards[i].load_entries(namespace, **kwargs) for i in self._namespace_shards(namespace)
+        )
+
+    def query(
+            self,
+            query: str,
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        return self.query_many([query], count, namespace, include_vectors, **kwargs)[0]
+
+    def query_vector(
+            self,
+            vector: list[float],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        shard_results = self._gather(
+            namespace,
+            lambda shard: shard.query_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+        )
+
+        return self._merge(shard_results, count)
+
+    def query_many(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        if len(queries) == 0:
+            return []
+
+        vectors = self._embed_strings(queries) if self._shared_embeddings else None
+        shard_results = self._gather(
+            namespace,
+            lambda shard: self._query_shard(shard, queries, vectors, count, namespace, include_vectors, **kwargs)
+        )
+
+        return [self._merge([results[i] for results in shard_results], count) for i in range(len(queries))]
+
+    def _query_shard(
+            self,
+            shard: BaseVectorStoreDriver,
+            queries: list[str],
+            vectors: Optional[list[list[float]]],
+            count: Optional[int],
+            namespace: Optional[str],
+            include_vectors: bool,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        if vectors is not None:
+            try:
+                return [
+                    shard.query_vector(
+                        vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+                    ) for vector in vectors
+                ]
+            except NotImplementedError:
+                pass
+
+        return shard.query_many(queries, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+
+    def _embedding_model(self, embedding_driver: Optional[BaseEmbeddingDriver]) -> tuple:
+        # Embedding drivers of the same class, model and dimensions embed into the same vector space.
+        return (
+            type(embedding_driver),
+            getattr(embedding_driver, "model", None),
+            getattr(embedding_driver, "dimensions", None)
+        )
+
+    def _namespace_shards(self, namespace: Optional[str]) -> list[int]:
+        if self.routing == "namespace" and namespace is not None:
+            return [self.shard_for("", namespace)]
+        else:
+            return list(range(len(self.shards)))
+
+    def _gather(self, namespace: Optional[str], func: Callable) -> list:
+        shard_futures = [self.shard_executor.submit(self._timed, i, func) for i in self._namespace_shards(namespace)]
+
+        return [future.result() for future in shard_futures]
+
+    def _timed(self, shard_index: int, func: Callable):
+        started_at = time.perf_counter()
+
+        try:
+            return func(self.shards[shard_index])
+        finally:
+            latency = time.perf_counter() - started_at
+
+            with self._stats_lock:
+                stats = self.shard_stats[shard_index]
+                stats.query_count += 1
+                stats.total_latency += latency
+                stats.last_latency = latency
+
+    def _scatter(
+            self,
+            items: list[tuple[int, str, object]],
+            func: Callable
+    ) -> list[BaseVectorStoreDriver.UpsertResult]:
+        # Items are (shard index, vector ID, item). Groups are written to their shards concurrently, results come back
+        # in input order and a failing shard only fails its own items.
+        groups = {}
+
+        for position, (shard_index, vector_id, item) in enumerate(items):
+            groups.setdefault(shard_index, []).append((position, vector_id, item))
+
+        shard_futures = {
+            shard_index: self.shard_executor.submit(func, self.shards[shard_index], [item for _, _, item in group])
+            for shard_index, group in groups.items()
+        }
+        results = [None] * len(items)
+
+        for shard_index, future in shard_futures.items():
+            try:
+                shard_results = future.result()
+            except Exception as e:
+                shard_results = [
+                    BaseVectorStoreDriver.UpsertResult(id=vector_id, error=e) for _, vector_id, _ in groups[shard_index]
+                ]
+
+            for (position, _, _), result in zip(groups[shard_index], shard_results):
+                results[position] = result
+
+        return results
+
+    def _merge(
+            self,
+            shard_results: list[list[BaseVectorStoreDriver.QueryResult]],
+            count: Optional[int]
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        # Every shard returns its results best first, so a k-way heap merge only looks at count results in total.
+        merged = heapq.merge(*shard_results, key=lambda result: -result.score)
+
+        return list(merged) if count is None else list(itertools.islice(merged, count))
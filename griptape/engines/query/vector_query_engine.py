@@ -1,6 +1,6 @@
 from typing import Optional
 from attr import define, field, Factory
-from griptape.artifacts import TextArtifact, BaseArtifact
+from griptape.artifacts import TextArtifact
 from griptape.drivers import BaseVectorStoreDriver, LocalVectorStoreDriver, BasePromptDriver, OpenAiPromptDriver
 from griptape.engines import BaseQueryEngine
 from griptape.utils.j2 import J2
@@ -28,14 +28,37 @@ class VectorQueryEngine(BaseQueryEngine):
             top_n: Optional[int] = None,
             namespace: Optional[str] = None
     ) -> TextArtifact:
-        tokenizer = self.prompt_driver.tokenizer
         result = self.vector_store_driver.query(query, top_n, namespace)
-        artifacts = [
-            a for a in [BaseArtifact.from_json(r.meta["artifact"]) for r in result] if isinstance(a, TextArtifact)
-        ]
+
+        return self._answer(query, result, metadata)
+
+    def query_many(
+            self,
+            queries: list[str],
+            metadata: Optional[str] = None,
+            top_n: Optional[int] = None,
+            namespace: Optional[str] = None
+    ) -> list[TextArtifact]:
+        results = self.vector_store_driver.query_many(queries, top_n, namespace)
+
+        return [self._answer(query, result, metadata) for query, result in zip(queries, results)]
+
+    def _answer(
+            self,
+            query: str,
+            result: list[BaseVectorStoreDriver.QueryResult],
+            metadata: Optional[str]
+    ) -> TextArtifact:
+        tokenizer = self.prompt_driver.tokenizer
         text_segments = []
 
-        for artifact in artifacts:
+        # Artifacts are loaded one result at a time so results past the token limit are never deserialized.
+        for r in result:
+            artifact = self.vector_store_driver.load_artifact(r)
+
+            if not isinstance(artifact, TextArtifact):
+                continue
+
             text_segments.append(artifact.value)
 
             message = self.template_generator.render(
@@ -72,6 +95,7 @@ class VectorQueryEngine(BaseQueryEngine):
             artifacts: list[TextArtifact],
             namespace: str
     ) -> None:
+        # Raise the first failure instead of silently storing a partial namespace.
         self.vector_store_driver.upsert_text_artifacts({
             namespace: artifacts
-        })
+        }, raise_on_error=True)
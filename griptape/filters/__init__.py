@@ -0,0 +1,16 @@
+from .base_meta_filter import BaseMetaFilter
+from .equals_meta_filter import EqualsMetaFilter
+from .in_meta_filter import InMetaFilter
+from .range_meta_filter import RangeMetaFilter
+from .and_meta_filter import AndMetaFilter
+from .or_meta_filter import OrMetaFilter
+
+
+__all__ = [
+    "BaseMetaFilter",
+    "EqualsMetaFilter",
+    "InMetaFilter",
+    "RangeMetaFilter",
+    "AndMetaFilter",
+    "OrMetaFilter"
+]
@@ -0,0 +1,14 @@
+from typing import Optional
+from attr import define, field
+from griptape.filters import BaseMetaFilter
+
+
+@define
+class AndMetaFilter(BaseMetaFilter):
+    filters: list[BaseMetaFilter] = field()
+
+    def matches(self, meta: Optional[dict]) -> bool:
+        return all(f.matches(meta) for f in self.filters)
+
+    def keys(self) -> set[str]:
+        return set().union(*[f.keys() for f in self.filters])
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Optional
+from attr import define
+
+
+@define
+class BaseMetaFilter(ABC):
+    """Driver-agnostic filter expression over vector metadata.
+
+    Drivers translate filters into their native syntax; matches() evaluates one against a meta dict and is used where
+    a store has no native equivalent. Filters combine with & and |.
+    """
+
+    @abstractmethod
+    def matches(self, meta: Optional[dict]) -> bool:
+        ...
+
+    @abstractmethod
+    def keys(self) -> set[str]:
+        """Return every meta key the filter looks at."""
+        ...
+
+    def __and__(self, other: BaseMetaFilter) -> BaseMetaFilter:
+        from griptape.filters import AndMetaFilter
+
+        return AndMetaFilter(
+            [f for side in [self, other] for f in (side.filters if isinstance(side, AndMetaFilter) else [side])]
+        )
+
+    def __or__(self, other: BaseMetaFilter) -> BaseMetaFilter:
+        from griptape.filters import OrMetaFilter
+
+        return OrMetaFilter(
+            [f for side in [self, other] for f in (side.filters if isinstance(side, OrMetaFilter) else [side])]
+        )
@@ -0,0 +1,15 @@
+from typing import Optional, Any
+from attr import define, field
+from griptape.filters import BaseMetaFilter
+
+
+@define
+class EqualsMetaFilter(BaseMetaFilter):
+    key: str = field()
+    value: Any = field()
+
+    def matches(self, meta: Optional[dict]) -> bool:
+        return meta is not None and self.key in meta and meta[self.key] == self.value
+
+    def keys(self) -> set[str]:
+        return {self.key}
@@ -0,0 +1,15 @@
+from typing import Optional, Any
+from attr import define, field
+from griptape.filters import BaseMetaFilter
+
+
+@define
+class InMetaFilter(BaseMetaFilter):
+    key: str = field()
+    values: list[Any] = field()
+
+    def matches(self, meta: Optional[dict]) -> bool:
+        return meta is not None and self.key in meta and any(meta[self.key] == value for value in self.values)
+
+    def keys(self) -> set[str]:
+        return {self.key}
@@ -0,0 +1,49 @@
+from typing import Optional, Any
+from attr import define, field
+from griptape.filters import BaseMetaFilter
+
+
+@define
+class RangeMetaFilter(BaseMetaFilter):
+    """Matches values within the given bounds. Values that can't be compared with the bounds never match."""
+
+    key: str = field()
+    gt: Optional[Any] = field(default=None, kw_only=True)
+    gte: Optional[Any] = field(default=None, kw_only=True)
+    lt: Optional[Any] = field(default=None, kw_only=True)
+    lte: Optional[Any] = field(default=None, kw_only=True)
+
+    def __attrs_post_init__(self) -> None:
+        if all(bound is None for bound in [self.gt, self.gte, self.lt, self.lte]):
+            raise ValueError("at least one bound is required")
+        elif self.gt is not None and self.gte is not None:
+            raise ValueError("gt and gte can't both be set")
+        elif self.lt is not None and self.lte is not None:
+            raise ValueError("lt and lte can't both be set")
+
+    @property
+    def lower(self) -> Optional[Any]:
+        return self.gt if self.gt is not None else self.gte
+
+    @property
+    def upper(self) -> Optional[Any]:
+        return self.lt if self.lt is not None else self.lte
+
+    def matches(self, meta: Optional[dict]) -> bool:
+        if meta is None or self.key not in meta or meta[self.key] is None:
+            return False
+
+        value = meta[self.key]
+
+        try:
+            return (
+                (self.gt is None or value > self.gt)
+                and (self.gte is None or value >= self.gte)
+                and (self.lt is None or value < self.lt)
+                and (self.lte is None or value <= self.lte)
+            )
+        except TypeError:
+            return False
+
+    def keys(self) -> set[str]:
+        return {self.key}
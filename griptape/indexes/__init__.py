@@ -0,0 +1,12 @@
+from .base_vector_index import BaseVectorIndex
+from .ivf_vector_index import IvfVectorIndex
+from .bm25_text_index import Bm25TextIndex
+from .meta_field_index import MetaFieldIndex
+
+
+__all__ = [
+    "BaseVectorIndex",
+    "IvfVectorIndex",
+    "Bm25TextIndex",
+    "MetaFieldIndex"
+]
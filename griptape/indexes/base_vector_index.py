@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+import numpy as np
+from attr import define
+
+
+@define
+class BaseVectorIndex(ABC):
+    """Approximate nearest-neighbour index over the rows of a vector store.
+
+    Indexes only track row numbers: the store scores the returned candidates exactly against its own vectors. Adding
+    a row that is already indexed replaces it, and the store removes rows as they are deleted. Persistent stores save
+    state() next to their vectors and load it when opened, so trained indexes aren't rebuilt on every open.
+    """
+
+    @property
+    def is_trained(self) -> bool:
+        return True
+
+    @abstractmethod
+    def add(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        ...
+
+    @abstractmethod
+    def remove(self, rows: np.ndarray) -> None:
+        ...
+
+    @abstractmethod
+    def candidates(self, query: np.ndarray, **kwargs) -> Optional[np.ndarray]:
+        """Return candidate rows for a normalized query vector, or None if every row has to be scanned."""
+        ...
+
+    @abstractmethod
+    def candidate_count(self, row_count: int, **kwargs) -> int:
+        """Estimate how many rows a search over an index holding row_count rows will return."""
+        ...
+
+    @abstractmethod
+    def state(self) -> dict[str, np.ndarray]:
+        """Return the trained state and indexed rows as named arrays, or nothing while the index isn't trained."""
+        ...
+
+    @abstractmethod
+    def load_state(self, state: dict[str, np.ndarray]) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all rows while keeping any trained state."""
+        ...
@@ -0,0 +1,192 @@
+import re
+from typing import Optional
+import numpy as np
+from attr import define, field
+
+
+@define
+class Bm25TextIndex:
+    """Incrementally maintained inverted index that scores rows of a vector store against keyword queries with BM25.
+
+    Every add creates a new internal document for the row; the row's previous document, if any, is retired and stops
+    counting towards document frequencies, so overwrites and deletes never require rebuilding the postings. Retired
+    documents are dropped from the postings once they outnumber the live ones.
+    """
+
+    INITIAL_CAPACITY = 16
+    TOKEN_PATTERN = re.compile(r"\w+(?:[-.]\w+)*")
+
+    k1: float = field(default=1.2, kw_only=True)
+    b: float = field(default=0.75, kw_only=True)
+
+    _terms: dict[str, int] = field(factory=dict, init=False)
+    _document_frequencies: np.ndarray = field(factory=lambda: np.zeros(0, dtype=np.int64), init=False)
+    _posting_documents: list[np.ndarray] = field(factory=list, init=False)
+    _posting_frequencies: list[np.ndarray] = field(factory=list, init=False)
+    _posting_sizes: list[int] = field(factory=list, init=False)
+    _document_rows: np.ndarray = field(factory=lambda: np.zeros(0, dtype=np.int64), init=False)
+    _document_lengths: np.ndarray = field(factory=lambda: np.zeros(0, dtype=np.float32), init=False)
+    _document_terms: list[Optional[np.ndarray]] = field(factory=list, init=False)
+    _row_documents: dict[int, int] = field(factory=dict, init=False)
+    _total_length: int = field(default=0, init=False)
+    _retired_count: int = field(default=0, init=False)
+
+    @property
+    def document_count(self) -> int:
+        return len(self._row_documents)
+
+    def tokenize(self, text: str) -> list[str]:
+        return self.TOKEN_PATTERN.findall(text.lower())
+
+    def add(self, rows: list[int], texts: list[str]) -> None:
+        for row, text in zip(rows, texts):
+            self.remove([row])
+
+            terms, frequencies = np.unique(
+                np.asarray([self._term_id(token) for token in self.tokenize(text)], dtype=np.int64),
+                return_counts=True
+            )
+            document = self._new_document(row, int(frequencies.sum()), terms)
+
+            self._document_frequencies[terms] += 1
+
+            for term, frequency in zip(terms.tolist(), frequencies.tolist()):
+                self._append_posting(term, document, frequency)
+
+    def remove(self, rows: list[int]) -> None:
+        for row in rows:
+            document = self._row_documents.pop(row, None)
+
+            if document is not None:
+                self._document_frequencies[self._document_terms[document]] -= 1
+                self._total_length -= int(self._document_lengths[document])
+                self._document_rows[document] = -1
+                self._document_terms[document] = None
+                self._retired_count += 1
+
+        if self._retired_count > max(self.INITIAL_CAPACITY, self.document_count):
+            self._compact()
+
+    def matches(self, query: str) -> np.ndarray:
+        """Return the rows containing at least one query term."""
+        rows = [self._term_rows(term)[0] for term in self._query_terms(query)]
+
+        return np.unique(np.concatenate(rows)) if rows else np.empty(0, dtype=np.int64)
+
+    def scores(self, query: str, rows: np.ndarray) -> np.ndarray:
+        """Return the BM25 score of every row in rows; rows without any query term score zero."""
+        if len(rows) == 0 or self.document_count == 0:
+            return np.zeros(len(rows), dtype=np.float32)
+
+        size = int(rows.max()) + 1
+        scores = np.zeros(size, dtype=np.float32)
+        average_length = max(self._total_length / self.document_count, 1)
+
+        for term in self._query_terms(query):
+            term_rows, frequencies, lengths = self._term_rows(term)
+            in_range = term_rows < size
+            term_rows, frequencies, lengths = term_rows[in_range], frequencies[in_range], lengths[in_range]
+            document_frequency = self._document_frequencies[term]
+            idf = np.log(1 + (self.document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+            # A row has at most one live document, so rows are unique within a term and plain fancy-indexed adds work.
+            scores[term_rows] += idf * frequencies * (self.k1 + 1) / (
+                frequencies + self.k1 * (1 - self.b + self.b * lengths / average_length)
+            )
+
+        return scores[rows]
+
+    def clear(self) -> None:
+        self._terms = {}
+        self._document_frequencies = np.zeros(0, dtype=np.int64)
+        self._posting_documents = []
+        self._posting_frequencies = []
+        self._posting_sizes = []
+        self._document_rows = np.zeros(0, dtype=np.int64)
+        self._document_lengths = np.zeros(0, dtype=np.float32)
+        self._document_terms = []
+        self._row_documents = {}
+        self._total_length = 0
+        self._retired_count = 0
+
+    def _compact(self) -> None:
+        # Renumbers the live documents in order and drops retired ones from every posting list.
+        document_count = len(self._document_terms)
+        live = np.flatnonzero(self._document_rows[:document_count] >= 0)
+        renumbered = np.full(document_count, -1, dtype=np.int64)
+        renumbered[live] = np.arange(len(live))
+
+        for term, size in enumerate(self._posting_sizes):
+            documents = renumbered[self._posting_documents[term][:size]]
+            kept = documents >= 0
+            capacity = max(int(kept.sum()), self.INITIAL_CAPACITY)
+
+            self._posting_documents[term] = self._grow(documents[kept], capacity)
+            self._posting_frequencies[term] = self._grow(self._posting_frequencies[term][:size][kept], capacity)
+            self._posting_sizes[term] = int(kept.sum())
+
+        self._document_rows = self._grow(self._document_rows[live], len(live))
+        self._document_lengths = self._grow(self._document_lengths[live], len(live))
+        self._document_terms = [self._document_terms[document] for document in live]
+        self._row_documents = {int(self._document_rows[document]): document for document in range(len(live))}
+        self._retired_count = 0
+
+    def _query_terms(self, query: str) -> list[int]:
+        return list(dict.fromkeys(self._terms[token] for token in self.tokenize(query) if token in self._terms))
+
+    def _term_rows(self, term: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        size = self._posting_sizes[term]
+        documents = self._posting_documents[term][:size]
+        rows = self._document_rows[documents]
+        live = rows >= 0
+
+        return rows[live], self._posting_frequencies[term][:size][live], self._document_lengths[documents[live]]
+
+    def _term_id(self, token: str) -> int:
+        term = self._terms.get(token)
+
+        if term is None:
+            term = len(self._terms)
+            self._terms[token] = term
+
+            self._posting_documents.append(np.empty(self.INITIAL_CAPACITY, dtype=np.int64))
+            self._posting_frequencies.append(np.empty(self.INITIAL_CAPACITY, dtype=np.float32))
+            self._posting_sizes.append(0)
+
+            if term >= len(self._document_frequencies):
+                self._document_frequencies = self._grow(self._document_frequencies, term + 1)
+
+        return term
+
+    def _new_document(self, row: int, length: int, terms: np.ndarray) -> int:
+        document = len(self._document_terms)
+
+        if document >= len(self._document_rows):
+            self._document_rows = self._grow(self._document_rows, document + 1)
+            self._document_lengths = self._grow(self._document_lengths, document + 1)
+
+        self._document_rows[document] = row
+        self._document_lengths[document] = length
+        self._document_terms.append(terms)
+        self._row_documents[row] = document
+        self._total_length += length
+
+        return document
+
+    def _append_posting(self, term: int, document: int, frequency: int) -> None:
+        size = self._posting_sizes[term]
+
+        if size >= len(self._posting_documents[term]):
+            self._posting_documents[term] = self._grow(self._posting_documents[term], size + 1)
+            self._posting_frequencies[term] = self._grow(self._posting_frequencies[term], size + 1)
+
+        self._posting_documents[term][size] = document
+        self._posting_frequencies[term][size] = frequency
+        self._posting_sizes[term] = size + 1
+
+    def _grow(self, array: np.ndarray, required: int) -> np.ndarray:
+        # Grow geometrically so appends stay amortized O(1).
+        grown = np.zeros(max(required, len(array) * 2, self.INITIAL_CAPACITY), dtype=array.dtype)
+        grown[:len(array)] = array
+
+        return grown
@@ -0,0 +1,207 @@
+from typing import Optional
+import numpy as np
+from attr import define, field
+from griptape.indexes import BaseVectorIndex
+
+
+@define
+class IvfVectorIndex(BaseVectorIndex):
+    """Inverted file index with a spherical k-means coarse quantizer.
+
+    Rows are buffered and searched exhaustively until train_size vectors have been added. The buffered vectors are
+    then used to train centroid_count centroids, and every later insert is assigned to its nearest centroid without
+    retraining. Searches only visit the nprobe lists whose centroids are closest to the query; raising nprobe trades
+    latency for recall. Adding a row that is already indexed moves it rather than listing it twice.
+    """
+
+    INITIAL_LIST_CAPACITY = 16
+    ASSIGNMENT_BATCH_SIZE = 4096
+
+    centroid_count: int = field(default=256, kw_only=True)
+    nprobe: int = field(default=8, kw_only=True)
+    train_size: int = field(default=8192, kw_only=True)
+    iterations: int = field(default=10, kw_only=True)
+    seed: Optional[int] = field(default=None, kw_only=True)
+
+    centroids: Optional[np.ndarray] = field(default=None, init=False)
+    _lists: list[np.ndarray] = field(factory=list, init=False)
+    _list_sizes: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.int64), init=False)
+    # List of every assigned row, -1 for rows that aren't in any list.
+    _row_lists: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.int64), init=False)
+    _pending_rows: list[np.ndarray] = field(factory=list, init=False)
+    _pending_vectors: list[np.ndarray] = field(factory=list, init=False)
+    _pending_count: int = field(default=0, init=False)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def add(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        if len(rows) == 0:
+            return
+
+        rows = np.asarray(rows, dtype=np.int64)
+        vectors = np.asarray(vectors)
+        unique_rows, last = np.unique(rows[::-1], return_index=True)
+
+        # A row added twice in one batch keeps its last vector.
+        if len(unique_rows) < len(rows):
+            keep = np.sort(len(rows) - 1 - last)
+            rows, vectors = rows[keep], vectors[keep]
+
+        self.remove(rows)
+
+        if self.is_trained:
+            self._assign(rows, vectors)
+        else:
+            self._pending_rows.append(np.asarray(rows, dtype=np.int64))
+            self._pending_vectors.append(np.array(vectors, dtype=np.float32))
+            self._pending_count += len(rows)
+
+            if self._pending_count >= max(self.train_size, self.centroid_count):
+                rows = np.concatenate(self._pending_rows)
+                vectors = np.concatenate(self._pending_vectors)
+
+                self._pending_rows = []
+                self._pending_vectors = []
+                self._pending_count = 0
+
+                self.train(vectors)
+                self._assign(rows, vectors)
+
+    def remove(self, rows: np.ndarray) -> None:
+        rows = np.asarray(rows, dtype=np.int64)
+
+        if len(rows) == 0:
+            return
+
+        if self._pending_count > 0:
+            keep = [~np.isin(pending_rows, rows) for pending_rows in self._pending_rows]
+            self._pending_rows = [pending_rows[k] for pending_rows, k in zip(self._pending_rows, keep)]
+            self._pending_vectors = [pending_vectors[k] for pending_vectors, k in zip(self._pending_vectors, keep)]
+            self._pending_count = sum(len(pending_rows) for pending_rows in self._pending_rows)
+
+        rows = rows[rows < len(self._row_lists)]
+        list_ids = self._row_lists[rows]
+        rows = rows[list_ids >= 0]
+
+        for list_id in np.unique(list_ids[list_ids >= 0]):
+            size = self._list_sizes[list_id]
+            kept = self._lists[list_id][:size][~np.isin(self._lists[list_id][:size], rows)]
+
+            self._lists[list_id][:len(kept)] = kept
+            self._list_sizes[list_id] = len(kept)
+
+        self._row_lists[rows] = -1
+
+    def train(self, vectors: np.ndarray) -> None:
+        rng = np.random.default_rng(self.seed)
+        centroids = vectors[rng.choice(len(vectors), size=self.centroid_count, replace=False)].copy()
+
+        for _ in range(self.iterations):
+            assignments = self._nearest(vectors, centroids)
+            sums = np.zeros_like(centroids)
+
+            np.add.at(sums, assignments, vectors)
+
+            counts = np.bincount(assignments, minlength=self.centroid_count)
+            empty = np.flatnonzero(counts == 0)
+
+            # Re-seed empty clusters with random vectors so every list stays useful.
+            sums[empty] = vectors[rng.choice(len(vectors), size=len(empty))]
+            centroids = self._normalize(sums)
+
+        self.centroids = centroids
+        self._lists = [np.empty(self.INITIAL_LIST_CAPACITY, dtype=np.int64) for _ in range(self.centroid_count)]
+        self._list_sizes = np.zeros(self.centroid_count, dtype=np.int64)
+        self._row_lists = np.empty(0, dtype=np.int64)
+
+    def state(self) -> dict[str, np.ndarray]:
+        if not self.is_trained:
+            return {}
+
+        return {"centroids": self.centroids, "row_lists": self._row_lists}
+
+    def load_state(self, state: dict[str, np.ndarray]) -> None:
+        centroids = state["centroids"]
+        row_lists = np.asarray(state["row_lists"], dtype=np.int64)
+
+        if len(centroids) != self.centroid_count:
+            raise ValueError(f"saved index has {len(centroids)} centroids, expected {self.centroid_count}")
+
+        rows = np.flatnonzero(row_lists >= 0)
+        sizes = np.bincount(row_lists[rows], minlength=self.centroid_count)
+        # Rows are grouped by list with a stable sort, so every list keeps ascending row order.
+        grouped = np.split(rows[np.argsort(row_lists[rows], kind="stable")], np.cumsum(sizes)[:-1])
+
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self._lists = [np.empty(max(len(group), self.INITIAL_LIST_CAPACITY), dtype=np.int64) for group in grouped]
+        self._list_sizes = sizes.astype(np.int64)
+        self._row_lists = row_lists.copy()
+        self._pending_rows = []
+        self._pending_vectors = []
+        self._pending_count = 0
+
+        for rows_list, group in zip(self._lists, grouped):
+            rows_list[:len(group)] = group
+
+    def candidates(self, query: np.ndarray, nprobe: Optional[int] = None, **kwargs) -> Optional[np.ndarray]:
+        if not self.is_trained:
+            return None
+
+        nprobe = min(nprobe if nprobe else self.nprobe, self.centroid_count)
+        probes = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+
+        return np.concatenate([self._lists[i][:self._list_sizes[i]] for i in probes])
+
+    def candidate_count(self, row_count: int, nprobe: Optional[int] = None, **kwargs) -> int:
+        if not self.is_trained:
+            return row_count
+
+        nprobe = min(nprobe if nprobe else self.nprobe, self.centroid_count)
+
+        return -(-row_count * nprobe // self.centroid_count)
+
+    def clear(self) -> None:
+        self._lists = [np.empty(self.INITIAL_LIST_CAPACITY, dtype=np.int64) for _ in range(len(self._lists))]
+        self._list_sizes = np.zeros(len(self._lists), dtype=np.int64)
+        self._row_lists = np.empty(0, dtype=np.int64)
+        self._pending_rows = []
+        self._pending_vectors = []
+        self._pending_count = 0
+
+    def _assign(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        assignments = self._nearest(vectors, self.centroids)
+
+        if rows.max() >= len(self._row_lists):
+            grown = np.full(max(int(rows.max()) + 1, len(self._row_lists) * 2), -1, dtype=np.int64)
+            grown[:len(self._row_lists)] = self._row_lists
+
+            self._row_lists = grown
+
+        self._row_lists[rows] = assignments
+
+        for list_id in np.unique(assignments):
+            list_rows = rows[assignments == list_id]
+            size = self._list_sizes[list_id]
+            required = size + len(list_rows)
+
+            if required > len(self._lists[list_id]):
+                grown = np.empty(max(required, len(self._lists[list_id]) * 2), dtype=np.int64)
+                grown[:size] = self._lists[list_id][:size]
+
+                self._lists[list_id] = grown
+
+            self._lists[list_id][size:required] = list_rows
+            self._list_sizes[list_id] = required
+
+    def _nearest(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        return np.concatenate([
+            np.argmax(vectors[i:i + self.ASSIGNMENT_BATCH_SIZE] @ centroids.T, axis=1)
+            for i in range(0, len(vectors), self.ASSIGNMENT_BATCH_SIZE)
+        ])
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        return vectors / np.where(norms > 0, norms, 1)
@@ -0,0 +1,170 @@
+import bisect
+from numbers import Number
+from typing import Optional, Any
+import numpy as np
+from attr import define, field
+from griptape.filters import (
+    BaseMetaFilter, EqualsMetaFilter, InMetaFilter, RangeMetaFilter, AndMetaFilter, OrMetaFilter
+)
+
+
+@define
+class MetaFieldIndex:
+    """Incrementally maintained inverted indexes over selected meta keys of a vector store's rows.
+
+    Every indexed key maps each value to its rows for equality lookups and keeps its distinct numbers and strings
+    sorted for range lookups. Unhashable values (lists, dicts) aren't indexed, which is consistent with filters: they
+    can never equal a hashable filter value.
+    """
+
+    keys: list[str] = field(kw_only=True)
+
+    _postings: dict[str, dict[Any, dict[int, None]]] = field(factory=dict, init=False)
+    _sorted_values: dict[str, dict[type, list]] = field(factory=dict, init=False)
+    _row_values: dict[int, list[tuple[str, Any]]] = field(factory=dict, init=False)
+
+    def add(self, rows: list[int], metas: list[Optional[dict]]) -> None:
+        for row, meta in zip(rows, metas):
+            self.remove([row])
+
+            values = [
+                (key, meta[key]) for key in self.keys
+                if meta is not None and key in meta and self._is_hashable(meta[key])
+            ]
+
+            for key, value in values:
+                postings = self._postings.setdefault(key, {})
+
+                if value not in postings:
+                    postings[value] = {}
+                    group = self._sort_group(value)
+
+                    if group:
+                        bisect.insort(self._sorted_values.setdefault(key, {}).setdefault(group, []), value)
+
+                postings[value][row] = None
+
+            self._row_values[row] = values
+
+    def remove(self, rows: list[int]) -> None:
+        for row in rows:
+            for key, value in self._row_values.pop(row, []):
+                postings = self._postings[key]
+                postings[value].pop(row, None)
+
+                if len(postings[value]) == 0:
+                    del postings[value]
+
+                    if self._sort_group(value):
+                        values = self._sorted_values[key][self._sort_group(value)]
+
+                        del values[bisect.bisect_left(values, value)]
+
+    def covers(self, meta_filter: BaseMetaFilter) -> bool:
+        """Return whether candidate_rows answers the filter exactly, without re-checking the candidates."""
+        if isinstance(meta_filter, (AndMetaFilter, OrMetaFilter)):
+            return all(self.covers(f) for f in meta_filter.filters)
+        elif isinstance(meta_filter, EqualsMetaFilter):
+            return meta_filter.key in self.keys and self._is_hashable(meta_filter.value)
+        elif isinstance(meta_filter, InMetaFilter):
+            return meta_filter.key in self.keys and all(self._is_hashable(value) for value in meta_filter.values)
+        elif isinstance(meta_filter, RangeMetaFilter):
+            return meta_filter.key in self.keys and self._range_group(meta_filter) is not None
+        else:
+            return False
+
+    def candidate_rows(self, meta_filter: BaseMetaFilter) -> Optional[np.ndarray]:
+        """Return the sorted rows that may match the filter, or None if the index can't narrow it down."""
+        if isinstance(meta_filter, AndMetaFilter):
+            candidates = [rows for rows in map(self.candidate_rows, meta_filter.filters) if rows is not None]
+
+            if len(candidates) == 0:
+                return None
+
+            # Intersect the most selective candidates first.
+            candidates.sort(key=len)
+            rows = candidates[0]
+
+            for other in candidates[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+
+            return rows
+        elif isinstance(meta_filter, OrMetaFilter):
+            candidates = [self.candidate_rows(f) for f in meta_filter.filters]
+
+            if any(rows is None for rows in candidates):
+                return None
+
+            return np.unique(np.concatenate(candidates)) if candidates else np.empty(0, dtype=np.int64)
+        elif not self.covers(meta_filter):
+            return None
+
+        postings = self._postings.get(meta_filter.key, {})
+
+        if isinstance(meta_filter, EqualsMetaFilter):
+            values = [meta_filter.value]
+        elif isinstance(meta_filter, InMetaFilter):
+            values = meta_filter.values
+        else:
+            values = self._range_values(meta_filter)
+
+        return self._rows([postings[value] for value in values if value in postings])
+
+    def clear(self) -> None:
+        self._postings = {}
+        self._sorted_values = {}
+        self._row_values = {}
+
+    def _range_values(self, meta_filter: RangeMetaFilter) -> list:
+        values = self._sorted_values.get(meta_filter.key, {}).get(self._range_group(meta_filter), [])
+        start = 0
+        end = len(values)
+
+        if meta_filter.gt is not None:
+            start = max(start, bisect.bisect_right(values, meta_filter.gt))
+
+        if meta_filter.gte is not None:
+            start = max(start, bisect.bisect_left(values, meta_filter.gte))
+
+        if meta_filter.lt is not None:
+            end = min(end, bisect.bisect_left(values, meta_filter.lt))
+
+        if meta_filter.lte is not None:
+            end = min(end, bisect.bisect_right(values, meta_filter.lte))
+
+        return values[start:end]
+
+    def _range_group(self, meta_filter: RangeMetaFilter) -> Optional[type]:
+        # Only bounds of a single sortable kind can be answered from one sorted value list.
+        groups = {
+            self._sort_group(bound) for bound in [meta_filter.gt, meta_filter.gte, meta_filter.lt, meta_filter.lte]
+            if bound is not None
+        }
+
+        return groups.pop() if len(groups) == 1 and None not in groups else None
+
+    def _sort_group(self, value: Any) -> Optional[type]:
+        if isinstance(value, Number) and not isinstance(value, complex):
+            return Number
+        elif isinstance(value, str):
+            return str
+        else:
+            return None
+
+    def _rows(self, postings: list[dict[int, None]]) -> np.ndarray:
+        if len(postings) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        rows = np.fromiter(
+            (row for posting in postings for row in posting), dtype=np.int64, count=sum(len(p) for p in postings)
+        )
+
+        return np.unique(rows)
+
+    def _is_hashable(self, value: Any) -> bool:
+        try:
+            hash(value)
+
+            return True
+        except TypeError:
+            return False
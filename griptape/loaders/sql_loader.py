@@ -30,8 +30,7 @@ class SqlLoader(BaseLoader):
             chunks = []
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            CsvRowArtifact.generate_embeddings(chunks, self.embedding_driver)
 
         for chunk in chunks:
             artifacts.append(chunk)
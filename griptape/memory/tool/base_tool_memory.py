@@ -1,6 +1,11 @@
 from __future__ import annotations
+import logging
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Union
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Union, Optional
 from attr import define, field, Factory
 from griptape.core import ActivityMixin
 
@@ -16,6 +21,22 @@ class BaseToolMemory(ActivityMixin, ABC):
         kw_only=True,
     )
     namespace_metadata: dict[str, str] = field(factory=dict, kw_only=True)
+    # Namespaces that haven't been accessed for namespace_ttl seconds are deleted, along with their artifacts, by
+    # sweep(). Once more than max_namespaces are stored, the least recently used ones are deleted right away. When
+    # sweep_interval is set, a daemon thread calls sweep() every sweep_interval seconds until stop_sweeper() is called.
+    namespace_ttl: Optional[float] = field(default=None, kw_only=True)
+    max_namespaces: Optional[int] = field(default=None, kw_only=True)
+    sweep_interval: Optional[float] = field(default=None, kw_only=True)
+
+    # Last access time of every tracked namespace, least recently used first.
+    _namespace_access: OrderedDict[str, float] = field(factory=OrderedDict, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+    _sweeper: Optional[threading.Thread] = field(default=None, init=False)
+    _sweeper_stopped: threading.Event = field(factory=threading.Event, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.sweep_interval:
+            self.start_sweeper()
 
     def process_output(
         self,
@@ -28,3 +49,118 @@ class BaseToolMemory(ActivityMixin, ABC):
     @abstractmethod
     def load_artifacts(self, namespace: str) -> list[BaseArtifact]:
         ...
+
+    @abstractmethod
+    def delete_artifacts(self, namespace: str) -> None:
+        ...
+
+    def delete_namespace(self, namespace: str) -> None:
+        with self._lock:
+            self.namespace_metadata.pop(namespace, None)
+            self._namespace_access.pop(namespace, None)
+
+        self.delete_artifacts(namespace)
+
+    def touch_namespace(self, namespace: str) -> None:
+        """Mark a tracked namespace as recently used. Namespaces the memory doesn't track are left alone."""
+        with self._lock:
+            if namespace in self._namespace_access:
+                self._namespace_access[namespace] = time.monotonic()
+                self._namespace_access.move_to_end(namespace)
+
+    def sweep(self) -> list[str]:
+        """Delete expired and over-budget namespaces and return their names."""
+        with self._lock:
+            namespaces = self._expired_namespaces() + self._over_budget_namespaces()
+
+        return self._delete_namespaces(namespaces)
+
+    def start_sweeper(self) -> None:
+        if self.sweep_interval is None:
+            raise ValueError("sweep_interval is required to start the sweeper")
+
+        if self._sweeper is None or not self._sweeper.is_alive():
+            self._sweeper_stopped.clear()
+            self._sweeper = threading.Thread(
+                target=self._sweep_periodically,
+                args=(weakref.ref(self), self._sweeper_stopped, self.sweep_interval),
+                daemon=True
+            )
+
+            self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self._sweeper_stopped.set()
+
+        if self._sweeper is not None:
+            self._sweeper.join()
+
+            self._sweeper = None
+
+    def _register_namespace(self, namespace: str, metadata: Optional[str] = None) -> None:
+        with self._lock:
+            if metadata is not None:
+                self.namespace_metadata[namespace] = metadata
+
+            self._namespace_access[namespace] = time.monotonic()
+            self._namespace_access.move_to_end(namespace)
+
+        self._delete_namespaces(self._over_budget_namespaces())
+
+    def _expired_namespaces(self) -> list[str]:
+        if self.namespace_ttl is None:
+            return []
+
+        expires_before = time.monotonic() - self.namespace_ttl
+        namespaces = []
+
+        for namespace, accessed_at in self._namespace_access.items():
+            if accessed_at >= expires_before:
+                break
+
+            namespaces.append(namespace)
+
+        return namespaces
+
+    def _over_budget_namespaces(self) -> list[str]:
+        if self.max_namespaces is None:
+            return []
+
+        with self._lock:
+            excess = len(self._namespace_access) - self.max_namespaces
+
+            return list(self._namespace_access)[:max(excess, 0)]
+
+    def _delete_namespaces(self, namespaces: list[str]) -> list[str]:
+        deleted = []
+
+        for namespace in dict.fromkeys(namespaces):
+            with self._lock:
+                if namespace not in self._namespace_access:
+                    continue
+
+                self.namespace_metadata.pop(namespace, None)
+                self._namespace_access.pop(namespace)
+
+            # Artifacts are deleted outside the lock so slow vector stores don't block tool calls touching other
+            # namespaces.
+            self.delete_artifacts(namespace)
+            deleted.append(namespace)
+
+        return deleted
+
+    @staticmethod
+    def _sweep_periodically(memory_ref: weakref.ref, stopped: threading.Event, interval: float) -> None:
+        # Only a weak reference is held between sweeps so the sweeper doesn't keep an abandoned memory alive.
+        while not stopped.wait(interval):
+            memory = memory_ref()
+
+            if memory is None:
+                return
+
+            try:
+                memory.sweep()
+            except Exception as e:
+                logging.error(f"Tool memory {memory.id} failed to sweep namespaces: {e}")
+
+            del memory
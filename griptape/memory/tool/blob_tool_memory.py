@@ -46,7 +46,7 @@ class BlobToolMemory(BaseToolMemory):
             namespace = None
 
         if namespace:
-            self.namespace_metadata[namespace] = subtask.to_json()
+            self._register_namespace(namespace, subtask.to_json())
 
             output = J2("memory/tool/blob.j2").render(
                 memory_id=self.id,
@@ -62,4 +62,9 @@ class BlobToolMemory(BaseToolMemory):
             return value
 
     def load_artifacts(self, namespace: str) -> list[BaseArtifact]:
+        self.touch_namespace(namespace)
+
         return self.driver.load(namespace)
+
+    def delete_artifacts(self, namespace: str) -> None:
+        self.driver.delete(namespace)
@@ -37,6 +37,7 @@ class TextToolMemory(BaseToolMemory):
         text = params["values"]["text"]
 
         self.query_engine.upsert_text_artifact(TextArtifact(text), artifact_namespace)
+        self._register_namespace(artifact_namespace)
 
         return InfoArtifact("text was successfully inserted")
 
@@ -72,6 +73,8 @@ class TextToolMemory(BaseToolMemory):
         artifact_namespace = params["values"]["artifact_namespace"]
         query = params["values"]["query"]
 
+        self.touch_namespace(artifact_namespace)
+
         return self.query_engine.query(
             query,
             metadata=self.namespace_metadata.get(artifact_namespace),
@@ -109,7 +112,7 @@ class TextToolMemory(BaseToolMemory):
             namespace = None
 
         if namespace:
-            self.namespace_metadata[namespace] = subtask.to_json()
+            self._register_namespace(namespace, subtask.to_json())
 
             output = J2("memory/tool/text.j2").render(
                 memory_id=self.id,
@@ -125,9 +128,15 @@ class TextToolMemory(BaseToolMemory):
             return value
 
     def load_artifacts(self, namespace: str) -> list[TextArtifact]:
+        driver = self.query_engine.vector_store_driver
+        # Entries are consumed as they stream in so their vectors never pile up alongside the artifacts.
         artifacts = [
-            BaseArtifact.from_json(e.meta["artifact"])
-            for e in self.query_engine.vector_store_driver.load_entries(namespace)
+            a for a in (driver.load_artifact(e) for e in driver.load_entries(namespace)) if isinstance(a, TextArtifact)
         ]
 
-        return [a for a in artifacts if isinstance(a, TextArtifact)]
+        self.touch_namespace(namespace)
+
+        return artifacts
+
+    def delete_artifacts(self, namespace: str) -> None:
+        self.query_engine.vector_store_driver.delete_namespace(namespace)
@@ -0,0 +1,12 @@
+from .base_vector_quantizer import BaseVectorQuantizer
+from .float16_vector_quantizer import Float16VectorQuantizer
+from .int8_vector_quantizer import Int8VectorQuantizer
+from .product_vector_quantizer import ProductVectorQuantizer
+
+
+__all__ = [
+    "BaseVectorQuantizer",
+    "Float16VectorQuantizer",
+    "Int8VectorQuantizer",
+    "ProductVectorQuantizer"
+]
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+import numpy as np
+from attr import define
+
+
+@define
+class BaseVectorQuantizer(ABC):
+    """Compact encoding of normalized vectors.
+
+    Every vector is encoded as a fixed-size row of bytes, so stores can keep codes in a single uint8 matrix regardless
+    of the encoding. Scores are inner products between normalized queries and the decoded vectors.
+    """
+
+    # Upper bound on the number of rows decoded at once while scoring.
+    SCORE_BLOCK_SIZE = 65536
+
+    @property
+    def is_trained(self) -> bool:
+        return True
+
+    def can_train(self, row_count: int) -> bool:
+        """Return True once row_count vectors are enough to train the quantizer."""
+        return True
+
+    def train(self, vectors: np.ndarray) -> None:
+        ...
+
+    def check_dimensions(self, dimensions: int) -> None:
+        """Raise ValueError if dimensions-sized vectors can't be encoded."""
+        ...
+
+    def state(self) -> dict[str, np.ndarray]:
+        """Return the trained state as named arrays, or nothing while the quantizer isn't trained."""
+        return {}
+
+    def load_state(self, state: dict[str, np.ndarray]) -> None:
+        ...
+
+    @abstractmethod
+    def code_size(self, dimensions: int) -> int:
+        """Return the number of bytes a dimensions-sized vector is encoded into."""
+        ...
+
+    @abstractmethod
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        ...
+
+    def score(self, query_vectors: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        scores = np.empty((len(query_vectors), len(codes)), dtype=np.float32)
+
+        for i in range(0, len(codes), self.SCORE_BLOCK_SIZE):
+            scores[:, i:i + self.SCORE_BLOCK_SIZE] = query_vectors @ self.decode(codes[i:i + self.SCORE_BLOCK_SIZE]).T
+
+        return scores
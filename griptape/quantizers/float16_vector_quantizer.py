@@ -0,0 +1,17 @@
+import numpy as np
+from attr import define
+from griptape.quantizers import BaseVectorQuantizer
+
+
+@define
+class Float16VectorQuantizer(BaseVectorQuantizer):
+    """Half-precision storage: halves memory with scores that are practically identical to float32."""
+
+    def code_size(self, dimensions: int) -> int:
+        return dimensions * np.dtype(np.float16).itemsize
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(vectors, dtype=np.float16).view(np.uint8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(codes).view(np.float16).astype(np.float32)
@@ -0,0 +1,32 @@
+import numpy as np
+from attr import define
+from griptape.quantizers import BaseVectorQuantizer
+
+
+@define
+class Int8VectorQuantizer(BaseVectorQuantizer):
+    """Scalar quantization to int8 with a float32 scale per vector, stored after the quantized components."""
+
+    SCALE_SIZE = np.dtype(np.float32).itemsize
+
+    def code_size(self, dimensions: int) -> int:
+        return dimensions + self.SCALE_SIZE
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        scales = np.abs(vectors).max(axis=1, initial=0) / 127
+        scales = np.where(scales > 0, scales, 1).astype(np.float32)
+        codes = np.empty((len(vectors), self.code_size(vectors.shape[1])), dtype=np.uint8)
+
+        components = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+
+        codes[:, :-self.SCALE_SIZE] = components.view(np.uint8)
+        codes[:, -self.SCALE_SIZE:] = scales[:, None].view(np.uint8)
+
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        components = codes[:, :-self.SCALE_SIZE].view(np.int8).astype(np.float32)
+        scales = np.ascontiguousarray(codes[:, -self.SCALE_SIZE:]).view(np.float32)
+
+        return components * scales
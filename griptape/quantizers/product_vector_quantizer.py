@@ -0,0 +1,131 @@
+from typing import Optional
+import numpy as np
+from attr import define, field
+from griptape.quantizers import BaseVectorQuantizer
+
+
+@define
+class ProductVectorQuantizer(BaseVectorQuantizer):
+    """Product quantization: vectors are split into sub_vector_count sub-vectors, and each sub-vector is stored as the
+    one-byte id of its nearest centroid in a codebook learned with k-means.
+
+    Queries are scored with asymmetric distance computation: the query stays in full precision and is compared against
+    the codebooks once, after which every row is scored with sub_vector_count table lookups. The codebooks are trained
+    on the first train_size vectors and never retrained.
+    """
+
+    ENCODING_BATCH_SIZE = 4096
+
+    sub_vector_count: int = field(default=8, kw_only=True)
+    centroid_count: int = field(default=256, kw_only=True)
+    train_size: int = field(default=8192, kw_only=True)
+    iterations: int = field(default=10, kw_only=True)
+    seed: Optional[int] = field(default=None, kw_only=True)
+
+    codebooks: Optional[np.ndarray] = field(default=None, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if not 0 < self.centroid_count <= 256:
+            raise ValueError("centroid_count must be between 1 and 256")
+        elif self.sub_vector_count < 1:
+            raise ValueError("sub_vector_count must be positive")
+
+    @property
+    def is_trained(self) -> bool:
+        return self.codebooks is not None
+
+    def can_train(self, row_count: int) -> bool:
+        return row_count >= max(self.train_size, self.centroid_count)
+
+    def train(self, vectors: np.ndarray) -> None:
+        self.check_dimensions(vectors.shape[1])
+
+        rng = np.random.default_rng(self.seed)
+
+        if len(vectors) > self.train_size:
+            vectors = vectors[rng.choice(len(vectors), size=self.train_size, replace=False)]
+
+        self.codebooks = np.stack([
+            self._train_codebook(sub_vectors, rng) for sub_vectors in self._split(np.asarray(vectors, dtype=np.float32))
+        ])
+
+    def check_dimensions(self, dimensions: int) -> None:
+        if dimensions % self.sub_vector_count != 0:
+            raise ValueError(f"{dimensions} dimensions can't be split into {self.sub_vector_count} equal sub-vectors")
+        elif self.codebooks is not None and self.codebooks.shape[2] * self.sub_vector_count != dimensions:
+            raise ValueError(
+                f"quantizer was trained on {self.codebooks.shape[2] * self.sub_vector_count} dimensions, "
+                f"got {dimensions}"
+            )
+
+    def state(self) -> dict[str, np.ndarray]:
+        return {} if self.codebooks is None else {"codebooks": self.codebooks}
+
+    def load_state(self, state: dict[str, np.ndarray]) -> None:
+        codebooks = state["codebooks"]
+
+        if codebooks.ndim != 3 or codebooks.shape[:2] != (self.sub_vector_count, self.centroid_count):
+            raise ValueError(
+                f"saved codebooks have shape {codebooks.shape}, expected "
+                f"({self.sub_vector_count}, {self.centroid_count}, *)"
+            )
+
+        self.codebooks = np.asarray(codebooks, dtype=np.float32)
+
+    def code_size(self, dimensions: int) -> int:
+        return self.sub_vector_count
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        codes = np.empty((len(vectors), self.sub_vector_count), dtype=np.uint8)
+
+        for i, sub_vectors in enumerate(self._split(np.asarray(vectors, dtype=np.float32))):
+            codes[:, i] = self._nearest(sub_vectors, self.codebooks[i])
+
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.concatenate([self.codebooks[i][codes[:, i]] for i in range(self.sub_vector_count)], axis=1)
+
+    def score(self, query_vectors: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        # One lookup table of sub-vector inner products per query: shape (queries, sub_vector_count, centroid_count).
+        tables = np.einsum("qsd,skd->qsk", np.stack(self._split(query_vectors), axis=1), self.codebooks)
+        sub_vectors = np.arange(self.sub_vector_count)
+        scores = np.empty((len(query_vectors), len(codes)), dtype=np.float32)
+
+        for i in range(0, len(codes), self.SCORE_BLOCK_SIZE):
+            block = codes[i:i + self.SCORE_BLOCK_SIZE]
+
+            for j, table in enumerate(tables):
+                scores[j, i:i + len(block)] = table[sub_vectors, block].sum(axis=1)
+
+        return scores
+
+    def _train_codebook(self, vectors: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        centroids = vectors[rng.choice(len(vectors), size=self.centroid_count, replace=False)].copy()
+
+        for _ in range(self.iterations):
+            assignments = self._nearest(vectors, centroids)
+            sums = np.zeros_like(centroids)
+
+            np.add.at(sums, assignments, vectors)
+
+            counts = np.bincount(assignments, minlength=self.centroid_count)
+            empty = counts == 0
+
+            # Re-seed empty clusters with random vectors so every code stays useful.
+            centroids = sums / np.where(empty, 1, counts)[:, None]
+            centroids[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()))]
+
+        return centroids.astype(np.float32)
+
+    def _nearest(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        # argmin ||v - c||^2 == argmax (v . c - ||c||^2 / 2)
+        offsets = (centroids ** 2).sum(axis=1) / 2
+
+        return np.concatenate([
+            np.argmax(vectors[i:i + self.ENCODING_BATCH_SIZE] @ centroids.T - offsets, axis=1)
+            for i in range(0, len(vectors), self.ENCODING_BATCH_SIZE)
+        ]) if len(vectors) > 0 else np.empty(0, dtype=np.int64)
+
+    def _split(self, vectors: np.ndarray) -> list[np.ndarray]:
+        return np.split(vectors, self.sub_vector_count, axis=1)
@@ -0,0 +1,10 @@
+from .base_vector_reducer import BaseVectorReducer
+from .pca_vector_reducer import PcaVectorReducer
+from .random_projection_vector_reducer import RandomProjectionVectorReducer
+
+
+__all__ = [
+    "BaseVectorReducer",
+    "PcaVectorReducer",
+    "RandomProjectionVectorReducer"
+]
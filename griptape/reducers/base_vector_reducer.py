@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from attr import define, field
+
+
+@define
+class BaseVectorReducer(ABC):
+    """Fitted linear projection of vectors down to target_dimensions.
+
+    Reducers are trained once on a sample of full-size vectors and can be saved to and loaded from a NumPy .npz file,
+    so a store keeps reducing new vectors and queries the same way after a restart.
+    """
+
+    @dataclass
+    class RecallReport:
+        recall: float
+        count: int
+        query_count: int
+        dimensions: int
+        target_dimensions: int
+
+        @property
+        def compression_ratio(self) -> float:
+            return self.dimensions / self.target_dimensions
+
+    target_dimensions: int = field(kw_only=True)
+
+    @property
+    @abstractmethod
+    def is_trained(self) -> bool:
+        ...
+
+    def can_train(self, row_count: int) -> bool:
+        """Return True once row_count vectors are enough to train the reducer."""
+        return row_count > 0
+
+    @abstractmethod
+    def train(self, vectors: np.ndarray) -> None:
+        ...
+
+    @abstractmethod
+    def reduce(self, vectors: np.ndarray) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def state(self) -> dict[str, np.ndarray]:
+        """Return the trained state as named arrays."""
+        ...
+
+    @abstractmethod
+    def load_state(self, state: dict[str, np.ndarray]) -> None:
+        ...
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            np.savez(file, **self.state())
+
+    def load(self, path: str) -> None:
+        with np.load(path) as data:
+            self.load_state({key: data[key] for key in data.files})
+
+    def recall_report(
+            self,
+            vectors: np.ndarray,
+            count: int = 10,
+            query_count: int = 100,
+            seed: Optional[int] = None
+    ) -> RecallReport:
+        """Measure how many of the exact cosine top count neighbours of sample queries survive the reduction.
+
+        query_count of the vectors are used as queries against all the others, once at full size and once reduced.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+        if len(vectors) <= count:
+            raise ValueError(f"at least {count + 1} vectors are needed to measure recall at {count}")
+
+        queries = np.random.default_rng(seed).choice(len(vectors), size=min(query_count, len(vectors)), replace=False)
+        expected = self._neighbours(vectors, queries, count)
+        actual = self._neighbours(self.reduce(vectors), queries, count)
+        hits = sum(len(np.intersect1d(e, a, assume_unique=True)) for e, a in zip(expected, actual))
+
+        return BaseVectorReducer.RecallReport(
+            recall=hits / (len(queries) * count),
+            count=count,
+            query_count=len(queries),
+            dimensions=vectors.shape[1],
+            target_dimensions=self.target_dimensions
+        )
+
+    def _neighbours(self, vectors: np.ndarray, queries: np.ndarray, count: int) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        normalized = vectors / np.where(norms > 0, norms, 1)
+        scores = normalized[queries] @ normalized.T
+
+        # A query is always its own nearest neighbour.
+        scores[np.arange(len(queries)), queries] = -np.inf
+
+        return np.argpartition(-scores, count - 1, axis=1)[:, :count]
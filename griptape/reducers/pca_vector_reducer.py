@@ -0,0 +1,62 @@
+from typing import Optional
+import numpy as np
+from attr import define, field
+from griptape.reducers import BaseVectorReducer
+
+
+@define
+class PcaVectorReducer(BaseVectorReducer):
+    """Principal component analysis: vectors are projected onto the target_dimensions directions that capture most of
+    their energy.
+
+    The vectors aren't centered first. Stores score by inner products of the vectors themselves, and the uncentered
+    principal axes are the subspace that preserves those best.
+
+    Trained on at most train_size randomly sampled vectors. Stores only train it automatically from a batch of at
+    least train_size vectors, so smaller stores should train it explicitly on a representative sample.
+    """
+
+    train_size: int = field(default=8192, kw_only=True)
+    seed: Optional[int] = field(default=None, kw_only=True)
+
+    components: Optional[np.ndarray] = field(default=None, init=False)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.components is not None
+
+    def can_train(self, row_count: int) -> bool:
+        return row_count >= max(self.train_size, self.target_dimensions)
+
+    def train(self, vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+        if len(vectors) < self.target_dimensions:
+            raise ValueError(f"at least {self.target_dimensions} vectors are needed to train the reducer")
+        elif vectors.shape[1] < self.target_dimensions:
+            raise ValueError(
+                f"{vectors.shape[1]}-dimensional vectors can't be reduced to {self.target_dimensions} dimensions"
+            )
+
+        if len(vectors) > self.train_size:
+            rng = np.random.default_rng(self.seed)
+            vectors = vectors[rng.choice(len(vectors), size=self.train_size, replace=False)]
+
+        # Right singular vectors of the sample are the principal axes, by decreasing energy.
+        _, _, axes = np.linalg.svd(vectors, full_matrices=False)
+
+        self.components = np.ascontiguousarray(axes[:self.target_dimensions].T, dtype=np.float32)
+
+    def reduce(self, vectors: np.ndarray) -> np.ndarray:
+        return np.asarray(vectors, dtype=np.float32) @ self.components
+
+    def state(self) -> dict[str, np.ndarray]:
+        return {"components": self.components}
+
+    def load_state(self, state: dict[str, np.ndarray]) -> None:
+        if state["components"].shape[1] != self.target_dimensions:
+            raise ValueError(
+                f"saved reducer has {state['components'].shape[1]} dimensions, expected {self.target_dimensions}"
+            )
+
+        self.components = state["components"]
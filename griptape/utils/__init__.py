@@ -1,6 +1,6 @@
 import json
 from .paths import abs_path
-from .hash import str_to_hash
+from .hash import str_to_hash, bytes_to_hash
 from .j2 import J2
 from .conversation import Conversation
 from .manifest_validator import ManifestValidator
@@ -9,6 +9,9 @@ from .command_runner import CommandRunner
 from .chat import Chat
 from .futures import execute_futures_dict
 from .token_counter import TokenCounter
+from .streaming_top_k import StreamingTopK
+from .read_write_lock import ReadWriteLock
+from .local_vector_storage import LocalVectorStorage
 
 
 def minify_json(value: str) -> str:
@@ -24,6 +27,10 @@ __all__ = [
     "J2",
     "Chat",
     "str_to_hash",
+    "bytes_to_hash",
     "execute_futures_dict",
-    "TokenCounter"
+    "TokenCounter",
+    "StreamingTopK",
+    "ReadWriteLock",
+    "LocalVectorStorage"
 ]
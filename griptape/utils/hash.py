@@ -7,3 +7,8 @@ def str_to_hash(text: str, hash_algorithm: str = "sha256") -> str:
     m.update(text.encode())
 
     return m.hexdigest()
+
+
+def bytes_to_hash(data: bytes, digest_size: int = 16) -> str:
+    # BLAKE2b is faster than SHA-256 on 64-bit CPUs, and 128 bits are plenty for content-addressed ids.
+    return hashlib.blake2b(data, digest_size=digest_size).hexdigest()
@@ -0,0 +1,287 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional, Iterator
+import numpy as np
+from attr import define, field
+
+
+@define
+class LocalVectorStorage:
+    """Files behind a persistent LocalVectorStoreDriver.
+
+    Vectors are appended to a memory-mapped float32 file and ids, namespaces, meta and norms are recorded in a SQLite
+    sidecar, one pair of files per generation. Deleted rows are tombstoned with increasing sequence numbers instead of
+    removed, so read-only replicas opening the same directory fetch just the rows and deletions written since they last
+    looked. Compaction writes the live rows to the next generation, points the CURRENT file at it and removes the
+    previous one; replicas reopen once they see CURRENT change.
+    """
+
+    SQLITE_BATCH_SIZE = 500
+
+    persist_dir: str = field()
+    read_only: bool = field(default=False, kw_only=True)
+
+    generation: int = field(default=0, init=False)
+    # Serializes readers sharing the SQLite connection.
+    _connection_lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _vectors: Optional[np.memmap] = field(default=None, init=False)
+    # Deletions are recorded with increasing sequence numbers so replicas can fetch just the new ones.
+    _deletion_seq: int = field(default=0, init=False)
+    _data_version: Optional[int] = field(default=None, init=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None
+
+    def open(self, generation: Optional[int] = None) -> tuple[Optional[int], list[tuple]]:
+        """Open a generation, the current one by default.
+
+        Returns the stored vector dimensions, if any rows were ever written, and every (row, namespace, vector_id,
+        norm, deleted) record in row order.
+        """
+        if not self.read_only:
+            os.makedirs(self.persist_dir, exist_ok=True)
+
+        self.generation = self.read_generation() if generation is None else generation
+        self._connection = self._connect(self._sqlite_path(self.generation))
+        self._data_version = self._read_data_version()
+        self._deletion_seq = self._connection.execute("SELECT COALESCE(MAX(deleted), 0) FROM entries").fetchone()[0]
+
+        dimensions = self._connection.execute("SELECT value FROM settings WHERE key = 'dimensions'").fetchone()
+        records = self._connection.execute(
+            "SELECT row, namespace, vector_id, norm, deleted FROM entries ORDER BY row"
+        ).fetchall()
+
+        return None if dimensions is None else int(dimensions[0]), records
+
+    def close(self) -> None:
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+        if self._vectors is not None and not self.read_only:
+            self._vectors.flush()
+
+        self._vectors = None
+
+    def changed(self) -> bool:
+        """Whether another process has written to or compacted the store since it was opened or last updated."""
+        if self._connection is None:
+            return False
+        elif self.generation_changed():
+            return True
+
+        with self._connection_lock:
+            return self._read_data_version() != self._data_version
+
+    def generation_changed(self) -> bool:
+        return self.read_generation() != self.generation
+
+    def fetch_changes(self, row_count: int) -> tuple[Optional[int], list[tuple], list[tuple]]:
+        """Return the dimensions, the (row, namespace, vector_id, meta, norm, deleted) records from row_count on and
+        the (row, deleted) deletions of earlier rows written since the last call.
+        """
+        # Both reads share one transaction so they see the same snapshot of the owning process's writes.
+        self._data_version = self._read_data_version()
+        self._connection.execute("BEGIN")
+
+        try:
+            dimensions = self._connection.execute("SELECT value FROM settings WHERE key = 'dimensions'").fetchone()
+            records = self._connection.execute(
+                "SELECT row, namespace, vector_id, meta, norm, deleted FROM entries WHERE row >= ? ORDER BY row",
+                (row_count,)
+            ).fetchall()
+            deletions = self._connection.execute(
+                "SELECT row, deleted FROM entries WHERE deleted > ? AND row < ?",
+                (self._deletion_seq, row_count)
+            ).fetchall()
+        finally:
+            self._connection.commit()
+
+        self._deletion_seq = max([self._deletion_seq] + [record[5] for record in records] + [d for _, d in deletions])
+        records = [
+            (row, namespace, vector_id, None if meta is None else json.loads(meta), norm, deleted)
+            for row, namespace, vector_id, meta, norm, deleted in records
+        ]
+
+        return None if dimensions is None else int(dimensions[0]), records, deletions
+
+    def write_rows(self, dimensions: int, records: list[tuple], tombstoned_rows: list[int]) -> None:
+        """Record (row, namespace, vector_id, meta, norm) rows whose vectors were written, and tombstone others."""
+        if records:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES ('dimensions', ?)",
+                (str(dimensions),)
+            )
+            self._connection.executemany(
+                "INSERT INTO entries (row, namespace, vector_id, meta, norm) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (row, namespace, vector_id, None if meta is None else json.dumps(meta), norm)
+                    for row, namespace, vector_id, meta, norm in records
+                ]
+            )
+
+        if tombstoned_rows:
+            self._deletion_seq += 1
+
+            self._connection.executemany(
+                "UPDATE entries SET deleted = ? WHERE row = ?",
+                [(self._deletion_seq, row) for row in tombstoned_rows]
+            )
+
+        self._connection.commit()
+
+    def load_metas(self, rows: list[int]) -> list[Optional[dict]]:
+        metas = {}
+
+        with self._connection_lock:
+            for i in range(0, len(rows), self.SQLITE_BATCH_SIZE):
+                batch = rows[i:i + self.SQLITE_BATCH_SIZE]
+                cursor = self._connection.execute(
+                    f"SELECT row, meta FROM entries WHERE row IN ({','.join('?' * len(batch))})",
+                    batch
+                )
+
+                metas.update({row: None if meta is None else json.loads(meta) for row, meta in cursor})
+
+        return [metas.get(row) for row in rows]
+
+    def live_metas(self) -> Iterator[tuple[int, Optional[dict]]]:
+        for row, meta in self._connection.execute("SELECT row, meta FROM entries WHERE deleted = 0"):
+            yield row, None if meta is None else json.loads(meta)
+
+    def map_vectors(self, capacity: int, dimensions: int) -> np.memmap:
+        """Map the vector file with room for capacity rows. Read-only replicas map just the rows already written."""
+        path = self._vectors_path(self.generation)
+
+        if self.read_only:
+            row_count = os.path.getsize(path) // (dimensions * np.dtype(np.float32).itemsize)
+            self._vectors = np.memmap(path, dtype=np.float32, mode="r", shape=(row_count, dimensions))
+
+            return self._vectors
+
+        if self._vectors is not None:
+            self._vectors.flush()
+
+        size = capacity * dimensions * np.dtype(np.float32).itemsize
+
+        with open(path, "ab") as file:
+            if file.tell() < size:
+                file.truncate(size)
+
+        self._vectors = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, dimensions))
+
+        return self._vectors
+
+    def write_generation(self, vectors: np.ndarray, live_rows: np.ndarray, capacity: int) -> int:
+        """Copy the live rows into the files of the next generation and return it. It's only used once published."""
+        generation = self.generation + 1
+        target = np.memmap(
+            self._vectors_path(generation), dtype=np.float32, mode="w+", shape=(capacity, vectors.shape[1])
+        )
+
+        target[:len(live_rows)] = vectors[live_rows]
+        target.flush()
+
+        del target
+
+        connection = self._connect(self._sqlite_path(generation))
+
+        connection.execute("ATTACH DATABASE ? AS previous", (self._sqlite_path(self.generation),))
+        connection.execute("INSERT INTO settings SELECT * FROM previous.settings")
+        connection.execute(
+            "INSERT INTO entries (row, namespace, vector_id, meta, norm) "
+            "SELECT ROW_NUMBER() OVER (ORDER BY row) - 1, namespace, vector_id, meta, norm "
+            "FROM previous.entries WHERE deleted = 0"
+        )
+        connection.commit()
+        connection.execute("DETACH DATABASE previous")
+        connection.close()
+
+        return generation
+
+    def publish_generation(self, previous_generation: int) -> None:
+        """Point other processes at the open generation and remove the files of the previous one."""
+        path = os.path.join(self.persist_dir, "CURRENT")
+
+        with open(f"{path}.tmp", "w") as file:
+            file.write(str(self.generation))
+
+        os.replace(f"{path}.tmp", path)
+
+        # Processes that still have the previous generation open keep reading it until they refresh.
+        for path in self._generation_paths(previous_generation):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def read_generation(self) -> int:
+        path = os.path.join(self.persist_dir, "CURRENT")
+
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                return int(file.read().strip())
+        else:
+            return 0
+
+    def save_state(self, state: dict[str, np.ndarray]) -> None:
+        path = self._state_path(self.generation)
+
+        with open(f"{path}.tmp", "wb") as file:
+            np.savez(file, **state)
+
+        os.replace(f"{path}.tmp", path)
+
+    def load_state(self) -> Optional[dict[str, np.ndarray]]:
+        path = self._state_path(self.generation)
+
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+
+    def _read_data_version(self) -> int:
+        # Changes whenever another connection commits to the database.
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        if self.read_only:
+            return sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+        connection = sqlite3.connect(path, check_same_thread=False)
+
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "row INTEGER PRIMARY KEY, namespace TEXT, vector_id TEXT NOT NULL, meta TEXT, norm REAL NOT NULL, "
+            "deleted INTEGER NOT NULL DEFAULT 0)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_deleted ON entries (deleted)")
+        connection.commit()
+
+        return connection
+
+    def _vectors_path(self, generation: int) -> str:
+        return os.path.join(self.persist_dir, f"vectors-{generation}.f32")
+
+    def _sqlite_path(self, generation: int) -> str:
+        return os.path.join(self.persist_dir, f"entries-{generation}.sqlite")
+
+    def _state_path(self, generation: int) -> str:
+        return os.path.join(self.persist_dir, f"state-{generation}.npz")
+
+    def _generation_paths(self, generation: int) -> list[str]:
+        sqlite_path = self._sqlite_path(generation)
+
+        return [
+            self._vectors_path(generation),
+            sqlite_path,
+            f"{sqlite_path}-wal",
+            f"{sqlite_path}-shm",
+            self._state_path(generation)
+        ]
@@ -0,0 +1,55 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+from attr import define, field
+
+
+@define
+class ReadWriteLock:
+    """Lets any number of readers in at once, or a single writer.
+
+    Waiting writers block new readers so a steady stream of queries can't starve them. Neither side is reentrant: a
+    thread holding the lock must not acquire it again.
+    """
+
+    _condition: threading.Condition = field(factory=threading.Condition, init=False)
+    _readers: int = field(default=0, init=False)
+    _writing: bool = field(default=False, init=False)
+    _waiting_writers: int = field(default=0, init=False)
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            while self._writing or self._waiting_writers > 0:
+                self._condition.wait()
+
+            self._readers += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            self._waiting_writers += 1
+
+            try:
+                while self._writing or self._readers > 0:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+
+            self._writing = True
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
@@ -0,0 +1,102 @@
+import heapq
+from typing import Iterable, Callable, Any
+import numpy as np
+from attr import define, field
+
+
+@define
+class StreamingTopK:
+    """Exact cosine top-k search over a stream of items in constant memory.
+
+    Item vectors are copied into a fixed buffer of block_size rows. Every full block is scored against all queries with
+    one matrix product and only the best count items per query are kept in a heap, so no more than one block plus
+    count items per query are held at once, however long the stream is.
+    """
+
+    count: int = field(kw_only=True)
+    block_size: int = field(default=1024, kw_only=True)
+
+    def __attrs_post_init__(self) -> None:
+        if self.count < 0:
+            raise ValueError("count can't be negative")
+
+        if self.block_size < 1:
+            raise ValueError("block_size has to be at least 1")
+
+    def scan(
+            self,
+            query_vectors: list[list[float]],
+            items: Iterable[Any],
+            vector_fn: Callable[[Any], list[float]]
+    ) -> list[list[tuple[float, Any]]]:
+        """Return the (score, item) pairs of the best count items for every query, best first.
+
+        Ties keep the item that came first in the stream.
+        """
+        queries = np.asarray(query_vectors, dtype=np.float32)
+
+        if queries.ndim != 2:
+            raise ValueError("query vectors must all have the same number of dimensions")
+
+        query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        # Zero query vectors score zero against everything.
+        queries = queries / np.where(query_norms > 0, query_norms, 1)
+        heaps = [[] for _ in queries]
+        buffer = np.empty((self.block_size, queries.shape[1]), dtype=np.float32)
+        block = []
+        offset = 0
+
+        for item in items:
+            vector = vector_fn(item)
+
+            if len(vector) != queries.shape[1]:
+                raise ValueError(f"expected vectors with {queries.shape[1]} dimensions, got {len(vector)}")
+
+            buffer[len(block)] = vector
+            block.append(item)
+
+            if len(block) == self.block_size:
+                self._push_block(heaps, queries, buffer, block, offset)
+
+                offset += len(block)
+                block = []
+
+        if block:
+            self._push_block(heaps, queries, buffer, block, offset)
+
+        # Heap entries are (score, -position, item).
+        return [
+            [(score, item) for score, _, item in sorted(heap, key=lambda entry: (-entry[0], -entry[1]))]
+            for heap in heaps
+        ]
+
+    def _push_block(
+            self,
+            heaps: list[list[tuple[float, int, Any]]],
+            queries: np.ndarray,
+            buffer: np.ndarray,
+            block: list[Any],
+            offset: int
+    ) -> None:
+        if self.count == 0:
+            return
+
+        vectors = buffer[:len(block)]
+        norms = np.linalg.norm(vectors, axis=1)
+        scores = (queries @ vectors.T) / np.where(norms > 0, norms, 1)
+
+        for heap, query_scores in zip(heaps, scores):
+            # Only the block's own top count can make it into the heap.
+            if self.count < len(block):
+                candidates = np.argpartition(-query_scores, self.count - 1)[:self.count]
+            else:
+                candidates = range(len(block))
+
+            for i in candidates:
+                # Later positions compare lower, so on equal scores the earlier item stays.
+                entry = (float(query_scores[i]), -(offset + int(i)), block[i])
+
+                if len(heap) < self.count:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
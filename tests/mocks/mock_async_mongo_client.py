@@ -0,0 +1,67 @@
+from typing import Any
+
+
+class MockAsyncMongoClient:
+    """Asyncio facade over a synchronous (e.g. mongomock) client, shaped like pymongo's AsyncMongoClient."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def __getitem__(self, name: str) -> "MockAsyncDatabase":
+        return MockAsyncDatabase(self.client[name])
+
+
+class MockAsyncDatabase:
+    def __init__(self, database: Any):
+        self.database = database
+
+    def __getitem__(self, name: str) -> "MockAsyncCollection":
+        return MockAsyncCollection(self.database[name])
+
+
+class MockAsyncCollection:
+    def __init__(self, collection: Any):
+        self.collection = collection
+
+    async def insert_one(self, *args, **kwargs) -> Any:
+        return self.collection.insert_one(*args, **kwargs)
+
+    async def replace_one(self, *args, **kwargs) -> Any:
+        return self.collection.replace_one(*args, **kwargs)
+
+    async def bulk_write(self, *args, **kwargs) -> Any:
+        return self.collection.bulk_write(*args, **kwargs)
+
+    async def delete_one(self, *args, **kwargs) -> Any:
+        return self.collection.delete_one(*args, **kwargs)
+
+    async def delete_many(self, *args, **kwargs) -> Any:
+        return self.collection.delete_many(*args, **kwargs)
+
+    async def find_one(self, *args, **kwargs) -> Any:
+        return self.collection.find_one(*args, **kwargs)
+
+    def find(self, *args, **kwargs) -> "MockAsyncCursor":
+        return MockAsyncCursor(self.collection.find(*args, **kwargs))
+
+    async def aggregate(self, *args, **kwargs) -> "MockAsyncCursor":
+        return MockAsyncCursor(self.collection.aggregate(*args, **kwargs))
+
+
+class MockAsyncCursor:
+    def __init__(self, cursor: Any):
+        self.cursor = cursor
+
+    def batch_size(self, batch_size: int) -> "MockAsyncCursor":
+        return self
+
+    def __aiter__(self) -> "MockAsyncCursor":
+        self.iterator = iter(self.cursor)
+
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+from typing import Optional
+import numpy as np
+import pinecone
+
+
+class MockPineconeIndex:
+    """In-memory stand-in for pinecone.Index covering the calls made by PineconeVectorStoreDriver."""
+
+    def __init__(self, dimension: int = 2, listing: bool = True):
+        self.dimension = dimension
+        # Pod-based indexes reject listing.
+        self.listing = listing
+        self.namespaces: dict[str, dict[str, tuple[list[float], Optional[dict]]]] = {}
+        self.fetch_calls = 0
+
+    def upsert(self, vectors: list[tuple], namespace: Optional[str] = None, **kwargs) -> dict:
+        records = self.namespaces.setdefault(namespace if namespace else "", {})
+
+        for vector_id, values, metadata in vectors:
+            records[vector_id] = (list(values), metadata)
+
+        return {"upserted_count": len(vectors)}
+
+    def delete(
+            self,
+            ids: Optional[list[str]] = None,
+            delete_all: bool = False,
+            namespace: Optional[str] = None,
+            **kwargs
+    ) -> dict:
+        namespace = namespace if namespace else ""
+
+        if delete_all:
+            self.namespaces.pop(namespace, None)
+        else:
+            for vector_id in ids if ids else []:
+                self.namespaces.get(namespace, {}).pop(vector_id, None)
+
+        return {}
+
+    def fetch(self, ids: list[str], namespace: Optional[str] = None, **kwargs) -> SimpleNamespace:
+        self.fetch_calls += 1
+        namespace = namespace if namespace else ""
+        records = self.namespaces.get(namespace, {})
+        response = {
+            "namespace": namespace,
+            "vectors": {
+                vector_id: {"id": vector_id, "values": records[vector_id][0], "metadata": records[vector_id][1]}
+                for vector_id in ids if vector_id in records
+            }
+        }
+
+        return SimpleNamespace(to_dict=lambda: response)
+
+    def list_paginated(
+            self,
+            namespace: Optional[str] = None,
+            limit: int = 100,
+            pagination_token: Optional[str] = None,
+            **kwargs
+    ) -> SimpleNamespace:
+        if not self.listing:
+            raise pinecone.PineconeApiException(status=400, reason="Bad Request")
+
+        vector_ids = sorted(self.namespaces.get(namespace if namespace else "", {}))
+        start = int(pagination_token) if pagination_token else 0
+        end = start + limit
+
+        return SimpleNamespace(
+            vectors=[SimpleNamespace(id=vector_id) for vector_id in vector_ids[start:end]],
+            pagination=SimpleNamespace(next=str(end)) if end < len(vector_ids) else None
+        )
+
+    def query(
+            self,
+            *,
+            vector: list[float],
+            top_k: int = 10,
+            namespace: Optional[str] = None,
+            include_values: bool = False,
+            include_metadata: bool = False,
+            **kwargs
+    ) -> dict:
+        namespace = namespace if namespace else ""
+        records = list(self.namespaces.get(namespace, {}).items())
+        scores = [float(np.dot(vector, values)) for _, (values, _) in records]
+        matches = sorted(zip(scores, records), key=lambda match: -match[0])[:top_k]
+
+        return {
+            "namespace": namespace,
+            "matches": [
+                {
+                    "id": vector_id,
+                    "score": score,
+                    "values": values if include_values else [],
+                    "metadata": metadata if include_metadata else None
+                }
+                for score, (vector_id, (values, metadata)) in matches
+            ]
+        }
+
+    def describe_index_stats(self, **kwargs) -> dict:
+        return {
+            "dimension": self.dimension,
+            "namespaces": {namespace: {"vector_count": len(records)} for namespace, records in self.namespaces.items()}
+        }
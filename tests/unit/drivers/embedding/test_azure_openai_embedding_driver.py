@@ -1,5 +1,6 @@
 import pytest
 from griptape.drivers import AzureOpenAiEmbeddingDriver
+from griptape.tokenizers import TiktokenTokenizer
 
 
 class TestAzureOpenAiEmbeddingDriver:
@@ -35,3 +36,18 @@ class TestAzureOpenAiEmbeddingDriver:
 
     def test_embed_long_string(self, driver):
         assert driver.embed_long_string("foobar" * 5000) == [0, 1, 0]
+
+    def test_embed_strings(self, driver, mocker):
+        embedding_create = mocker.patch(
+            "openai.Embedding.create",
+            side_effect=lambda input, **kwargs: {
+                "data": [{"index": i, "embedding": [0, 1, 0]} for i in range(len(input))]
+            }
+        )
+        mocker.patch.object(TiktokenTokenizer, "token_count", side_effect=len)
+
+        assert driver.batch_max_items == 16
+        assert driver.batch_max_tokens == driver.tokenizer.max_tokens
+        assert driver.embed_strings(["foo"] * 40) == [[0, 1, 0]] * 40
+        assert sorted(len(call.kwargs["input"]) for call in embedding_create.call_args_list) == [8, 16, 16]
+        assert all(call.kwargs["deployment_id"] == "foobar" for call in embedding_create.call_args_list)
@@ -17,3 +17,9 @@ class TestBaseEmbeddingDriver:
         embedding = driver.embed_string("foobar")
 
         assert embedding == [0, 1]
+
+    def test_embed_strings(self, driver, mocker):
+        mocker.patch.object(MockEmbeddingDriver, "try_embed_string", side_effect=lambda s: [len(s), 1])
+
+        assert driver.embed_strings(["a", "bbb", "cc"]) == [[1, 1], [3, 1], [2, 1]]
+        assert driver.embed_strings([]) == []
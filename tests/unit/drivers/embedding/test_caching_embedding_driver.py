@@ -0,0 +1,79 @@
+import os
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import CachingEmbeddingDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachingEmbeddingDriver:
+    @pytest.fixture
+    def embed(self, mocker):
+        return mocker.patch.object(MockEmbeddingDriver, "try_embed_string", side_effect=lambda s: [len(s), 1])
+
+    @pytest.fixture
+    def driver(self, embed):
+        return CachingEmbeddingDriver(driver=MockEmbeddingDriver())
+
+    def test_init(self, driver):
+        assert driver.dimensions == 42
+        assert driver.model == "MockEmbeddingDriver"
+
+        with pytest.raises(ValueError):
+            CachingEmbeddingDriver(driver=MockEmbeddingDriver(), max_memory_bytes=-1)
+
+    def test_embed_string(self, driver, embed):
+        assert driver.embed_string("foo") == [3, 1]
+        assert driver.embed_string("foo") == [3, 1]
+        assert driver.embed_text_artifact(TextArtifact(" foo\n")) == [3, 1]
+        assert embed.call_count == 1
+        assert driver.stats.memory_hits == 2
+        assert driver.stats.misses == 1
+        assert driver.stats.hit_rate == 2 / 3
+
+    def test_embed_strings(self, driver, embed):
+        assert driver.embed_strings(["a", "bbb", "a"]) == [[1, 1], [3, 1], [1, 1]]
+        assert driver.embed_strings(["bbb", "cc"]) == [[3, 1], [2, 1]]
+        assert driver.embed_strings([]) == []
+        assert [call.args[0] for call in embed.call_args_list] == ["a", "bbb", "cc"]
+
+    def test_memory_limit(self, embed):
+        # Every [n, 1] embedding takes 8 bytes as float32.
+        driver = CachingEmbeddingDriver(driver=MockEmbeddingDriver(), max_memory_bytes=16)
+
+        driver.embed_strings(["a", "bb"])
+        driver.embed_string("a")
+        driver.embed_string("ccc")
+        driver.embed_strings(["a", "bb"])
+
+        assert [call.args[0] for call in embed.call_args_list] == ["a", "bb", "ccc", "bb"]
+
+    def test_persist_path(self, embed, tmpdir):
+        path = os.path.join(tmpdir, "embeddings.sqlite")
+        driver = CachingEmbeddingDriver(driver=MockEmbeddingDriver(), persist_path=path)
+
+        driver.embed_strings(["a", "bb"])
+        driver.close()
+
+        other_driver = CachingEmbeddingDriver(driver=MockEmbeddingDriver(), persist_path=path)
+        other_model_driver = CachingEmbeddingDriver(driver=MockEmbeddingDriver(), model="other", persist_path=path)
+
+        assert other_driver.embed_strings(["bb", "a"]) == [[2, 1], [1, 1]]
+        assert other_driver.embed_string("a") == [1, 1]
+        assert other_driver.stats.disk_hits == 2
+        assert other_driver.stats.memory_hits == 1
+        assert embed.call_count == 2
+
+        other_model_driver.embed_string("a")
+
+        assert embed.call_count == 3
+
+    def test_clear(self, embed, tmpdir):
+        driver = CachingEmbeddingDriver(
+            driver=MockEmbeddingDriver(), persist_path=os.path.join(tmpdir, "embeddings.sqlite")
+        )
+
+        driver.embed_string("a")
+        driver.clear()
+        driver.embed_string("a")
+
+        assert embed.call_count == 2
@@ -1,5 +1,6 @@
 import pytest
 from griptape.drivers import OpenAiEmbeddingDriver
+from griptape.tokenizers import TiktokenTokenizer
 
 
 class TestOpenAiEmbeddingDriver:
@@ -27,3 +28,30 @@ class TestOpenAiEmbeddingDriver:
 
     def test_embed_long_string(self):
         assert OpenAiEmbeddingDriver().embed_long_string("foobar" * 5000) == [0, 1, 0]
+
+    def test_embed_strings(self, mocker):
+        def create(input, **kwargs):
+            # Results come back out of order and are matched to inputs by index.
+            return {
+                "data": [{"index": i, "embedding": [len(s)]} for i, s in reversed(list(enumerate(input)))]
+            }
+
+        embedding_create = mocker.patch("openai.Embedding.create", side_effect=create)
+        mocker.patch.object(TiktokenTokenizer, "token_count", side_effect=len)
+        driver = OpenAiEmbeddingDriver(batch_max_items=3, batch_max_tokens=6)
+
+        assert driver.embed_strings(["a", "bb", "c", "d", "eeeee", "ff"]) == [[1], [2], [1], [1], [5], [2]]
+        assert sorted(call.kwargs["input"] for call in embedding_create.call_args_list) == [
+            ["a", "bb", "c"], ["d", "eeeee"], ["ff"]
+        ]
+
+    def test_embed_strings_long_string(self, mocker):
+        embed_long_string = mocker.patch.object(OpenAiEmbeddingDriver, "embed_long_string", return_value=[1, 0, 0])
+        mocker.patch(
+            "openai.Embedding.create",
+            return_value={"data": [{"index": 0, "embedding": [0, 1, 0]}, {"index": 1, "embedding": [0, 0, 1]}]}
+        )
+        driver = OpenAiEmbeddingDriver()
+
+        assert driver.embed_strings(["foo", "foo " * 10000, "bar"]) == [[0, 1, 0], [1, 0, 0], [0, 0, 1]]
+        assert embed_long_string.call_count == 1
@@ -0,0 +1,215 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import CachingVectorStoreDriver, PineconeVectorStoreDriver, BaseVectorStoreDriver
+from griptape.filters import EqualsMetaFilter
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_pinecone_index import MockPineconeIndex
+
+
+class TestCachingVectorStoreDriver:
+    @pytest.fixture
+    def index(self, mocker):
+        mocker.patch("pinecone.Pinecone.Index", return_value=None)
+
+        index = MockPineconeIndex()
+
+        mocker.spy(index, "query")
+        mocker.spy(index, "fetch")
+
+        return index
+
+    @pytest.fixture
+    def remote(self, index):
+        driver = PineconeVectorStoreDriver(
+            api_key="foobar",
+            index_name="test",
+            environment="test",
+            embedding_driver=MockEmbeddingDriver()
+        )
+        driver.index = index
+
+        return driver
+
+    @pytest.fixture
+    def driver(self, remote):
+        return CachingVectorStoreDriver(driver=remote)
+
+    def test_init(self, driver, remote):
+        assert driver.embedding_driver is remote.embedding_driver
+
+    def test_rejects_server_side_embedding(self, remote, mocker):
+        mocker.patch.object(
+            PineconeVectorStoreDriver, "embeds_server_side", new_callable=mocker.PropertyMock, return_value=True
+        )
+
+        with pytest.raises(ValueError, match="embeds queries server-side"):
+            CachingVectorStoreDriver(driver=remote)
+
+    def test_cached_ranking_matches_driver(self, driver, remote):
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(
+                id=str(i), vector=[np.cos(i / 4), np.sin(i / 4)], meta={"i": i}, namespace="test"
+            ) for i in range(7)
+        ])
+
+        expected = [r.meta["i"] for r in remote.query("foo", namespace="test", count=7)]
+
+        assert expected == [6, 5, 4, 3, 2, 1, 0]
+        assert [r.meta["i"] for r in driver.query("foo", namespace="test", count=7)] == expected
+        assert driver.is_cached("test")
+
+    def test_entries_without_vectors_are_not_cached(self, driver, index, mocker):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        mocker.patch.object(
+            PineconeVectorStoreDriver,
+            "load_entries",
+            return_value=[BaseVectorStoreDriver.Entry(id="foo", vector=[], namespace="test")]
+        )
+
+        assert len(driver.query("foo", namespace="test")) == 1
+        assert len(driver.query("foo", namespace="test")) == 1
+        assert not driver.is_cached("test")
+        assert index.query.call_count == 2
+        assert PineconeVectorStoreDriver.load_entries.call_count == 1
+
+    def test_query_reads_through(self, driver, index):
+        driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]})
+
+        assert not driver.is_cached("test")
+
+        results = driver.query("foo", namespace="test")
+
+        assert len(results) == 2
+        assert driver.is_cached("test")
+        assert index.query.call_count == 0
+
+        driver.query_many(["foo", "bar"], namespace="test")
+        driver.load_entries("test")
+
+        assert index.fetch.call_count == 1
+        assert index.query.call_count == 0
+        assert {driver.load_artifact(r).value for r in results} == {"foo", "bar"}
+
+    def test_query_without_namespace_or_with_kwargs(self, driver, index):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+
+        driver.query("foo")
+        driver.query("foo", namespace="test", include_metadata=False)
+
+        assert index.query.call_count == 2
+        assert not driver.is_cached("test")
+
+    def test_writes_invalidate(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.query("foo", namespace="test")
+        driver.upsert_vector([1, 1], vector_id="bar", namespace="test")
+
+        assert not driver.is_cached("test")
+        assert len(driver.query("foo", namespace="test")) == 2
+
+        driver.delete_vector("foo", namespace="test")
+
+        assert [r.vector for r in driver.query("foo", namespace="test", include_vectors=True)] == [
+            pytest.approx([1, 1])
+        ]
+
+        driver.delete_namespace("test")
+
+        assert driver.query("foo", namespace="test") == []
+
+    def test_lru_eviction(self, remote):
+        driver = CachingVectorStoreDriver(driver=remote, max_cached_entries=3)
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace=namespace)
+            for namespace in ["a", "b", "c"] for i in range(2)
+        ] + [BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace="big") for i in range(4)])
+
+        driver.query("foo", namespace="a")
+
+        assert driver.is_cached("a")
+
+        driver.query("foo", namespace="b")
+
+        assert not driver.is_cached("a") and driver.is_cached("b")
+        assert driver.cache_driver.count_entries() == 2
+        assert len(driver.query("foo", namespace="big", count=10)) == 4
+        assert not driver.is_cached("big") and driver.is_cached("b")
+
+    def test_invalidate(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.query("foo", namespace="test")
+        driver.invalidate()
+
+        assert not driver.is_cached("test")
+        assert driver.cache_driver.count_entries() == 0
+
+    def test_meta_filter_is_answered_from_cache(self, driver, index):
+        driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]}, meta={"color": "red"})
+        driver.upsert_vector([0, 1], vector_id="baz", namespace="test", meta={"color": "blue"})
+
+        blue = EqualsMetaFilter("color", "blue")
+
+        assert [r.meta["color"] for r in driver.query("foo", namespace="test", meta_filter=blue)] == ["blue"]
+        assert [e.id for e in driver.load_entries("test", meta_filter=blue)] == ["baz"]
+        assert index.query.call_count == 0
+
+    def test_concurrent_loads(self, driver, mocker):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="a")
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="b")
+        driver.query("foo", namespace="a")
+
+        started = threading.Event()
+        release = threading.Event()
+        load_entries = PineconeVectorStoreDriver.load_entries
+
+        def slow_load_entries(remote, namespace=None, **kwargs):
+            started.set()
+            release.wait(5)
+
+            return load_entries(remote, namespace, **kwargs)
+
+        slow = mocker.patch.object(
+            PineconeVectorStoreDriver, "load_entries", side_effect=slow_load_entries, autospec=True
+        )
+
+        with ThreadPoolExecutor() as executor:
+            first = executor.submit(driver.query, "foo", namespace="b")
+
+            started.wait(5)
+
+            second = executor.submit(driver.query, "foo", namespace="b")
+
+            # Cached namespaces are answered while another namespace is loading.
+            assert len(driver.query("foo", namespace="a")) == 1
+
+            release.set()
+
+            assert len(first.result()) == 1
+            assert len(second.result()) == 1
+
+        assert slow.call_count == 1
+        assert driver.is_cached("b")
+
+    def test_write_during_load(self, driver, mocker):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+
+        load_entries = PineconeVectorStoreDriver.load_entries
+
+        def racing_load_entries(remote, namespace=None, **kwargs):
+            entries = list(load_entries(remote, namespace, **kwargs))
+
+            driver.upsert_vector([1, 1], vector_id="bar", namespace="test")
+
+            return entries
+
+        mocker.patch.object(
+            PineconeVectorStoreDriver, "load_entries", side_effect=racing_load_entries, autospec=True
+        )
+
+        assert len(driver.query("foo", namespace="test")) == 2
+        assert not driver.is_cached("test")
+        assert driver.cache_driver.count_entries() == 0
@@ -1,6 +1,14 @@
+import asyncio
+import os
+from concurrent import futures
+import numpy as np
 import pytest
 from griptape.artifacts import TextArtifact, BaseArtifact
-from griptape.drivers import LocalVectorStoreDriver
+from griptape.drivers import LocalVectorStoreDriver, BaseVectorStoreDriver
+from griptape.filters import EqualsMetaFilter, InMetaFilter, RangeMetaFilter
+from griptape.indexes import IvfVectorIndex, Bm25TextIndex, MetaFieldIndex
+from griptape.quantizers import Int8VectorQuantizer, ProductVectorQuantizer
+from griptape.reducers import PcaVectorReducer, RandomProjectionVectorReducer
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -34,6 +42,83 @@ class TestLocalVectorStoreDriver:
         assert BaseArtifact.from_json(foo_entries[0].meta["artifact"]).value == "foo"
         assert BaseArtifact.from_json(bar_entries[0].meta["artifact"]).value == "bar"
 
+    def test_init_entries(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            entries={
+                "foo": BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 0.0], meta={"a": 1}),
+                "bar-baz": BaseVectorStoreDriver.Entry(id="baz", vector=[0.0, 2.0], namespace="bar")
+            }
+        )
+
+        assert set(driver.entries.keys()) == {"foo", "bar-baz"}
+        assert driver.load_entry("foo").meta == {"a": 1}
+        assert driver.load_entry("baz", namespace="bar").vector == pytest.approx([0.0, 2.0])
+
+    def test_relatedness_fn(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        assert [r.score for r in driver.query_vector([1.0, 1.0])] == pytest.approx([2 ** -0.5, 2 ** -0.5])
+
+        custom_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            relatedness_fn=lambda x, y: -np.linalg.norm(np.asarray(x) - np.asarray(y))
+        )
+
+        custom_driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        custom_driver.upsert_vector([3.0, 0.0], vector_id="bar")
+
+        assert [r.score for r in custom_driver.query_vector([3.0, 0.0])] == pytest.approx([0.0, -2.0])
+
+    def test_upsert_vector_content_id(self, driver):
+        vector_id = driver.upsert_vector([1, 0.5])
+
+        assert driver.upsert_vector(np.asarray([1, 0.5], dtype=np.float64).tolist()) == vector_id
+        assert driver.count_entries() == 1
+        assert driver.has_ids([vector_id, "foo"]) == [True, False]
+        assert not driver.has_id(vector_id, namespace="test")
+
+    def test_upsert_text_artifacts_skip_existing(self, mocker):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), content_addressed_ids=True)
+        embed_string = mocker.spy(MockEmbeddingDriver, "embed_string")
+        progress = []
+
+        first = driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]}, skip_existing=True)
+        second = list(driver.ingest_text_artifacts(
+            [TextArtifact("foo"), TextArtifact("baz"), TextArtifact("bar")],
+            namespace="test",
+            skip_existing=True,
+            on_progress=progress.append
+        ))
+
+        assert [r.id for r in first] == [driver.content_id(TextArtifact("foo")), driver.content_id(TextArtifact("bar"))]
+        assert [r.id for r in second] == [
+            driver.content_id(TextArtifact("foo")), driver.content_id(TextArtifact("baz")), first[1].id
+        ]
+        assert all(r.error is None for r in first + second)
+        assert embed_string.call_count == 3
+        assert progress[-1].succeeded == 3 and progress[-1].skipped == 2
+        assert driver.count_entries("test") == 3
+        assert driver.upsert_text_artifact(TextArtifact("foo"), namespace="test", skip_existing=True) == first[0].id
+        assert embed_string.call_count == 3
+
+        driver.upsert_text_artifacts({"other": [TextArtifact("foo")]}, skip_existing=True)
+
+        assert embed_string.call_count == 4
+
+    def test_ingest_text_artifacts_has_ids_error(self, mocker):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), upsert_batch_size=2)
+        mocker.patch.object(LocalVectorStoreDriver, "has_ids", side_effect=[Exception("unavailable"), [False]])
+
+        results = list(driver.ingest_text_artifacts(
+            [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")], namespace="test", skip_existing=True
+        ))
+
+        assert [str(r.error) for r in results[:2]] == ["unavailable", "unavailable"]
+        assert results[2].error is None
+        assert driver.count_entries("test") == 1
+
     def test_query(self, driver):
         driver.upsert_text_artifact(
             TextArtifact("foobar"),
@@ -63,3 +148,711 @@ class TestLocalVectorStoreDriver:
         assert len(driver.load_entries()) == 3
         assert len(driver.load_entries("test-namespace-1")) == 2
         assert len(driver.load_entries("test-namespace-2")) == 1
+
+    def test_query_many(self, driver):
+        driver.upsert_vector([1, 0], vector_id="foo", namespace="test")
+        driver.upsert_vector([0, 1], vector_id="bar", namespace="test")
+
+        results = driver.query_many(["foo", "bar", "baz"], count=1, namespace="test", include_vectors=True)
+
+        assert len(results) == 3
+        assert all(len(r) == 1 and r[0].vector == [0, 1] for r in results)
+        assert driver.query_many(["foo"], namespace="bad-namespace") == [[]]
+        assert driver.query_many([]) == []
+
+    def test_query_top_k(self, driver):
+        driver.upsert_vector([1, 0], vector_id="foo")
+        driver.upsert_vector([0.5, 0.5], vector_id="bar")
+        driver.upsert_vector([0, 1], vector_id="baz")
+
+        results = driver.query("foobar", count=2)
+
+        assert len(results) == 2
+        assert results[0].score == pytest.approx(1)
+        assert results[1].score == pytest.approx(0.7071, abs=1e-4)
+        assert len(driver.query("foobar")) == 3
+
+    def test_upsert_vector_overwrites(self, driver):
+        driver.upsert_vector([1, 0], vector_id="foo", meta={"foo": "bar"})
+        driver.upsert_vector([0, 2], vector_id="foo", meta={"foo": "baz"})
+
+        entry = driver.load_entry("foo")
+
+        assert len(driver.entries) == 1
+        assert entry.vector == [0, 2]
+        assert entry.meta == {"foo": "baz"}
+
+    def test_upsert_vector_dimension_mismatch(self, driver):
+        driver.upsert_vector([1, 0], vector_id="foo")
+
+        with pytest.raises(ValueError):
+            driver.upsert_vector([1, 0, 0], vector_id="bar")
+
+    def test_namespaces_do_not_match_by_prefix(self, driver):
+        driver.upsert_vector([1, 0], vector_id="b-c", namespace="a")
+        driver.upsert_vector([0, 1], vector_id="c", namespace="a-b")
+
+        assert driver.count_entries() == 2
+        assert driver.count_entries("a") == 1
+        assert driver.count_entries("a-b") == 1
+        assert [r.namespace for r in driver.query("foobar", namespace="a")] == ["a"]
+        assert driver.load_entry("c", namespace="a-b").vector == [0, 1]
+        assert driver.load_entry("b-c", namespace="a").vector == [1, 0]
+
+    def test_delete_vector(self, driver):
+        driver.upsert_vector([1, 0], vector_id="foo", namespace="test")
+        driver.upsert_vector([0, 1], vector_id="bar", namespace="test")
+        driver.delete_vector("foo", namespace="test")
+
+        assert driver.load_entry("foo", namespace="test") is None
+        assert [e.id for e in driver.load_entries()] == ["bar"]
+        assert len(driver.query("foobar", namespace="test")) == 1
+
+        driver.compact()
+
+        assert [e.id for e in driver.load_entries("test")] == ["bar"]
+        assert driver.query("foobar")[0].score == pytest.approx(1)
+
+    def test_delete_namespace(self, driver):
+        driver.upsert_vector([1, 0], vector_id="foo", namespace="test")
+        driver.upsert_vector([0, 1], vector_id="bar", namespace="test")
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="other")
+        driver.delete_namespace("test")
+
+        assert driver.count_entries("test") == 0
+        assert driver.query("foobar", namespace="test") == []
+        assert [e.id for e in driver.load_entries()] == ["foo"]
+
+    def test_delete_auto_compacts(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        for namespace in ["a", "b", "c"]:
+            driver.upsert_vectors([
+                BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace=namespace)
+                for i in range(LocalVectorStoreDriver.INITIAL_CAPACITY)
+            ])
+
+        driver.delete_namespace("a")
+
+        assert driver._tombstones == LocalVectorStoreDriver.INITIAL_CAPACITY
+
+        driver.delete_namespace("b")
+
+        assert driver._tombstones == 0
+        assert len(driver._keys) == LocalVectorStoreDriver.INITIAL_CAPACITY
+        assert driver.load_entry("1", namespace="c").vector == pytest.approx([1, 1])
+
+    def test_load_artifact(self, driver):
+        artifact = TextArtifact("foobar")
+
+        driver.upsert_text_artifact(artifact, namespace="test")
+
+        entry = driver.load_entries("test")[0]
+
+        assert BaseArtifact.from_json(entry.meta["artifact"]).value == "foobar"
+        assert driver.load_artifact(entry) is artifact
+        assert driver.load_artifact(driver.query("foobar")[0]).embedding == [0, 1]
+
+    def test_load_artifact_from_persist_dir(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test")
+
+        entry = driver.load_entries("test")[0]
+
+        assert entry.artifact is None
+        assert driver.load_artifact(entry).value == "foobar"
+        assert entry.artifact.value == "foobar"
+
+    def test_persist_dir(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        driver.upsert_vector([1, 0], vector_id="foo", namespace="test", meta={"foo": "bar"})
+        driver.upsert_vector([0, 2], vector_id="bar", namespace="test")
+        driver.upsert_vector([0, 3], vector_id="bar", namespace="test")
+
+        reader = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path), read_only=True
+        )
+
+        assert reader.count_entries("test") == 2
+        assert reader.load_entry("foo", namespace="test").meta == {"foo": "bar"}
+        assert reader.load_entry("bar", namespace="test").vector == [0, 3]
+        assert reader.query("foobar", count=1)[0].namespace == "test"
+
+        with pytest.raises(ValueError):
+            reader.upsert_vector([1, 1])
+
+        driver.delete_vector("foo", namespace="test")
+        driver.compact()
+        reader.refresh()
+
+        assert [e.id for e in reader.load_entries("test")] == ["bar"]
+        assert reader.load_entry("bar", namespace="test").vector == [0, 3]
+
+    def test_refresh_applies_changes(self, tmp_path):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path), meta_index=MetaFieldIndex(keys=["foo"])
+        )
+        reader = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            read_only=True,
+            meta_index=MetaFieldIndex(keys=["foo"])
+        )
+
+        driver.upsert_vector([1, 0], vector_id="foo", meta={"foo": "bar"})
+        driver.upsert_vector([0, 2], vector_id="bar")
+        reader.refresh()
+
+        assert reader.count_entries() == 2
+        assert reader.query_vector([1, 0], count=1)[0].meta == {"foo": "bar"}
+
+        driver.upsert_vector([0, 3], vector_id="bar")
+        driver.delete_vector("foo")
+        driver.upsert_vector([1, 1], vector_id="baz", meta={"foo": "baz"})
+        reader.refresh()
+
+        assert reader._storage.generation == 0
+        assert sorted(e.id for e in reader.load_entries()) == ["bar", "baz"]
+        assert reader.load_entry("bar").vector == [0, 3]
+        assert [e.id for e in reader.load_entries(meta_filter=EqualsMetaFilter(key="foo", value="baz"))] == ["baz"]
+
+    def test_index_state_from_persist_dir(self, tmp_path, mocker):
+        vectors = np.random.default_rng(0).normal(size=(300, 2)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            index=IvfVectorIndex(centroid_count=8, nprobe=2, train_size=100, seed=0)
+        )
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors[:200])
+        ])
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors[200:], 200)
+        ])
+        driver.delete_vector("0")
+
+        train = mocker.spy(IvfVectorIndex, "train")
+        reader = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            read_only=True,
+            index=IvfVectorIndex(centroid_count=8, nprobe=2, train_size=100)
+        )
+
+        assert train.call_count == 0
+        assert np.array_equal(reader.index.centroids, driver.index.centroids)
+        assert reader.index._list_sizes.sum() == 299
+        assert [r.meta for r in reader.query_vector(vectors[250], count=1)] == [
+            r.meta for r in driver.query_vector(vectors[250], count=1)
+        ]
+
+        driver.compact()
+        reader.refresh()
+
+        assert train.call_count == 0
+        assert reader.index._list_sizes.sum() == 299
+
+    def test_auto_refresh(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+        reader = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path), read_only=True, auto_refresh=True
+        )
+
+        assert reader.count_entries() == 0
+
+        driver.upsert_vector([1, 0], vector_id="foo")
+
+        assert reader.load_entry("foo").vector == [1, 0]
+
+        driver.delete_vector("foo")
+        driver.upsert_vector([0, 1], vector_id="bar")
+
+        assert [r.vector for r in reader.query_vector([1, 0], include_vectors=True)] == [[0, 1]]
+
+        driver.compact()
+
+        assert reader.count_entries() == 1
+        assert reader._storage.generation == 1
+
+    def test_concurrent_upserts_and_queries(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        def upsert(i: int) -> None:
+            driver.upsert_vector([1, i], vector_id=str(i % 50))
+
+            if i % 7 == 0:
+                driver.delete_vector(str(i % 50))
+
+        def query(_: int) -> int:
+            return len(driver.query_vector([1, 0], count=5))
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            upserts = [executor.submit(upsert, i) for i in range(500)]
+            queries = [executor.submit(query, i) for i in range(500)]
+
+            [future.result() for future in upserts + queries]
+
+        assert driver.count_entries() == len(driver.load_entries())
+        assert len(driver.query_vector([1, 0])) == driver.count_entries()
+
+    def test_reducer(self):
+        vectors = np.random.default_rng(0).normal(size=(20, 8)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), reducer=RandomProjectionVectorReducer(target_dimensions=4, seed=0)
+        )
+
+        driver.upsert_vector(vectors[0], vector_id="0")
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=vectors[i]) for i in range(1, 20)])
+
+        assert driver.dimensions == 4
+        assert driver.load_entry("3").vector == pytest.approx(driver.reducer.reduce(np.asarray([vectors[3]]))[0])
+        assert driver.query_vector(vectors[3], count=1)[0].score == pytest.approx(1)
+        assert driver.exact_query_vectors([vectors[3]], count=1)[0][0].score == pytest.approx(1)
+
+        copy = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), reducer=driver.reducer)
+        copy.upsert_vectors(list(driver.load_entries()))
+
+        assert copy.load_entry("3").vector == driver.load_entry("3").vector
+
+    def test_reducer_needs_training(self, tmp_path):
+        vectors = np.random.default_rng(0).normal(size=(20, 8)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            reducer=PcaVectorReducer(target_dimensions=4)
+        )
+
+        with pytest.raises(ValueError):
+            driver.query_vector(vectors[0])
+
+        results = driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="0", vector=vectors[0])])
+
+        assert isinstance(results[0].error, ValueError)
+
+        driver.train_reducer(vectors)
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=v) for i, v in enumerate(vectors)])
+
+        reader = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            read_only=True,
+            reducer=PcaVectorReducer(target_dimensions=4)
+        )
+
+        assert os.path.exists(tmp_path / "reducer.npz")
+        assert reader.query_vector(vectors[5], count=1, include_vectors=True)[0].vector == pytest.approx(
+            driver.load_entry("5").vector, abs=1e-5
+        )
+
+    def test_query_with_index(self):
+        vectors = np.random.default_rng(0).normal(size=(300, 2)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            index=IvfVectorIndex(centroid_count=8, nprobe=2, train_size=100, seed=0)
+        )
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector, vector_id=str(i), namespace="even" if i % 2 == 0 else "odd")
+
+        exact = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        for i, vector in enumerate(vectors):
+            exact.upsert_vector(vector, vector_id=str(i), namespace="even" if i % 2 == 0 else "odd")
+
+        assert driver.index.is_trained
+        assert driver.query("foobar", count=3)[0].score == pytest.approx(exact.query("foobar", count=1)[0].score)
+        assert all(r.namespace == "odd" for r in driver.query("foobar", count=3, namespace="odd"))
+        assert len(driver.query("foobar", count=3, nprobe=8)) == 3
+
+    def test_overwrite_with_index(self):
+        vectors = np.random.default_rng(0).normal(size=(120, 2))
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            index=IvfVectorIndex(centroid_count=8, nprobe=2, train_size=100, seed=0)
+        )
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector.tolist(), vector_id=str(i % 100))
+
+        for _ in range(10):
+            driver.upsert_vectors([
+                BaseVectorStoreDriver.Entry(id=str(i), vector=vectors[i].tolist()) for i in range(20)
+            ])
+
+        driver.delete_vector("0")
+
+        assert driver.index._list_sizes.sum() == 99
+
+    def test_upsert_vectors(self, driver):
+        results = driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="foo", vector=[1, 0], namespace="test"),
+            BaseVectorStoreDriver.Entry(id=None, vector=[0, 1], namespace="test"),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[1, 1, 1], namespace="test")
+        ], batch_size=2)
+
+        assert results[0].id == "foo" and results[0].error is None
+        assert results[1].id is not None and results[1].error is None
+        assert isinstance(results[2].error, ValueError)
+        assert driver.count_entries("test") == 2
+
+    def test_upsert_text_artifacts_copies_meta(self, driver):
+        meta = {"foo": "bar"}
+        results = driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]}, meta=meta)
+        entries = driver.load_entries("test")
+
+        assert [r.error for r in results] == [None, None]
+        assert meta == {"foo": "bar"}
+        assert [BaseArtifact.from_json(e.meta["artifact"]).value for e in entries] == ["foo", "bar"]
+        assert all(e.meta["foo"] == "bar" for e in entries)
+
+    def test_quantizer(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), quantizer=Int8VectorQuantizer())
+
+        driver.upsert_vector([1, 0], vector_id="foo")
+        driver.upsert_vector([0, 2], vector_id="bar")
+        driver.delete_vector("foo")
+        driver.compact()
+        driver.upsert_vector([1, 1], vector_id="baz")
+
+        assert driver._vectors.shape == (0, 2)
+        assert driver._codes.shape[1] == 6
+        assert [r.score for r in driver.query("foobar")] == pytest.approx([1, 0.7071], abs=1e-2)
+        assert driver.load_entry("bar").vector == pytest.approx([0, 2], abs=1e-2)
+
+    def test_quantizer_rescores_persisted_vectors(self, tmp_path):
+        vectors = np.random.default_rng(0).normal(size=(300, 2)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            quantizer=ProductVectorQuantizer(sub_vector_count=2, centroid_count=16, train_size=100, seed=0),
+            rescore_factor=30
+        )
+        exact = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        for i, vector in enumerate(vectors[:99]):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        assert driver._codes is None
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors[99:], start=99)
+        ])
+        exact.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors)
+        ])
+
+        assert driver.quantizer.is_trained
+        assert driver._codes.shape[1] == 2
+        assert driver.query("foobar", count=1)[0].score == pytest.approx(exact.query("foobar", count=1)[0].score)
+        assert driver.load_entry("5").vector == pytest.approx(vectors[5])
+
+    def test_quantizer_state_from_persist_dir(self, tmp_path, mocker):
+        vectors = np.random.default_rng(0).normal(size=(300, 2)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            quantizer=ProductVectorQuantizer(sub_vector_count=2, centroid_count=16, train_size=100, seed=0)
+        )
+
+        driver.upsert_vectors(
+            [BaseVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors[:200])],
+            batch_size=200
+        )
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors[200:], 200)
+        ])
+
+        train = mocker.spy(ProductVectorQuantizer, "train")
+        encode = mocker.spy(ProductVectorQuantizer, "encode")
+        reader = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            read_only=True,
+            quantizer=ProductVectorQuantizer(sub_vector_count=2, centroid_count=16, train_size=100)
+        )
+
+        assert train.call_count == 0
+        # Only the rows written after the quantizer was trained are encoded again.
+        assert sum(len(call.args[1]) for call in encode.call_args_list) == 100
+        assert np.array_equal(reader.quantizer.codebooks, driver.quantizer.codebooks)
+        assert np.array_equal(reader._codes[:300], driver._codes[:300])
+
+        driver.close()
+        encode.reset_mock()
+        LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_dir=str(tmp_path),
+            read_only=True,
+            quantizer=ProductVectorQuantizer(sub_vector_count=2, centroid_count=16, train_size=100)
+        )
+
+        assert train.call_count == 0
+        assert encode.call_count == 0
+
+    def test_quantizer_dimensions(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), quantizer=ProductVectorQuantizer(sub_vector_count=2)
+        )
+
+        results = driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="foo", vector=[1, 0, 0]),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[0, 1, 0])
+        ])
+
+        assert all(isinstance(r.error, ValueError) for r in results)
+        assert driver.count_entries() == 0
+
+    def test_ingest_text_artifacts(self, driver):
+        progress = []
+        artifacts = (TextArtifact(str(i)) for i in range(7))
+        results = driver.ingest_text_artifacts(
+            artifacts,
+            namespace="test",
+            batch_size=2,
+            max_in_flight_batches=2,
+            on_progress=lambda p: progress.append((p.succeeded, p.failed))
+        )
+
+        assert [r.error for r in results] == [None] * 7
+        assert [driver.load_artifact(e).value for e in driver.load_entries("test")] == [str(i) for i in range(7)]
+        assert progress == [(2, 0), (4, 0), (6, 0), (7, 0)]
+
+    def test_ingest_text_artifacts_embeds_batches(self, driver, mocker):
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+
+        results = list(driver.ingest_text_artifacts([TextArtifact(str(i)) for i in range(5)], batch_size=2))
+
+        assert all(r.error is None for r in results)
+        assert embed_strings.call_count == 3
+        assert driver.count_entries() == 5
+
+    def test_ingest_text_artifacts_reports_failures(self, mocker):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(max_attempts=1))
+        mocker.patch.object(
+            MockEmbeddingDriver, "try_embed_string", side_effect=lambda s: [0, 1] if s != "bad" else 1 / 0
+        )
+
+        results = list(driver.ingest_text_artifacts([TextArtifact("foo"), TextArtifact("bad"), TextArtifact("bar")]))
+
+        assert [r.error is None for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ZeroDivisionError)
+        assert driver.count_entries() == 2
+
+    def test_upsert_text_artifacts_raises_errors(self, mocker):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(max_attempts=1))
+        mocker.patch.object(
+            MockEmbeddingDriver, "try_embed_string", side_effect=lambda s: [0, 1] if s != "bad" else 1 / 0
+        )
+
+        with pytest.raises(ZeroDivisionError):
+            driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bad")]})
+
+        results = driver.upsert_text_artifacts({"other": [TextArtifact("bad")]}, raise_on_error=False)
+
+        assert isinstance(results[0].error, ZeroDivisionError)
+        assert driver.count_entries("test") == 1
+
+    def test_ingest_text_artifacts_cancel(self, driver):
+        consumed = []
+
+        def artifacts():
+            for i in range(100):
+                consumed.append(i)
+
+                yield TextArtifact(str(i))
+
+        results = driver.ingest_text_artifacts(artifacts(), batch_size=5, max_in_flight_batches=2)
+
+        assert next(results).error is None
+
+        results.close()
+
+        assert len(consumed) <= 15
+        assert driver.count_entries() <= 15
+
+    def test_async(self, driver):
+        async def run():
+            await driver.aupsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]})
+
+            return await asyncio.gather(
+                driver.aquery("foo", count=1, namespace="test"),
+                driver.aquery_many(["foo", "bar"], namespace="test"),
+                driver.aload_entries("test")
+            )
+
+        query_results, query_many_results, entries = asyncio.run(run())
+
+        assert len(query_results) == 1
+        assert [len(results) for results in query_many_results] == [2, 2]
+        assert len(entries) == 2
+
+    def test_hybrid_query(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), text_index=Bm25TextIndex())
+
+        driver.upsert_text_artifacts({"test": [
+            TextArtifact("replacement filter for the pump"),
+            TextArtifact("gasket AB-1234 for the pump"),
+            TextArtifact("pump manual")
+        ]})
+
+        for fusion in ["rrf", "weighted"]:
+            results = driver.query("AB-1234", count=3, namespace="test", fusion=fusion)
+
+            assert driver.load_artifact(results[0]).value == "gasket AB-1234 for the pump"
+            assert results[0].score > results[1].score
+
+        assert len(driver.query("AB-1234", namespace="test", hybrid=False)) == 3
+
+        with pytest.raises(ValueError):
+            driver.query("AB-1234", namespace="test", fusion="max")
+
+    def test_hybrid_query_tracks_overwrites_and_deletes(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), text_index=Bm25TextIndex())
+
+        driver.upsert_text_artifact(TextArtifact("gasket AB-1234", id="a"))
+        driver.upsert_text_artifact(TextArtifact("filter", id="b"))
+        driver.upsert_text_artifact(TextArtifact("bearing", id="c"))
+        driver.upsert_text_artifact(TextArtifact("filter AB-1234", id="a"))
+
+        assert driver.load_artifact(driver.query("AB-1234", count=1)[0]).value == "filter AB-1234"
+        assert len(driver.text_index.matches("gasket")) == 0
+
+        driver.delete_vector("a")
+        driver.compact()
+
+        assert driver.text_index.document_count == 2
+        assert driver.load_artifact(driver.query("bearing", count=1)[0]).value == "bearing"
+
+    def test_hybrid_query_from_persist_dir(self, tmp_path):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path), text_index=Bm25TextIndex()
+        )
+
+        driver.upsert_text_artifact(TextArtifact("filter", id="a"))
+        driver.upsert_text_artifact(TextArtifact("gasket AB-1234", id="b"))
+        driver.close()
+
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path), text_index=Bm25TextIndex()
+        )
+
+        assert driver.text_index.document_count == 2
+        assert driver.load_artifact(driver.query("AB-1234", count=1)[0]).value == "gasket AB-1234"
+
+    @pytest.mark.parametrize("meta_index", [None, MetaFieldIndex(keys=["color", "year"])])
+    def test_meta_filter(self, meta_index):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), meta_index=meta_index)
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="a", vector=[1, 0], meta={"color": "red", "year": 2001, "size": 1}),
+            BaseVectorStoreDriver.Entry(id="b", vector=[1, 0.1], meta={"color": "blue", "year": 2005, "size": 2}),
+            BaseVectorStoreDriver.Entry(id="c", vector=[0, 1], meta={"color": "red", "year": 2010, "size": 2}),
+            BaseVectorStoreDriver.Entry(id="d", vector=[1, 0.2], namespace="other", meta={"color": "red"})
+        ])
+
+        red = EqualsMetaFilter("color", "red")
+
+        assert [r.meta["year"] for r in driver.query_vector([1, 0], meta_filter=red & RangeMetaFilter("year", gt=0))] \
+               == [2001, 2010]
+        assert [e.id for e in driver.load_entries(meta_filter=red)] == ["a", "c", "d"]
+        assert [e.id for e in driver.load_entries(meta_filter=InMetaFilter("size", [2]))] == ["b", "c"]
+        assert [e.id for e in driver.load_entries("other", meta_filter=red)] == ["d"]
+        assert driver.query("foo", meta_filter=red & EqualsMetaFilter("size", 3)) == []
+
+        driver.upsert_vector([1, 0], vector_id="a", meta={"color": "green", "year": 2001})
+        driver.delete_vector("c")
+
+        assert driver.query_vector([1, 0], meta_filter=red)[0].namespace == "other"
+
+    def test_meta_filter_with_index_scores_matching_rows_only(self, mocker):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), meta_index=MetaFieldIndex(keys=["n"]))
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], meta={"n": i}) for i in range(100)
+        ])
+
+        score_rows = mocker.spy(LocalVectorStoreDriver, "_score_rows")
+        load_metas = mocker.spy(LocalVectorStoreDriver, "_load_metas")
+        results = driver.query_vector([1, 0], count=10, meta_filter=RangeMetaFilter("n", gte=10, lt=13))
+
+        assert len(score_rows.call_args.args[2]) == 3
+        assert load_metas.call_count == 1
+        assert sorted(r.meta["n"] for r in results) == [10, 11, 12]
+
+    def test_meta_filter_from_persist_dir(self, tmp_path):
+        LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path)).upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="a", vector=[1, 0], meta={"color": "red"}),
+            BaseVectorStoreDriver.Entry(id="b", vector=[0, 1], meta={"color": "blue"})
+        ])
+
+        for meta_index in [None, MetaFieldIndex(keys=["color"])]:
+            driver = LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path), meta_index=meta_index, read_only=True
+            )
+
+            assert [e.id for e in driver.load_entries(meta_filter=EqualsMetaFilter("color", "blue"))] == ["b"]
+            assert driver.query_vector([1, 0], meta_filter=EqualsMetaFilter("color", "blue"))[0].meta == {
+                "color": "blue"
+            }
+
+    def test_exact_query(self, driver):
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace="test", meta={"i": i}) for i in range(20)
+        ])
+
+        exact = driver.exact_query_vectors([[1, 3], [1, 0]], count=3, namespace="test", block_size=4)
+
+        assert [[r.meta["i"] for r in results] for results in exact] == [
+            [r.meta["i"] for r in driver.query_vector([1, 3], count=3, namespace="test")],
+            [0, 1, 2]
+        ]
+        assert exact[0][0].score == pytest.approx(1.0)
+        assert exact[0][0].vector == []
+        assert driver.exact_query("foo", count=1, namespace="test", include_vectors=True)[0].vector == pytest.approx(
+            [1, 19]
+        )
+        assert driver.exact_query_vectors([]) == []
+
+    def test_export_import_entries(self, driver, tmp_path, mocker):
+        driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]}, meta={"color": "red"})
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], meta={"i": i}) for i in range(5)
+        ])
+
+        assert driver.export_entries(str(tmp_path), chunk_size=3) == 7
+        assert sorted(os.listdir(tmp_path))[:2] == ["entries-00000.jsonl", "entries-00001.jsonl"]
+
+        embed_string = mocker.spy(MockEmbeddingDriver, "embed_string")
+        target = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path / "store"))
+        progress = []
+        results = list(
+            target.import_entries(str(tmp_path), batch_size=2, on_progress=lambda p: progress.append(p.succeeded))
+        )
+
+        assert [r.id for r in results] == [e.id for e in driver.load_entries()]
+        assert all(r.error is None for r in results)
+        assert progress[-1] == 7
+        assert [target.load_artifact(e).value for e in target.load_entries("test")] == ["foo", "bar"]
+        assert target.load_entries("test")[0].meta["color"] == "red"
+        assert target.load_entry("3").vector == pytest.approx([1, 3])
+        assert target.load_entry("3").meta == {"i": 3}
+        assert embed_string.call_count == 0
+
+    def test_export_import_entries_namespace(self, driver, tmp_path):
+        driver.upsert_vector([1, 0], vector_id="foo", namespace="a")
+        driver.upsert_vector([0, 1], vector_id="bar", namespace="b")
+
+        assert driver.export_entries(str(tmp_path), namespace="b") == 1
+
+        target = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        assert [r.id for r in target.import_entries(str(tmp_path))] == ["bar"]
+        assert target.load_entry("bar", namespace="b").vector == [0, 1]
+
+        os.remove(tmp_path / "manifest.json")
+
+        with pytest.raises(FileNotFoundError):
+            list(target.import_entries(str(tmp_path)))
@@ -1,7 +1,9 @@
 from collections import namedtuple
+import marqo
 import pytest
 from griptape.drivers import MarqoVectorStoreDriver
 from griptape.artifacts import TextArtifact
+from griptape.filters import EqualsMetaFilter, InMetaFilter, RangeMetaFilter
 
 
 class TestMarqoVectorStorageDriver:
@@ -86,6 +88,7 @@ class TestMarqoVectorStorageDriver:
         mock_index.add_documents.return_value = fake_add_document_response
         mock_index.search.return_value = fake_search_response
         mock_index.get_document.return_value = fake_get_document_response
+        mock_index.get_documents.return_value = {"results": [fake_get_document_response | {"_found": True}]}
 
         # Mock the get_indexes method
         mock_client.get_indexes.return_value = mock_get_indexes_response
@@ -152,6 +155,41 @@ class TestMarqoVectorStorageDriver:
         print(result, type(result))
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_text_artifacts(self, driver, mock_marqo):
+        artifacts = [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")]
+        mock_marqo.index().add_documents.side_effect = lambda docs, **kwargs: {
+            "errors": False,
+            "items": [{"_id": doc["_id"], "result": "created", "status": 201} for doc in docs]
+        }
+
+        results = driver.upsert_text_artifacts({"test": artifacts}, batch_size=2)
+
+        assert [r.id for r in results] == [a.id for a in artifacts]
+        assert all(r.error is None for r in results)
+        assert mock_marqo.index().add_documents.call_count == 2
+
+    def test_upsert_text_artifacts_with_client_batch_size(self, driver, mock_marqo):
+        artifacts = [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")]
+        mock_marqo.index().add_documents.side_effect = lambda docs, **kwargs: [
+            {"errors": False, "items": [{"_id": doc["_id"], "result": "created", "status": 201} for doc in batch]}
+            for batch in [docs[:2], docs[2:]]
+        ]
+        driver.client_batch_size = 2
+
+        results = driver.upsert_text_artifacts({"test": artifacts})
+
+        assert [r.id for r in results] == [a.id for a in artifacts]
+        assert mock_marqo.index().add_documents.call_count == 1
+        assert mock_marqo.index().add_documents.call_args.kwargs["client_batch_size"] == 2
+
+    def test_index_handle_is_reused(self, driver, mock_marqo):
+        mock_marqo.index.reset_mock()
+
+        driver.upsert_text("foo")
+        driver.query("foo", include_vectors=True)
+
+        mock_marqo.index.assert_not_called()
+
     def test_search(self, driver, mock_marqo):
         results = driver.query("Test query")
         mock_marqo.index().search.assert_called()
@@ -161,6 +199,59 @@ class TestMarqoVectorStorageDriver:
         assert results[0].meta["Title"] == "Test Title"
         assert results[0].meta["Description"] == "Test description"
 
+    def test_query_many(self, driver, mock_marqo):
+        mock_marqo.bulk_search.return_value = {
+            "result": [
+                {"hits": [{"_id": "foo", "_score": 0.5, "Description": "foo"}]},
+                {"hits": []}
+            ]
+        }
+
+        results = driver.query_many(["foo", "bar"], count=3, namespace="test")
+
+        mock_marqo.bulk_search.assert_called_once()
+        assert mock_marqo.bulk_search.call_args.args[0][0] == {
+            "q": "foo", "index": "test", "limit": 3, "attributesToRetrieve": ["*"], "filter": "namespace:(test)"
+        }
+        assert results[0][0].score == 0.5
+        assert results[1] == []
+
+    def test_query_meta_filter(self, driver, mock_marqo):
+        driver.query(
+            "foo",
+            namespace="test",
+            meta_filter=(EqualsMetaFilter("title", "a (b)") | InMetaFilter("size", [1, 2]))
+            & RangeMetaFilter("year", gt=2000, lte=2010)
+        )
+
+        assert mock_marqo.index().search.call_args.kwargs["filter_string"] == (
+            "namespace:(test) AND (((title:(a\\ \\(b\\))) OR (size:(1) OR size:(2)))"
+            " AND (year:[2000 TO 2010] AND NOT year:(2000)))"
+        )
+
+        mock_marqo.bulk_search.return_value = {"result": [{"hits": []}]}
+        driver.query_many(["foo"], meta_filter=RangeMetaFilter("year", lt=2000))
+
+        assert mock_marqo.bulk_search.call_args.args[0][0]["filter"] == "(year:[* TO 2000] AND NOT year:(2000))"
+
+    def test_query_escapes_namespace(self, driver, mock_marqo):
+        driver.query("foo", namespace="a) OR (namespace:b")
+
+        assert mock_marqo.index().search.call_args.kwargs["filter_string"] == (
+            "namespace:(a\\)\\ OR\\ \\(namespace\\:b)"
+        )
+
+        with pytest.raises(ValueError):
+            driver.query("foo", meta_filter=InMetaFilter("size", []))
+
+    def test_upsert_text_artifact_meta(self, driver, mock_marqo):
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="test", meta={"color": "red", "namespace": "bad"})
+
+        doc = mock_marqo.index().add_documents.call_args.args[0][0]
+
+        assert doc["color"] == "red"
+        assert doc["namespace"] == "test"
+
     def test_search_with_include_vectors(self, driver, mock_marqo):
         # mock_marqo.index().search.return_value = fake_search_response
         # mock_marqo.index().get_document.return_value = fake_get_document_response
@@ -171,8 +262,9 @@ class TestMarqoVectorStorageDriver:
         # Assert
         mock_marqo.index().search.assert_called_once_with("Test query", limit=5, attributes_to_retrieve=["*"],
                                                           filter_string=None)
-        mock_marqo.index().get_document.assert_called_once_with('5aed93eb-3878-4f12-bc92-0fda01c7d23d',
-                                                                expose_facets=True)
+        mock_marqo.index().get_documents.assert_called_once_with(document_ids=['5aed93eb-3878-4f12-bc92-0fda01c7d23d'],
+                                                                 expose_facets=True)
+        mock_marqo.index().get_document.assert_not_called()
         assert len(results) == 1
         assert results[0].score == 0.6047464
         assert results[0].meta["Title"] == "Test Title"
@@ -193,6 +285,47 @@ class TestMarqoVectorStorageDriver:
                                 -0.01760256476700306]  # The vector values should match the "_embedding" values of
         # title in mock response
 
+    def test_load_entry_not_found(self, driver, mock_marqo):
+        mock_marqo.index().get_document.side_effect = marqo.errors.DocumentNotFoundError("not found")
+
+        assert driver.load_entry("foo") is None
+
+    def test_has_ids(self, driver, mock_marqo):
+        mock_marqo.index().get_documents.return_value = {"results": [
+            {"_id": "foo", "_found": True, "namespace": "test"},
+            {"_id": "bar", "_found": False},
+            {"_id": "baz", "_found": True, "namespace": "other"}
+        ]}
+
+        assert driver.has_ids(["foo", "bar", "baz"], namespace="test") == [True, False, False]
+        mock_marqo.index().get_documents.assert_called_once_with(document_ids=["foo", "bar", "baz"])
+        assert driver.has_ids([]) == []
+
+    def test_upsert_text_artifacts_skip_existing(self, driver, mock_marqo):
+        artifacts = [TextArtifact("foo"), TextArtifact("bar")]
+        mock_marqo.index().get_documents.return_value = {"results": [
+            {"_id": artifacts[0].id, "_found": True, "namespace": "test"},
+            {"_id": artifacts[1].id, "_found": False}
+        ]}
+        mock_marqo.index().add_documents.side_effect = lambda docs, **kwargs: {
+            "errors": False,
+            "items": [{"_id": doc["_id"], "result": "created", "status": 201} for doc in docs]
+        }
+
+        results = driver.upsert_text_artifacts({"test": artifacts}, skip_existing=True)
+
+        assert [r.id for r in results] == [a.id for a in artifacts]
+        assert all(r.error is None for r in results)
+        assert [doc["_id"] for doc in mock_marqo.index().add_documents.call_args.args[0]] == [artifacts[1].id]
+
+        mock_marqo.index().get_documents.return_value = {"results": [
+            {"_id": artifacts[0].id, "_found": True, "namespace": "test"}
+        ]}
+        mock_marqo.index().add_documents.reset_mock()
+
+        assert driver.upsert_text_artifact(artifacts[0], namespace="test", skip_existing=True) == artifacts[0].id
+        mock_marqo.index().add_documents.assert_not_called()
+
     def test_load_entries(self, driver, mock_marqo):
         # Arrange
         fake_search_response = {
@@ -234,3 +367,27 @@ class TestMarqoVectorStorageDriver:
         assert entries[0].vector == [0.1, 0.2, 0.3]
         assert entries[0].meta["Title"] == "Test Title"
         assert entries[0].meta["Description"] == "Test description"
+
+        driver.load_entries("test", meta_filter=EqualsMetaFilter("color", True))
+
+        assert mock_marqo.index().search.call_args.kwargs["filter_string"] == "namespace:(test) AND (color:(true))"
+
+    def test_delete_vector(self, driver, mock_marqo):
+        driver.delete_vector("foo")
+
+        mock_marqo.index().delete_documents.assert_called_once_with(ids=["foo"])
+
+    def test_delete_namespace(self, driver, mock_marqo, mocker):
+        mocker.patch.object(MarqoVectorStoreDriver, "DELETE_BATCH_SIZE", 2)
+        mock_marqo.index().search.side_effect = [
+            {"hits": [{"_id": "a"}, {"_id": "b"}]},
+            {"hits": [{"_id": "c"}]}
+        ]
+
+        driver.delete_namespace("my test")
+
+        assert mock_marqo.index().search.call_args.kwargs["filter_string"] == "namespace:(my\\ test)"
+        assert mock_marqo.index().delete_documents.call_args_list == [
+            mocker.call(ids=["a", "b"]),
+            mocker.call(ids=["c"])
+        ]
@@ -1,8 +1,11 @@
+import asyncio
 import pytest
 import mongomock
 from pymongo import MongoClient
 from griptape.artifacts import TextArtifact
 from griptape.drivers import MongoDbAtlasVectorStoreDriver, BaseVectorStoreDriver
+from griptape.filters import EqualsMetaFilter, InMetaFilter, RangeMetaFilter
+from tests.mocks.mock_async_mongo_client import MockAsyncMongoClient
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -29,12 +32,36 @@ class TestMongoDbAtlasVectorStoreDriver:
         test_id = driver.upsert_text_artifact(artifact)
         assert test_id is not None
 
+    def test_load_artifact(self, driver):
+        artifact = TextArtifact("foo")
+        entry = driver.load_entry(driver.upsert_text_artifact(artifact))
+
+        assert entry.artifact is None
+        assert driver.load_artifact(entry).value == "foo"
+        assert driver.load_artifact(entry).id == artifact.id
+
     def test_upsert_text(self, driver):
         text = "foo"
         vector_id_str = "foo"
         test_id = driver.upsert_text(text, vector_id=vector_id_str)
         assert test_id == vector_id_str
 
+    def test_upsert_vectors(self, driver):
+        results = driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="test"),
+            BaseVectorStoreDriver.Entry(id=None, vector=[0.3, 0.4], namespace="test")
+        ])
+
+        assert results[0].id == "foo"
+        assert all(r.id is not None and r.error is None for r in results)
+        assert len(list(driver.load_entries("test"))) == 2
+
+    def test_upsert_text_artifacts(self, driver):
+        results = driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]})
+
+        assert all(r.error is None for r in results)
+        assert driver.load_entry(results[1].id).namespace == "test"
+
     def test_query(self, driver, monkeypatch):
         mock_query_result = [
             BaseVectorStoreDriver.QueryResult(vector=[0.5, 0.5, 0.5], score=None, meta={}, namespace=None),
@@ -61,9 +88,180 @@ class TestMongoDbAtlasVectorStoreDriver:
         result = driver.load_entry(vector_id_str)
         assert result is not None
 
+    def test_has_ids(self, driver):
+        driver.upsert_vector([0.5, 0.5], vector_id="foo", namespace="test")
+        driver.upsert_vector([0.5, 0.5], vector_id="bar", namespace="other")
+
+        assert driver.has_ids(["foo", "bar", "baz"], namespace="test") == [True, False, False]
+        assert driver.has_ids(["foo", "bar"]) == [True, True]
+
     def test_load_entries(self, driver):
         vector_id_str = "123"
         vector = [0.5, 0.5, 0.5]
         driver.upsert_vector(vector, vector_id=vector_id_str)  # ensure at least one entry exists
         results = list(driver.load_entries())
         assert results is not None and len(results) > 0
+
+    def test_delete(self, driver):
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="test")
+        driver.upsert_vector([0.3, 0.4], vector_id="bar", namespace="test")
+        driver.upsert_vector([0.5, 0.6], vector_id="baz", namespace="other")
+        driver.delete_vector("foo", namespace="other")
+
+        assert driver.load_entry("foo") is not None
+
+        driver.delete_vector("foo", namespace="test")
+
+        assert [e.id for e in driver.load_entries("test")] == ["bar"]
+
+        driver.delete_namespace("test")
+
+        assert [e.id for e in driver.load_entries()] == ["baz"]
+
+    def test_async_delete(self, driver):
+        driver.async_client = MockAsyncMongoClient(driver.client)
+
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="test")
+        driver.upsert_vector([0.3, 0.4], vector_id="bar", namespace="other")
+
+        async def run():
+            await driver.adelete_vector("foo")
+            await driver.adelete_namespace("other")
+
+        asyncio.run(run())
+
+        assert list(driver.load_entries()) == []
+
+    def test_load_entries_projection(self, driver):
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="test", meta={"foo": "bar"})
+        driver.upsert_vector([0.3, 0.4], vector_id="bar", namespace="other")
+
+        entries = list(driver.load_entries("test", include_vectors=False, batch_size=1))
+
+        assert [e.id for e in entries] == ["foo"]
+        assert entries[0].vector == []
+        assert entries[0].meta == {"foo": "bar"}
+
+    def test_query_filters(self, driver, mocker):
+        aggregate = mocker.patch.object(
+            mongomock.collection.Collection,
+            "aggregate",
+            return_value=[{"_id": "foo", "score": 0.5, "namespace": "test", "meta": {"foo": "bar"}}]
+        )
+
+        results = driver.query("foo", count=3, namespace="test", meta_filter=EqualsMetaFilter("foo", "bar"))
+        pipeline = aggregate.call_args.args[0]
+
+        assert pipeline[0]["$search"]["knnBeta"]["filter"] == {
+            "compound": {
+                "filter": [
+                    {"equals": {"path": "namespace", "value": "test"}},
+                    {"equals": {"path": "meta.foo", "value": "bar"}}
+                ]
+            }
+        }
+        assert "vector" not in pipeline[1]["$project"]
+        assert results[0].namespace == "test"
+
+        aggregate.return_value = []
+        driver.query("foo", include_vectors=True)
+        pipeline = aggregate.call_args.args[0]
+
+        assert "filter" not in pipeline[0]["$search"]["knnBeta"]
+        assert pipeline[1]["$project"]["vector"] == 1
+
+    def test_query_compound_filters(self, driver, mocker):
+        aggregate = mocker.patch.object(mongomock.collection.Collection, "aggregate", return_value=[])
+
+        driver.query(
+            "foo",
+            meta_filter=(EqualsMetaFilter("color", "red") | InMetaFilter("size", [1, 2]))
+            & RangeMetaFilter("year", gt=2000, lte=2010)
+        )
+
+        assert aggregate.call_args.args[0][0]["$search"]["knnBeta"]["filter"] == {
+            "compound": {
+                "filter": [
+                    {
+                        "compound": {
+                            "should": [
+                                {"equals": {"path": "meta.color", "value": "red"}},
+                                {"in": {"path": "meta.size", "value": [1, 2]}}
+                            ],
+                            "minimumShouldMatch": 1
+                        }
+                    },
+                    {"range": {"path": "meta.year", "gt": 2000, "lte": 2010}}
+                ]
+            }
+        }
+
+    def test_load_entries_meta_filter(self, driver):
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="test", meta={"color": "red", "year": 2001})
+        driver.upsert_vector([0.3, 0.4], vector_id="bar", namespace="test", meta={"color": "blue", "year": 2005})
+        driver.upsert_vector([0.5, 0.6], vector_id="baz", namespace="other", meta={"color": "red", "year": 2010})
+
+        red = EqualsMetaFilter("color", "red")
+
+        assert [e.id for e in driver.load_entries(meta_filter=red)] == ["foo", "baz"]
+        assert [e.id for e in driver.load_entries("test", meta_filter=red)] == ["foo"]
+        assert [e.id for e in driver.load_entries(meta_filter=red & RangeMetaFilter("year", gt=2001))] == ["baz"]
+        assert [e.id for e in driver.load_entries(meta_filter=InMetaFilter("color", ["blue"]) | red)] == [
+            "foo", "bar", "baz"
+        ]
+
+        driver.async_client = MockAsyncMongoClient(driver.client)
+
+        assert [e.id for e in asyncio.run(driver.aload_entries("test", meta_filter=red))] == ["foo"]
+
+    def test_exact_query_streams_entries(self, driver, mocker):
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1.0, float(i)], namespace="test") for i in range(10)
+        ])
+
+        load_entries = mocker.spy(MongoDbAtlasVectorStoreDriver, "load_entries")
+        results = driver.exact_query_vectors([[0.0, 1.0]], count=2, namespace="test", block_size=3, batch_size=3)
+
+        assert load_entries.call_args.kwargs == {"batch_size": 3}
+        assert [r.score for r in results[0]] == sorted([r.score for r in results[0]], reverse=True)
+        assert len(results[0]) == 2
+        assert results[0][0].namespace == "test"
+
+    def test_async_fallback(self, driver):
+        async def run():
+            vector_id = await driver.aupsert_vector([0.1, 0.2], vector_id="foo", namespace="test")
+            entries = await driver.aload_entries("test")
+
+            return vector_id, entries
+
+        vector_id, entries = asyncio.run(run())
+
+        assert vector_id == "foo"
+        assert [e.id for e in entries] == ["foo"]
+
+    def test_async_native(self, driver, mocker):
+        driver.async_client = MockAsyncMongoClient(driver.client)
+        aggregate = mocker.patch.object(
+            mongomock.collection.Collection,
+            "aggregate",
+            return_value=[{"_id": "foo", "score": 0.5, "namespace": "test", "meta": {}}]
+        )
+
+        async def run():
+            results = await driver.aupsert_vectors([
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="test"),
+                BaseVectorStoreDriver.Entry(id=None, vector=[0.3, 0.4], namespace="test")
+            ])
+            entry = await driver.aload_entry("foo")
+            entries = await driver.aload_entries("test", include_vectors=False)
+            query_results = await driver.aquery_many(["foo", "bar"], namespace="test")
+
+            return results, entry, entries, query_results
+
+        results, entry, entries, query_results = asyncio.run(run())
+
+        assert [r.error for r in results] == [None, None]
+        assert entry.vector == [0.1, 0.2]
+        assert len(entries) == 2 and all(e.vector == [] for e in entries)
+        assert [len(r) for r in query_results] == [1, 1]
+        assert aggregate.call_count == 2
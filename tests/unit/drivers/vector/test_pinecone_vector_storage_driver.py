@@ -1,7 +1,11 @@
+import pinecone
 import pytest
 from griptape.artifacts import TextArtifact
-from griptape.drivers import PineconeVectorStoreDriver
+from griptape.drivers import PineconeVectorStoreDriver, BaseVectorStoreDriver
+from griptape.filters import EqualsMetaFilter, InMetaFilter, RangeMetaFilter
+from griptape.reducers import RandomProjectionVectorReducer
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_pinecone_index import MockPineconeIndex
 
 
 class TestPineconeVectorStorageDriver:
@@ -26,10 +30,10 @@ class TestPineconeVectorStorageDriver:
             "namespace": "foobar"
         }
 
-        mocker.patch("pinecone.init", return_value=None)
+        mocker.patch("pinecone.Pinecone.Index", return_value=pinecone.Index(api_key="foobar", host="https://test"))
         mocker.patch("pinecone.Index.upsert", return_value=None)
         mocker.patch("pinecone.Index.query", return_value=fake_query_response)
-        mocker.patch("pinecone.create_index", return_value=None)
+        mocker.patch("pinecone.Pinecone.create_index", return_value=None)
 
     @pytest.fixture
     def driver(self):
@@ -53,8 +57,186 @@ class TestPineconeVectorStorageDriver:
         assert driver.upsert_text("foo", vector_id="foo") == "foo"
         assert isinstance(driver.upsert_text("foo"), str)
 
+    def test_upsert_vectors(self, driver, mocker):
+        upsert = mocker.patch("pinecone.Index.upsert", return_value=None)
+        results = driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1], namespace="a"),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0], namespace="b"),
+            BaseVectorStoreDriver.Entry(id="baz", vector=[1, 1], namespace="a")
+        ])
+
+        assert [r.id for r in results] == ["foo", "bar", "baz"]
+        assert upsert.call_count == 2
+        assert upsert.call_args_list[0].args[0] == [("foo", [0, 1], None), ("baz", [1, 1], None)]
+
+    def test_has_ids(self, driver, mocker):
+        mocker.patch.object(PineconeVectorStoreDriver, "LOAD_BATCH_SIZE", 2)
+        driver.index = MockPineconeIndex()
+
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.upsert_vector([1, 0], vector_id="bar", namespace="test")
+
+        assert driver.has_ids(["bar", "baz", "foo"], namespace="test") == [True, False, True]
+        assert driver.index.fetch_calls == 2
+        assert not driver.has_id("foo")
+
+    def test_reducer(self, mocker):
+        driver = PineconeVectorStoreDriver(
+            api_key="foobar",
+            index_name="test",
+            environment="test",
+            embedding_driver=MockEmbeddingDriver(),
+            reducer=RandomProjectionVectorReducer(target_dimensions=2, seed=0)
+        )
+        driver.index = mocker.Mock(wraps=MockPineconeIndex())
+
+        driver.upsert_vector([1, 0, 0, 1], vector_id="foo", namespace="test")
+        driver.query_vector([1, 0, 0, 1], namespace="test")
+
+        assert len(driver.load_entry("foo", namespace="test").vector) == 2
+        assert len(driver.index.query.call_args.kwargs["vector"]) == 2
+
+    def test_load_entry(self, driver):
+        driver.index = MockPineconeIndex()
+
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test", meta={"foo": "bar"})
+
+        assert driver.load_entry("foo", namespace="test").meta == {"foo": "bar"}
+        assert driver.load_entry("bar", namespace="test") is None
+
+    def test_load_entries(self, driver, mocker):
+        embed_string = mocker.spy(MockEmbeddingDriver, "embed_string")
+        driver.index = MockPineconeIndex()
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=f"foo-{i:02}", vector=[i, 1], namespace="test") for i in range(25)
+        ])
+        driver.upsert_vector([0, 1], vector_id="bar")
+
+        entries = driver.load_entries("test", batch_size=10)
+
+        assert [e.id for e in entries] == [f"foo-{i:02}" for i in range(25)]
+        assert driver.index.fetch_calls == 3
+        assert [e.id for e in driver.load_entries()] == ["bar"]
+        assert embed_string.call_count == 0
+
+    def test_load_entries_without_listing(self, driver, mocker):
+        embed_string = mocker.spy(MockEmbeddingDriver, "embed_string")
+        driver.index = MockPineconeIndex(listing=False)
+
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test", meta={"foo": "bar"})
+        driver.upsert_vector([1, 1], vector_id="bar", namespace="test")
+
+        entries = list(driver.load_entries("test"))
+
+        assert sorted(e.id for e in entries) == ["bar", "foo"]
+        assert {e.id: e.vector for e in entries} == {"foo": [0, 1], "bar": [1, 1]}
+        assert [e.meta for e in entries if e.id == "foo"] == [{"foo": "bar"}]
+        assert embed_string.call_count == 0
+
+    def test_export_entries_without_listing(self, driver, tmp_path):
+        driver.index = MockPineconeIndex(listing=False)
+
+        driver.upsert_vector([1, 2], vector_id="foo", namespace="test")
+
+        assert driver.export_entries(str(tmp_path), namespace="test") == 1
+        assert driver.exact_query_vectors([[1, 2]], namespace="test", include_vectors=True)[0][0].vector == [1, 2]
+
+    def test_delete(self, driver):
+        driver.index = MockPineconeIndex()
+
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.upsert_vector([1, 0], vector_id="bar", namespace="test")
+        driver.upsert_vector([1, 0], vector_id="bar", namespace="other")
+        driver.delete_vector("foo", namespace="test")
+
+        assert [e.id for e in driver.load_entries("test")] == ["bar"]
+
+        driver.delete_namespace("test")
+
+        assert list(driver.load_entries("test")) == []
+        assert driver.load_entry("bar", namespace="other") is not None
+
     def test_query(self, driver):
         assert driver.query("test")[0].vector == [0, 1, 0]
 
+    def test_query_many(self, driver, mocker):
+        query = mocker.patch("pinecone.Index.query", return_value={
+            "matches": [{"values": [0, 1, 0], "score": 42, "metadata": {"foo": "bar"}}], "namespace": "foobar"
+        })
+
+        results = driver.query_many(["foo", "bar"], count=3, namespace="foobar")
+
+        assert query.call_count == 2
+        assert [call.kwargs["vector"] for call in query.call_args_list] == [[0, 1], [0, 1]]
+        assert [[r.meta for r in result] for result in results] == [[{"foo": "bar"}], [{"foo": "bar"}]]
+
+    def test_query_meta_filter(self, driver, mocker):
+        query = mocker.patch("pinecone.Index.query", return_value={"matches": [], "namespace": "foobar"})
+        meta_filter = (EqualsMetaFilter("color", "red") | InMetaFilter("size", [1, 2])) & RangeMetaFilter(
+            "year", gte=2000, lt=2010
+        )
+
+        driver.query("foo", meta_filter=meta_filter)
+
+        assert query.call_args.kwargs["filter"] == {
+            "$and": [
+                {"$or": [{"color": {"$eq": "red"}}, {"size": {"$in": [1, 2]}}]},
+                {"year": {"$gte": 2000, "$lt": 2010}}
+            ]
+        }
+
+        driver.query("foo")
+
+        assert "filter" not in query.call_args.kwargs
+
+    def test_load_entries_meta_filter(self, driver, mocker):
+        driver.index = MockPineconeIndex()
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1], namespace="test", meta={"color": "red"}),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0], namespace="test", meta={"color": "blue"})
+        ])
+
+        assert [e.id for e in driver.load_entries("test", meta_filter=EqualsMetaFilter("color", "red"))] == ["foo"]
+
+        query = mocker.spy(driver.index, "query")
+        driver.index.listing = False
+
+        list(driver.load_entries("test", meta_filter=EqualsMetaFilter("color", "red")))
+
+        assert query.call_args.kwargs["filter"] == {"color": {"$eq": "red"}}
+
+    def test_export_import_entries(self, driver, tmp_path, mocker):
+        driver.index = MockPineconeIndex()
+
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=f"foo-{i}", vector=[1, i], namespace="test", meta={"i": i}) for i in range(5)
+        ])
+
+        assert driver.export_entries(str(tmp_path), namespace="test", batch_size=2) == 5
+
+        upsert = mocker.spy(driver.index, "upsert")
+        driver.index.namespaces.clear()
+        results = list(driver.import_entries(str(tmp_path), batch_size=2))
+
+        assert all(r.error is None for r in results)
+        assert upsert.call_count == 3
+        assert driver.load_entry("foo-3", namespace="test").meta == {"i": 3}
+        assert driver.load_entry("foo-3", namespace="test").vector == [1, 3]
+
+    def test_project_name_deprecated(self):
+        with pytest.warns(DeprecationWarning):
+            driver = PineconeVectorStoreDriver(
+                api_key="foobar",
+                index_name="test",
+                environment="test",
+                project_name="test",
+                embedding_driver=MockEmbeddingDriver()
+            )
+
+        assert driver.project_name == "test"
+
     def test_create_index(self, driver):
         assert driver.create_index("test") is None
+        assert isinstance(driver.client.create_index.call_args.kwargs["spec"], pinecone.PodSpec)
@@ -0,0 +1,125 @@
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import ShardedVectorStoreDriver, LocalVectorStoreDriver, BaseVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestShardedVectorStoreDriver:
+    @pytest.fixture
+    def shards(self):
+        return [LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()) for _ in range(3)]
+
+    @pytest.fixture
+    def driver(self, shards):
+        return ShardedVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shards=shards)
+
+    def test_init(self, shards):
+        with pytest.raises(ValueError, match="at least one shard is required"):
+            ShardedVectorStoreDriver(shards=[])
+
+        with pytest.raises(ValueError):
+            ShardedVectorStoreDriver(shards=shards, routing="random")
+
+        assert ShardedVectorStoreDriver(shards=shards).embedding_driver is shards[0].embedding_driver
+
+    def test_query_with_different_embedding_models(self, shards, mocker):
+        shards[1] = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(dimensions=3))
+        driver = ShardedVectorStoreDriver(shards=shards)
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+        query_many = mocker.spy(LocalVectorStoreDriver, "query_many")
+
+        driver.upsert_text_artifacts({"test": [TextArtifact(str(i)) for i in range(10)]})
+
+        assert sum(shard.count_entries("test") for shard in shards) == 10
+
+        embed_strings.reset_mock()
+
+        assert len(driver.query("foo", count=4, namespace="test")) == 4
+        assert query_many.call_count == 3
+        assert embed_strings.call_count == 3
+        assert {id(call.args[0]) for call in embed_strings.call_args_list} == {
+            id(shard.embedding_driver) for shard in shards
+        }
+
+    def test_upsert_vectors_by_hash(self, driver, shards):
+        results = driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace="test") for i in range(30)
+        ])
+
+        assert [r.id for r in results] == [str(i) for i in range(30)]
+        assert all(shard.count_entries("test") > 0 for shard in shards)
+        assert sum(shard.count_entries() for shard in shards) == 30
+        assert driver.load_entry("7", namespace="test").vector == pytest.approx([1, 7])
+        assert len(list(driver.load_entries("test"))) == 30
+
+    def test_has_ids(self, driver, shards):
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace="test") for i in range(10)
+        ])
+
+        assert driver.has_ids([str(i) for i in range(12)], namespace="test") == [True] * 10 + [False] * 2
+        assert driver.has_ids(["3"]) == [False]
+
+    def test_upsert_by_namespace(self, shards):
+        driver = ShardedVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shards=shards, routing="namespace")
+
+        driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]})
+
+        assert [shard.count_entries("test") for shard in shards].count(2) == 1
+        assert len(driver.query("foo", count=5, namespace="test")) == 2
+        assert sum(stats.query_count for stats in driver.shard_stats) == 1
+
+    def test_upsert_text_artifacts_keeps_artifacts(self, driver):
+        artifacts = [TextArtifact(str(i)) for i in range(10)]
+        results = driver.upsert_text_artifacts({"test": artifacts})
+
+        assert [r.id for r in results] == [a.id for a in artifacts]
+        assert sorted(driver.load_artifact(e).value for e in driver.load_entries("test")) == sorted(
+            a.value for a in artifacts
+        )
+
+    def test_query_merges_shards(self, driver):
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[i, 10 - i]) for i in range(11)
+        ])
+
+        results = driver.query("foo", count=3, include_vectors=True)
+
+        assert [r.vector for r in results] == [pytest.approx(v) for v in [[0, 10], [1, 9], [2, 8]]]
+        assert results[0].score == pytest.approx(1)
+        assert len(driver.query("foo")) == 11
+        assert all(stats.query_count == 2 and stats.last_latency > 0 for stats in driver.shard_stats)
+
+    def test_query_many(self, driver):
+        driver.upsert_vectors([BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i]) for i in range(10)])
+
+        results = driver.query_many(["foo", "bar"], count=4)
+
+        assert [len(r) for r in results] == [4, 4]
+        assert driver.query_many([]) == []
+
+    def test_delete(self, driver, shards):
+        driver.upsert_vectors([
+            BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i], namespace="test") for i in range(10)
+        ] + [BaseVectorStoreDriver.Entry(id="foo", vector=[1, 1], namespace="other")])
+
+        driver.delete_vector("3", namespace="test")
+
+        assert driver.load_entry("3", namespace="test") is None
+
+        driver.delete_namespace("test")
+
+        assert list(driver.load_entries("test")) == []
+        assert sum(shard.count_entries() for shard in shards) == 1
+
+    def test_failing_shard(self, shards, mocker):
+        shards[0] = mocker.Mock(upsert_vectors=mocker.Mock(side_effect=Exception("shard down")))
+        driver = ShardedVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shards=shards)
+        entries = [BaseVectorStoreDriver.Entry(id=str(i), vector=[1, i]) for i in range(30)]
+
+        results = driver.upsert_vectors(entries)
+
+        failed = [r.id for r in results if r.error]
+
+        assert 0 < len(failed) < 30
+        assert all(driver.shard_for(vector_id) == 0 for vector_id in failed)
@@ -29,6 +29,14 @@ class TestVectorQueryEngine:
 
         assert engine.query("foo").value.startswith("mock output")
 
+    def test_query_many(self, engine):
+        engine.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")], namespace="test")
+
+        results = engine.query_many(["foo", "bar"], namespace="test")
+
+        assert len(results) == 2
+        assert all(r.value.startswith("mock output") for r in results)
+
     def test_upsert_text_artifact(self, engine):
         engine.upsert_text_artifact(
             TextArtifact("foobar"),
@@ -58,3 +66,10 @@ class TestVectorQueryEngine:
         assert BaseArtifact.from_json(engine.vector_store_driver.load_entries()[0].meta["artifact"]).value == "foobar1"
         assert BaseArtifact.from_json(engine.vector_store_driver.load_entries()[1].meta["artifact"]).value == "foobar2"
 
+
+    def test_upsert_text_artifacts_failure(self, engine, mocker):
+        mocker.patch.object(MockEmbeddingDriver, "try_embed_string", side_effect=Exception("unavailable"))
+        engine.vector_store_driver.embedding_driver.max_attempts = 1
+
+        with pytest.raises(Exception, match="unavailable"):
+            engine.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")], namespace="test")
@@ -0,0 +1,19 @@
+from griptape.filters import AndMetaFilter, EqualsMetaFilter, RangeMetaFilter
+
+
+class TestAndMetaFilter:
+    def test_matches(self):
+        meta_filter = AndMetaFilter([EqualsMetaFilter("color", "red"), RangeMetaFilter("size", gt=1)])
+
+        assert meta_filter.matches({"color": "red", "size": 2})
+        assert not meta_filter.matches({"color": "red", "size": 1})
+        assert not meta_filter.matches({"color": "blue", "size": 2})
+
+    def test_operator(self):
+        red = EqualsMetaFilter("color", "red")
+        large = RangeMetaFilter("size", gt=1)
+        heavy = RangeMetaFilter("weight", gt=10)
+
+        assert (red & large) == AndMetaFilter([red, large])
+        assert (red & large & heavy) == AndMetaFilter([red, large, heavy])
+        assert (red & large & heavy).keys() == {"color", "size", "weight"}
@@ -0,0 +1,14 @@
+from griptape.filters import EqualsMetaFilter
+
+
+class TestEqualsMetaFilter:
+    def test_matches(self):
+        meta_filter = EqualsMetaFilter("color", "red")
+
+        assert meta_filter.matches({"color": "red"})
+        assert not meta_filter.matches({"color": "blue"})
+        assert not meta_filter.matches({"size": 1})
+        assert not meta_filter.matches(None)
+
+    def test_keys(self):
+        assert EqualsMetaFilter("color", "red").keys() == {"color"}
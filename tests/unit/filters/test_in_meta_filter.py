@@ -0,0 +1,15 @@
+from griptape.filters import InMetaFilter
+
+
+class TestInMetaFilter:
+    def test_matches(self):
+        meta_filter = InMetaFilter("color", ["red", "green"])
+
+        assert meta_filter.matches({"color": "red"})
+        assert meta_filter.matches({"color": "green"})
+        assert not meta_filter.matches({"color": "blue"})
+        assert not meta_filter.matches({})
+        assert not InMetaFilter("color", []).matches({"color": "red"})
+
+    def test_keys(self):
+        assert InMetaFilter("color", ["red"]).keys() == {"color"}
@@ -0,0 +1,19 @@
+from griptape.filters import OrMetaFilter, EqualsMetaFilter, InMetaFilter
+
+
+class TestOrMetaFilter:
+    def test_matches(self):
+        meta_filter = OrMetaFilter([EqualsMetaFilter("color", "red"), InMetaFilter("size", [1, 2])])
+
+        assert meta_filter.matches({"color": "red"})
+        assert meta_filter.matches({"color": "blue", "size": 2})
+        assert not meta_filter.matches({"color": "blue", "size": 3})
+        assert not OrMetaFilter([]).matches({"color": "red"})
+
+    def test_operator(self):
+        red = EqualsMetaFilter("color", "red")
+        blue = EqualsMetaFilter("color", "blue")
+        small = InMetaFilter("size", [1])
+
+        assert (red | blue | small) == OrMetaFilter([red, blue, small])
+        assert ((red | blue) & small).filters[0] == OrMetaFilter([red, blue])
@@ -0,0 +1,44 @@
+import pytest
+from griptape.filters import RangeMetaFilter
+
+
+class TestRangeMetaFilter:
+    def test_matches(self):
+        meta_filter = RangeMetaFilter("year", gte=2000, lt=2010)
+
+        assert meta_filter.matches({"year": 2000})
+        assert meta_filter.matches({"year": 2009.5})
+        assert not meta_filter.matches({"year": 2010})
+        assert not meta_filter.matches({"year": 1999})
+        assert not meta_filter.matches({"year": None})
+        assert not meta_filter.matches({})
+
+    def test_matches_exclusive_and_inclusive(self):
+        assert not RangeMetaFilter("year", gt=2000).matches({"year": 2000})
+        assert RangeMetaFilter("year", lte=2000).matches({"year": 2000})
+
+    def test_matches_strings(self):
+        meta_filter = RangeMetaFilter("date", gte="2023-01-01", lte="2023-12-31")
+
+        assert meta_filter.matches({"date": "2023-06-15"})
+        assert not meta_filter.matches({"date": "2024-01-01"})
+
+    def test_incomparable_values_dont_match(self):
+        assert not RangeMetaFilter("year", gt=2000).matches({"year": "2001"})
+
+    def test_bounds(self):
+        meta_filter = RangeMetaFilter("year", gt=1, lte=5)
+
+        assert meta_filter.lower == 1
+        assert meta_filter.upper == 5
+
+    def test_requires_bound(self):
+        with pytest.raises(ValueError):
+            RangeMetaFilter("year")
+
+    def test_rejects_conflicting_bounds(self):
+        with pytest.raises(ValueError):
+            RangeMetaFilter("year", gt=2000, gte=2001)
+
+        with pytest.raises(ValueError):
+            RangeMetaFilter("year", lt=2010, lte=2009)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from griptape.indexes import Bm25TextIndex
+
+
+class TestBm25TextIndex:
+    @pytest.fixture
+    def index(self):
+        index = Bm25TextIndex()
+
+        index.add([0, 1, 2], ["red apple pie", "green apple", "part AB-1234 gasket"])
+
+        return index
+
+    def test_tokenize(self, index):
+        assert index.tokenize("Part AB-1234, v1.2!") == ["part", "ab-1234", "v1.2"]
+
+    def test_matches(self, index):
+        assert index.matches("apple").tolist() == [0, 1]
+        assert index.matches("ab-1234").tolist() == [2]
+        assert len(index.matches("banana")) == 0
+
+    def test_scores(self, index):
+        scores = index.scores("green apple", np.arange(3))
+
+        assert scores[1] > scores[0] > 0
+        assert scores[2] == 0
+
+    def test_scores_ignore_rows_outside_request(self, index):
+        assert index.scores("gasket", np.array([0, 1])).tolist() == [0, 0]
+
+    def test_overwrite(self, index):
+        index.add([1], ["blue gasket"])
+
+        assert index.document_count == 3
+        assert index.matches("green").tolist() == []
+        assert index.matches("gasket").tolist() == [1, 2]
+
+    def test_remove(self, index):
+        index.remove([0, 5])
+
+        assert index.document_count == 2
+        assert index.matches("apple").tolist() == [1]
+        assert index.scores("red", np.arange(3)).tolist() == [0, 0, 0]
+
+    def test_compaction(self, index):
+        fresh = Bm25TextIndex()
+
+        fresh.add([0, 1, 2], ["red apple pie", "green gasket", "part AB-1234 gasket"])
+
+        for _ in range(20):
+            index.add([1], ["green gasket"])
+
+        assert index._retired_count <= max(index.INITIAL_CAPACITY, index.document_count)
+        assert sum(index._posting_sizes) < 30
+        assert index.scores("apple gasket", np.arange(3)).tolist() == pytest.approx(
+            fresh.scores("apple gasket", np.arange(3)).tolist()
+        )
+        assert index.matches("gasket").tolist() == [1, 2]
+
+    def test_clear(self, index):
+        index.clear()
+
+        assert index.document_count == 0
+        assert len(index.matches("apple")) == 0
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from griptape.indexes import IvfVectorIndex
+
+
+class TestIvfVectorIndex:
+    @pytest.fixture
+    def vectors(self):
+        vectors = np.random.default_rng(0).normal(size=(500, 8)).astype(np.float32)
+
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    @pytest.fixture
+    def index(self):
+        return IvfVectorIndex(centroid_count=10, nprobe=2, train_size=100, seed=0)
+
+    def test_untrained_index_scans_everything(self, index, vectors):
+        index.add(np.arange(50), vectors[:50])
+
+        assert not index.is_trained
+        assert index.candidates(vectors[0]) is None
+        assert index.candidate_count(50) == 50
+
+    def test_train_on_threshold(self, index, vectors):
+        index.add(np.arange(50), vectors[:50])
+        index.add(np.arange(50, 100), vectors[50:100])
+
+        assert index.is_trained
+        assert index.centroids.shape == (10, 8)
+        assert index.candidate_count(100) == 20
+
+    def test_candidates(self, index, vectors):
+        index.add(np.arange(500), vectors)
+
+        candidates = index.candidates(vectors[42])
+
+        assert 42 in candidates
+        assert len(candidates) < 500
+        assert len(index.candidates(vectors[42], nprobe=10)) == 500
+
+    def test_incremental_add(self, index, vectors):
+        index.add(np.arange(400), vectors[:400])
+        centroids = index.centroids.copy()
+
+        index.add(np.arange(400, 500), vectors[400:])
+
+        assert np.array_equal(centroids, index.centroids)
+        assert 450 in index.candidates(vectors[450])
+
+    def test_remove(self, index, vectors):
+        index.add(np.arange(50), vectors[:50])
+        index.remove(np.array([0, 1]))
+        index.add(np.arange(50, 150), vectors[50:150])
+
+        assert index.is_trained
+        assert index._list_sizes.sum() == 148
+
+        index.remove(np.array([100, 1000]))
+
+        assert 100 not in index.candidates(vectors[100], nprobe=10)
+        assert index._list_sizes.sum() == 147
+
+    def test_add_existing_rows(self, index, vectors):
+        index.add(np.arange(200), vectors[:200])
+
+        for _ in range(5):
+            index.add(np.arange(20), vectors[200:220])
+
+        index.add(np.array([30, 30]), vectors[[0, 1]])
+
+        candidates = index.candidates(vectors[1], nprobe=10)
+
+        assert len(candidates) == 200
+        assert 30 in index.candidates(vectors[1], nprobe=1)
+
+    def test_state(self, index, vectors):
+        assert index.state() == {}
+
+        index.add(np.arange(300), vectors[:300])
+        index.remove(np.array([7]))
+
+        loaded = IvfVectorIndex(centroid_count=10, nprobe=2, train_size=100)
+        loaded.load_state(index.state())
+
+        assert np.array_equal(loaded.centroids, index.centroids)
+        assert np.array_equal(np.sort(loaded.candidates(vectors[42])), np.sort(index.candidates(vectors[42])))
+
+        loaded.add(np.arange(300, 500), vectors[300:])
+
+        assert len(loaded.candidates(vectors[0], nprobe=10)) == 499
+
+        with pytest.raises(ValueError):
+            IvfVectorIndex(centroid_count=5).load_state(index.state())
+
+    def test_clear(self, index, vectors):
+        index.add(np.arange(500), vectors)
+        index.clear()
+
+        assert index.is_trained
+        assert len(index.candidates(vectors[0], nprobe=10)) == 0
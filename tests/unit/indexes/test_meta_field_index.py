@@ -0,0 +1,63 @@
+import pytest
+from griptape.filters import EqualsMetaFilter, InMetaFilter, RangeMetaFilter
+from griptape.indexes import MetaFieldIndex
+
+
+class TestMetaFieldIndex:
+    @pytest.fixture
+    def index(self):
+        index = MetaFieldIndex(keys=["color", "year"])
+
+        index.add(
+            [0, 1, 2, 3],
+            [
+                {"color": "red", "year": 2001},
+                {"color": "blue", "year": 2005, "tags": ["a"]},
+                {"color": "red", "year": "unknown"},
+                None
+            ]
+        )
+
+        return index
+
+    def test_equals(self, index):
+        assert index.candidate_rows(EqualsMetaFilter("color", "red")).tolist() == [0, 2]
+        assert index.candidate_rows(EqualsMetaFilter("color", "green")).tolist() == []
+
+    def test_in(self, index):
+        assert index.candidate_rows(InMetaFilter("color", ["red", "blue"])).tolist() == [0, 1, 2]
+
+    def test_range(self, index):
+        assert index.candidate_rows(RangeMetaFilter("year", gt=2001)).tolist() == [1]
+        assert index.candidate_rows(RangeMetaFilter("year", gte=2001, lte=2005)).tolist() == [0, 1]
+        assert index.candidate_rows(RangeMetaFilter("year", gte="a")).tolist() == [2]
+
+    def test_and_or(self, index):
+        red = EqualsMetaFilter("color", "red")
+        recent = RangeMetaFilter("year", gte=2005)
+
+        assert index.candidate_rows(red & RangeMetaFilter("year", lt=2005)).tolist() == [0]
+        assert index.candidate_rows(red | recent).tolist() == [0, 1, 2]
+
+    def test_unindexed_keys(self, index):
+        size = EqualsMetaFilter("size", 1)
+        red = EqualsMetaFilter("color", "red")
+
+        assert index.candidate_rows(size) is None
+        assert index.candidate_rows(red | size) is None
+        assert index.candidate_rows(red & size).tolist() == [0, 2]
+        assert not index.covers(red & size)
+        assert index.covers(red & RangeMetaFilter("year", gt=1))
+        assert not index.covers(RangeMetaFilter("year", gt=1, lt="z"))
+
+    def test_overwrite_and_remove(self, index):
+        index.add([0], [{"color": "green", "year": 2001}])
+        index.remove([1, 7])
+
+        assert index.candidate_rows(EqualsMetaFilter("color", "red")).tolist() == [2]
+        assert index.candidate_rows(EqualsMetaFilter("color", "green")).tolist() == [0]
+        assert index.candidate_rows(RangeMetaFilter("year", gt=2000)).tolist() == [0]
+
+        index.clear()
+
+        assert index.candidate_rows(EqualsMetaFilter("color", "green")).tolist() == []
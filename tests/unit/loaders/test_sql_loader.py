@@ -3,6 +3,7 @@ from sqlalchemy.pool import StaticPool
 from griptape import utils
 from griptape.drivers import SqlDriver
 from griptape.loaders import SqlLoader
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 MAX_TOKENS = 50
 
@@ -44,6 +45,15 @@ class TestSqlLoader:
         assert result[1].value == {"id": 2, "name": "Bob", "age": 30, "city": "Los Angeles"}
         assert result[2].value == {"id": 3, "name": "Charlie", "age": 22, "city": "Chicago"}
 
+    def test_load_with_embeddings(self, loader, mocker):
+        embed_strings = mocker.spy(MockEmbeddingDriver, "embed_strings")
+        loader.embedding_driver = MockEmbeddingDriver()
+
+        result = loader.load("SELECT * FROM test_table;")
+
+        assert [artifact.embedding for artifact in result] == [[0, 1]] * 3
+        assert embed_strings.call_count == 1
+
     def test_load_collection(self, loader):
         artifacts = loader.load_collection([
             "SELECT * FROM test_table LIMIT 1;",
@@ -45,3 +45,22 @@ class TestBlobToolMemory:
             memory.driver.save("test", a)
 
         assert len(memory.load_artifacts("test")) == 2
+
+    def test_delete_namespace(self, memory):
+        artifact = BlobArtifact(b"foo", name="foo")
+
+        memory.process_output(MockTool().test, ActionSubtask(), artifact)
+        memory.delete_namespace(artifact.id)
+
+        assert memory.namespace_metadata == {}
+        assert memory.driver.load(artifact.id) == []
+
+    def test_max_namespaces(self, memory):
+        memory.max_namespaces = 1
+        artifacts = [BlobArtifact(b"foo", name="foo"), BlobArtifact(b"bar", name="bar")]
+
+        for artifact in artifacts:
+            memory.process_output(MockTool().test, ActionSubtask(), artifact)
+
+        assert list(memory.namespace_metadata) == [artifacts[1].id]
+        assert list(memory.driver.blobs) == [artifacts[1].id]
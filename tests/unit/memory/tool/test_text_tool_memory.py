@@ -1,3 +1,4 @@
+import time
 import pytest
 from griptape.artifacts import TextArtifact, CsvRowArtifact
 from griptape.drivers import LocalVectorStoreDriver
@@ -56,6 +57,15 @@ class TestTextToolMemory:
             'Output of "MockTool.test" was stored in memory:'
         )
 
+    def test_process_output_failure(self, memory, mocker):
+        mocker.patch.object(MockEmbeddingDriver, "try_embed_string", side_effect=Exception("unavailable"))
+        memory.query_engine.vector_store_driver.embedding_driver.max_attempts = 1
+
+        with pytest.raises(Exception, match="unavailable"):
+            memory.process_output(MockTool().test, ActionSubtask(), [TextArtifact("foo")])
+
+        assert memory.namespace_metadata == {}
+
     def test_upsert_namespace_artifact(self, memory):
         memory.query_engine.upsert_text_artifact(TextArtifact("foo"), namespace="test")
 
@@ -86,3 +96,51 @@ class TestTextToolMemory:
         assert memory.search(
             {"values": {"query": "foobar", "artifact_namespace": "foo"}}
         ).value == "foobar"
+
+    def test_max_namespaces(self, memory):
+        memory.max_namespaces = 2
+        artifacts = [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")]
+
+        memory.process_output(MockTool().test, ActionSubtask(), artifacts[0])
+        memory.process_output(MockTool().test, ActionSubtask(), artifacts[1])
+        memory.load_artifacts(artifacts[0].id)
+        memory.process_output(MockTool().test, ActionSubtask(), artifacts[2])
+
+        assert list(memory.namespace_metadata) == [artifacts[0].id, artifacts[2].id]
+        assert memory.load_artifacts(artifacts[1].id) == []
+        assert memory.query_engine.vector_store_driver.count_entries() == 2
+
+    def test_sweep(self, memory):
+        memory.namespace_ttl = 0.05
+        expired = TextArtifact("foo")
+        fresh = TextArtifact("bar")
+
+        memory.process_output(MockTool().test, ActionSubtask(), expired)
+        time.sleep(0.1)
+        memory.process_output(MockTool().test, ActionSubtask(), fresh)
+
+        assert memory.sweep() == [expired.id]
+        assert list(memory.namespace_metadata) == [fresh.id]
+        assert memory.query_engine.vector_store_driver.count_entries(expired.id) == 0
+
+    def test_sweeper(self):
+        memory = TextToolMemory(
+            query_engine=VectorQueryEngine(
+                vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+            ),
+            namespace_ttl=0.01,
+            sweep_interval=0.01
+        )
+
+        memory.process_output(MockTool().test, ActionSubtask(), TextArtifact("foo"))
+
+        for _ in range(100):
+            if len(memory.namespace_metadata) == 0:
+                break
+
+            time.sleep(0.01)
+
+        memory.stop_sweeper()
+
+        assert memory.namespace_metadata == {}
+        assert memory.query_engine.vector_store_driver.count_entries() == 0
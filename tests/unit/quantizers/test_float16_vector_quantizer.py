@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from griptape.quantizers import Float16VectorQuantizer
+
+
+class TestFloat16VectorQuantizer:
+    @pytest.fixture
+    def vectors(self):
+        vectors = np.random.default_rng(0).normal(size=(50, 8)).astype(np.float32)
+
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def test_encode(self, vectors):
+        quantizer = Float16VectorQuantizer()
+        codes = quantizer.encode(vectors)
+
+        assert codes.dtype == np.uint8
+        assert codes.shape == (50, quantizer.code_size(8)) == (50, 16)
+        assert np.allclose(quantizer.decode(codes), vectors, atol=1e-3)
+
+    def test_score(self, vectors):
+        quantizer = Float16VectorQuantizer()
+
+        assert np.allclose(quantizer.score(vectors[:2], quantizer.encode(vectors)), vectors[:2] @ vectors.T, atol=1e-3)
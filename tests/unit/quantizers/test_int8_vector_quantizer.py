@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from griptape.quantizers import Int8VectorQuantizer
+
+
+class TestInt8VectorQuantizer:
+    @pytest.fixture
+    def vectors(self):
+        vectors = np.random.default_rng(0).normal(size=(50, 8)).astype(np.float32)
+
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def test_encode(self, vectors):
+        quantizer = Int8VectorQuantizer()
+        codes = quantizer.encode(vectors)
+
+        assert codes.dtype == np.uint8
+        assert codes.shape == (50, quantizer.code_size(8)) == (50, 12)
+        assert np.allclose(quantizer.decode(codes), vectors, atol=1e-2)
+
+    def test_encode_zero_vector(self):
+        quantizer = Int8VectorQuantizer()
+
+        assert np.array_equal(quantizer.decode(quantizer.encode(np.zeros((1, 4)))), np.zeros((1, 4)))
+
+    def test_score(self, vectors):
+        quantizer = Int8VectorQuantizer()
+
+        assert np.allclose(quantizer.score(vectors[:2], quantizer.encode(vectors)), vectors[:2] @ vectors.T, atol=2e-2)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from griptape.quantizers import ProductVectorQuantizer
+
+
+class TestProductVectorQuantizer:
+    @pytest.fixture
+    def vectors(self):
+        vectors = np.random.default_rng(0).normal(size=(500, 8)).astype(np.float32)
+
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    @pytest.fixture
+    def quantizer(self):
+        return ProductVectorQuantizer(sub_vector_count=4, centroid_count=16, train_size=200, seed=0)
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            ProductVectorQuantizer(centroid_count=257)
+
+        with pytest.raises(ValueError):
+            ProductVectorQuantizer(sub_vector_count=0)
+
+    def test_can_train(self, quantizer):
+        assert not quantizer.is_trained
+        assert not quantizer.can_train(199)
+        assert quantizer.can_train(200)
+
+    def test_train(self, quantizer, vectors):
+        quantizer.train(vectors)
+
+        assert quantizer.is_trained
+        assert quantizer.codebooks.shape == (4, 16, 2)
+
+    def test_train_with_uneven_dimensions(self, quantizer, vectors):
+        with pytest.raises(ValueError):
+            quantizer.train(vectors[:, :7])
+
+    def test_encode(self, quantizer, vectors):
+        quantizer.train(vectors)
+        codes = quantizer.encode(vectors)
+
+        assert codes.dtype == np.uint8
+        assert codes.shape == (500, 4)
+        assert codes.max() < 16
+        assert np.mean(np.linalg.norm(quantizer.decode(codes) - vectors, axis=1)) < 0.5
+
+    def test_score(self, quantizer, vectors):
+        quantizer.train(vectors)
+        codes = quantizer.encode(vectors)
+
+        assert np.allclose(quantizer.score(vectors[:3], codes), vectors[:3] @ quantizer.decode(codes).T, atol=1e-5)
+
+    def test_check_dimensions(self, quantizer, vectors):
+        quantizer.check_dimensions(8)
+
+        with pytest.raises(ValueError):
+            quantizer.check_dimensions(6)
+
+        quantizer.train(vectors)
+
+        with pytest.raises(ValueError):
+            quantizer.check_dimensions(12)
+
+    def test_state(self, quantizer, vectors):
+        assert quantizer.state() == {}
+
+        quantizer.train(vectors)
+        other = ProductVectorQuantizer(sub_vector_count=4, centroid_count=16)
+        other.load_state(quantizer.state())
+
+        assert np.array_equal(other.encode(vectors), quantizer.encode(vectors))
+
+        with pytest.raises(ValueError):
+            ProductVectorQuantizer(sub_vector_count=2, centroid_count=16).load_state(quantizer.state())
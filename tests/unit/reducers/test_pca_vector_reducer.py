@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from griptape.reducers import PcaVectorReducer
+
+
+class TestPcaVectorReducer:
+    @pytest.fixture
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        # 4 informative directions embedded in 32 dimensions, plus a little noise.
+        vectors = rng.normal(size=(400, 4)) @ rng.normal(size=(4, 32)) + rng.normal(scale=0.01, size=(400, 32))
+
+        return vectors.astype(np.float32)
+
+    @pytest.fixture
+    def reducer(self):
+        return PcaVectorReducer(target_dimensions=4, train_size=200, seed=0)
+
+    def test_can_train(self, reducer):
+        assert not reducer.is_trained
+        assert not reducer.can_train(199)
+        assert reducer.can_train(200)
+
+    def test_train(self, reducer, vectors):
+        reducer.train(vectors)
+
+        assert reducer.is_trained
+        assert reducer.components.shape == (32, 4)
+        assert np.allclose(reducer.components.T @ reducer.components, np.eye(4), atol=1e-4)
+
+    def test_train_with_too_few_vectors(self, reducer, vectors):
+        with pytest.raises(ValueError):
+            reducer.train(vectors[:3])
+
+        with pytest.raises(ValueError):
+            PcaVectorReducer(target_dimensions=64).train(vectors)
+
+    def test_reduce(self, reducer, vectors):
+        reducer.train(vectors)
+
+        assert reducer.reduce(vectors[:5]).shape == (5, 4)
+
+    def test_recall_report(self, reducer, vectors):
+        reducer.train(vectors)
+        report = reducer.recall_report(vectors, count=5, query_count=50, seed=0)
+
+        assert report.recall > 0.9
+        assert report.query_count == 50
+        assert report.compression_ratio == 8
+
+        with pytest.raises(ValueError):
+            reducer.recall_report(vectors[:5], count=5)
+
+    def test_save_load(self, reducer, vectors, tmp_path):
+        reducer.train(vectors)
+        reducer.save(str(tmp_path / "reducer.npz"))
+
+        loaded = PcaVectorReducer(target_dimensions=4)
+        loaded.load(str(tmp_path / "reducer.npz"))
+
+        assert np.allclose(loaded.reduce(vectors), reducer.reduce(vectors))
+
+        with pytest.raises(ValueError):
+            PcaVectorReducer(target_dimensions=3).load(str(tmp_path / "reducer.npz"))
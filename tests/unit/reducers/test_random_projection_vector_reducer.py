@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from griptape.reducers import RandomProjectionVectorReducer
+
+
+class TestRandomProjectionVectorReducer:
+    @pytest.fixture
+    def vectors(self):
+        return np.random.default_rng(0).normal(size=(300, 256)).astype(np.float32)
+
+    @pytest.fixture
+    def reducer(self):
+        return RandomProjectionVectorReducer(target_dimensions=128, seed=0)
+
+    def test_can_train(self, reducer):
+        assert not reducer.is_trained
+        assert reducer.can_train(1)
+
+    def test_train(self, reducer, vectors):
+        reducer.train(vectors[:1])
+
+        assert reducer.projection.shape == (256, 128)
+
+        with pytest.raises(ValueError):
+            reducer.train(vectors[:, :64])
+
+    def test_reduce_preserves_inner_products(self, reducer, vectors):
+        reducer.train(vectors)
+        reduced = reducer.reduce(vectors)
+
+        assert reduced.shape == (300, 128)
+        assert np.mean(np.abs(np.linalg.norm(reduced, axis=1) / np.linalg.norm(vectors, axis=1) - 1)) < 0.1
+
+    def test_save_load(self, reducer, vectors, tmp_path):
+        reducer.train(vectors)
+        reducer.save(str(tmp_path / "reducer.npz"))
+
+        loaded = RandomProjectionVectorReducer(target_dimensions=128)
+        loaded.load(str(tmp_path / "reducer.npz"))
+
+        assert np.array_equal(loaded.projection, reducer.projection)
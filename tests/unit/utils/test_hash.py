@@ -5,3 +5,7 @@ class TestHash:
     def test_str_to_hash(self):
         assert utils.str_to_hash("foo") == "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae"
         assert utils.str_to_hash("foo", "md5") == "acbd18db4cc2f85cedef654fccc4a4d8"
+
+    def test_bytes_to_hash(self):
+        assert utils.bytes_to_hash(b"foo") == "04136e24f85d470465c3db66e58ed56c"
+        assert len(utils.bytes_to_hash(b"foo", digest_size=32)) == 64
@@ -0,0 +1,68 @@
+import os
+import numpy as np
+from griptape.utils import LocalVectorStorage
+
+
+class TestLocalVectorStorage:
+    def test_open_empty(self, tmp_path):
+        storage = LocalVectorStorage(str(tmp_path))
+
+        assert storage.open() == (None, [])
+        assert storage.generation == 0
+        assert not storage.changed()
+
+    def test_write_rows(self, tmp_path):
+        storage = LocalVectorStorage(str(tmp_path))
+
+        storage.open()
+        storage.map_vectors(4, 2)[:2] = [[1, 0], [0, 1]]
+        storage.write_rows(2, [(0, "test", "foo", {"a": 1}, 1.0), (1, None, "bar", None, 2.0)], [])
+        storage.write_rows(2, [], [0])
+        storage.close()
+
+        assert storage.open() == (2, [(0, "test", "foo", 1.0, 1), (1, None, "bar", 2.0, 0)])
+        assert storage.load_metas([1, 0, 5]) == [None, {"a": 1}, None]
+        assert list(storage.live_metas()) == [(1, None)]
+
+    def test_fetch_changes(self, tmp_path):
+        storage = LocalVectorStorage(str(tmp_path))
+
+        storage.open()
+        storage.map_vectors(4, 2)
+        storage.write_rows(2, [(0, None, "foo", None, 1.0)], [])
+
+        replica = LocalVectorStorage(str(tmp_path), read_only=True)
+
+        replica.open()
+        storage.write_rows(2, [(1, None, "bar", {"a": 1}, 1.0)], [0])
+
+        assert replica.changed()
+        assert replica.fetch_changes(1) == (2, [(1, None, "bar", {"a": 1}, 1.0, 0)], [(0, 1)])
+        assert not replica.changed()
+        assert replica.fetch_changes(2) == (2, [], [])
+
+    def test_generations(self, tmp_path):
+        storage = LocalVectorStorage(str(tmp_path))
+
+        storage.open()
+        storage.map_vectors(4, 2)[:3] = [[1, 0], [0, 1], [1, 1]]
+        storage.write_rows(2, [(row, None, str(row), None, 1.0) for row in range(3)], [1])
+        storage.save_state({"row_count": np.asarray(3)})
+
+        replica = LocalVectorStorage(str(tmp_path), read_only=True)
+
+        replica.open()
+
+        generation = storage.write_generation(storage.map_vectors(4, 2), np.asarray([0, 2]), 4)
+        storage.close()
+
+        assert storage.open(generation) == (2, [(0, None, "0", 1.0, 0), (1, None, "2", 1.0, 0)])
+        assert storage.map_vectors(4, 2)[:2].tolist() == [[1, 0], [1, 1]]
+        assert storage.load_state() is None
+        assert not replica.changed()
+
+        storage.publish_generation(0)
+
+        assert replica.changed()
+        assert storage.read_generation() == 1
+        assert not os.path.exists(os.path.join(tmp_path, "entries-0.sqlite"))
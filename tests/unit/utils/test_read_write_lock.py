@@ -0,0 +1,72 @@
+import threading
+from griptape.utils import ReadWriteLock
+
+
+class TestReadWriteLock:
+    def test_readers_share(self):
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def read():
+            with lock.read():
+                barrier.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(2)]
+
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        assert not barrier.broken
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        writing = threading.Event()
+
+        def read():
+            writing.wait()
+
+            with lock.read():
+                events.append("read")
+
+        reader = threading.Thread(target=read)
+        reader.start()
+
+        with lock.write():
+            writing.set()
+            reader.join(0.1)
+            events.append("write")
+
+        reader.join()
+
+        assert events == ["write", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = ReadWriteLock()
+        events = []
+
+        def write():
+            with lock.write():
+                events.append("write")
+
+        def read():
+            with lock.read():
+                events.append("read")
+
+        with lock.read():
+            writer = threading.Thread(target=write)
+            writer.start()
+
+            while lock._waiting_writers == 0:
+                pass
+
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(0.1)
+
+            assert events == []
+
+        writer.join()
+        reader.join()
+
+        assert events == ["write", "read"]
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from griptape.utils import StreamingTopK
+
+
+class TestStreamingTopK:
+    @pytest.mark.parametrize("block_size", [1, 3, 7, 1000])
+    def test_scan_matches_brute_force(self, block_size):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 4)).tolist()
+        queries = rng.normal(size=(3, 4)).tolist()
+
+        results = StreamingTopK(count=5, block_size=block_size).scan(queries, enumerate(vectors), lambda item: item[1])
+
+        for query, query_results in zip(queries, results):
+            scores = [np.dot(query, v) / np.linalg.norm(query) / np.linalg.norm(v) for v in vectors]
+
+            assert [i for _, (i, _) in query_results] == list(np.argsort(scores)[::-1][:5])
+            assert [score for score, _ in query_results] == pytest.approx(sorted(scores, reverse=True)[:5], abs=1e-5)
+
+    def test_scan_scores_one_block_at_a_time(self, mocker):
+        push_block = mocker.spy(StreamingTopK, "_push_block")
+        results = StreamingTopK(count=2, block_size=4).scan([[1, 0]], (i for i in range(10)), lambda i: [1, i])
+
+        assert [len(call.args[4]) for call in push_block.call_args_list] == [4, 4, 2]
+        assert [i for _, i in results[0]] == [0, 1]
+
+    def test_scan_ties_keep_stream_order(self):
+        results = StreamingTopK(count=3, block_size=2).scan([[1, 0]], range(6), lambda i: [1, 0])
+
+        assert [i for _, i in results[0]] == [0, 1, 2]
+
+    def test_scan_edge_cases(self):
+        assert StreamingTopK(count=3).scan([[1, 0]], [], lambda i: i) == [[]]
+        assert StreamingTopK(count=0).scan([[1, 0]], [[1, 0]], lambda i: i) == [[]]
+        assert StreamingTopK(count=1).scan([[0, 0]], [[1, 0]], lambda i: i) == [[(0.0, [1, 0])]]
+        assert StreamingTopK(count=1).scan([[1, 0]], [[0, 0]], lambda i: i) == [[(0.0, [0, 0])]]
+
+    def test_scan_dimension_mismatch(self):
+        with pytest.raises(ValueError):
+            StreamingTopK(count=1).scan([[1, 0]], [[1, 0, 0]], lambda i: i)
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            StreamingTopK(count=-1)
+
+        with pytest.raises(ValueError):
+            StreamingTopK(count=1, block_size=0)